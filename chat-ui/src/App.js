@@ -26,6 +26,36 @@ const ChatInterface = () => {
     scrollToBottom();
   }, [messages]);
 
+  // Streaming endpoints reply with NDJSON: each line is a complete
+  // {"response": ...} object. Render every line as its own bot message
+  // as it arrives so progress feedback shows before the final result.
+  const readNdjsonResponse = async (response, text) => {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    const handleLine = (line) => {
+      if (!line.trim()) return;
+      const data = JSON.parse(line);
+      if (data.response.includes('Transaction Preview:')) {
+        setAwaitingConfirmation(true);
+        setPendingTransaction(text);
+      }
+      setMessages(prev => [...prev, { text: data.response, type: 'bot' }]);
+    };
+
+    while (true) {
+      const { done, value } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+      const lines = buffer.split('\n');
+      buffer = lines.pop();
+      lines.forEach(handleLine);
+    }
+    if (buffer.trim()) handleLine(buffer);
+    return null;
+  };
+
   const handleSendMessage = async (text) => {
     try {
       const response = await fetch(BACKEND_ROUTE, {
@@ -40,6 +70,12 @@ const ChatInterface = () => {
         throw new Error('Network response was not ok');
       }
 
+      const contentType = response.headers.get('content-type') || '';
+      if (contentType.includes('application/x-ndjson')) {
+        // Messages are appended as the stream arrives; nothing to return
+        return await readNdjsonResponse(response, text);
+      }
+
       const data = await response.json();
       
       // Check if response contains a transaction preview
@@ -69,7 +105,9 @@ const ChatInterface = () => {
       if (messageText.toUpperCase() === 'CONFIRM') {
         setAwaitingConfirmation(false);
         const response = await handleSendMessage(pendingTransaction);
-        setMessages(prev => [...prev, { text: response, type: 'bot' }]);
+        if (response !== null) {
+          setMessages(prev => [...prev, { text: response, type: 'bot' }]);
+        }
       } else {
         setAwaitingConfirmation(false);
         setPendingTransaction(null);
@@ -80,7 +118,9 @@ const ChatInterface = () => {
       }
     } else {
       const response = await handleSendMessage(messageText);
-      setMessages(prev => [...prev, { text: response, type: 'bot' }]);
+      if (response !== null) {
+        setMessages(prev => [...prev, { text: response, type: 'bot' }]);
+      }
     }
 
     setIsLoading(false);
@@ -5,6 +5,7 @@ from .base import (
     GenerationConfig,
     ModelResponse,
 )
+from .cache import SemanticCache
 from .gemini import GeminiProvider
 from .openrouter import AsyncOpenRouterProvider, OpenRouterProvider
 
@@ -17,4 +18,5 @@ __all__ = [
     "GenerationConfig",
     "ModelResponse",
     "OpenRouterProvider",
+    "SemanticCache",
 ]
@@ -0,0 +1,163 @@
+"""
+AI Response Cache Module
+
+This module implements caching for AI model responses, combining an exact
+SHA-256 keyed cache with an optional embedding-based semantic cache.
+Identical requests are served from the exact cache; paraphrased requests
+can be served from the semantic cache when an embedding function is
+available and cosine similarity exceeds the configured threshold.
+"""
+
+import hashlib
+import math
+import time
+from collections.abc import Callable, Sequence
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+def _cosine_similarity(a: Sequence[float], b: Sequence[float]) -> float:
+    """Compute cosine similarity between two vectors."""
+    dot = sum(x * y for x, y in zip(a, b, strict=False))
+    norm_a = math.sqrt(sum(x * x for x in a))
+    norm_b = math.sqrt(sum(y * y for y in b))
+    if norm_a == 0.0 or norm_b == 0.0:
+        return 0.0
+    return dot / (norm_a * norm_b)
+
+
+class SemanticCache:
+    """
+    Cache for AI responses with exact and semantic lookup tiers.
+
+    The exact tier is a SHA-256 keyed dict lookup. The semantic tier embeds
+    the request text (when an embedding function is configured) and reuses a
+    cached response whose embedding's cosine similarity meets the threshold.
+
+    Attributes:
+        threshold (float): Minimum cosine similarity for a semantic hit
+        ttl (float): Entry time-to-live in seconds
+        max_entries (int): Maximum entries kept per tier
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[str], Sequence[float] | None] | None = None,
+        threshold: float = 0.92,
+        ttl: float = 3600.0,
+        max_entries: int = 512,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            embed_fn: Optional function mapping text to an embedding vector
+                (it may return None to skip the semantic tier for a call).
+                When None, only the exact tier is active.
+            threshold: Minimum cosine similarity for a semantic hit
+            ttl: Entry time-to-live in seconds
+            max_entries: Maximum entries kept per tier
+        """
+        self._embed_fn = embed_fn
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._exact: dict[str, tuple[float, str]] = {}
+        self._semantic: list[tuple[Sequence[float], float, str]] = []
+        self.logger = logger.bind(service="semantic_cache")
+
+    @staticmethod
+    def exact_key(payload: str) -> str:
+        """Compute the exact-tier key for a request payload.
+
+        Args:
+            payload: Canonical string describing the request
+
+        Returns:
+            Hex SHA-256 digest of the payload
+        """
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _embed(self, text: str) -> Sequence[float] | None:
+        """Embed text for the semantic tier, tolerating embedder failures."""
+        if self._embed_fn is None:
+            return None
+        try:
+            return self._embed_fn(text)
+        except Exception as e:
+            # A failing embedder would otherwise retry and warn on every
+            # get and set; warn once and run exact-tier only from here on
+            self.logger.warning("semantic_tier_disabled", error=str(e))
+            self._embed_fn = None
+            return None
+
+    def get(self, key: str, text: str | None = None) -> str | None:
+        """Look up a cached response.
+
+        Checks the exact tier first, then the semantic tier when `text`
+        is provided and an embedding function is configured.
+
+        Args:
+            key: Exact-tier key from `exact_key`
+            text: Optional request text for semantic lookup
+
+        Returns:
+            Cached response text, or None on miss
+        """
+        now = time.monotonic()
+
+        entry = self._exact.get(key)
+        if entry is not None:
+            expires, response = entry
+            if expires > now:
+                return response
+            del self._exact[key]
+
+        if text is None:
+            return None
+        vector = self._embed(text)
+        if vector is None:
+            return None
+
+        best_response: str | None = None
+        best_score = self.threshold
+        self._semantic = [e for e in self._semantic if e[1] > now]
+        for cached_vector, _, response in self._semantic:
+            score = _cosine_similarity(vector, cached_vector)
+            if score >= best_score:
+                best_score = score
+                best_response = response
+        return best_response
+
+    def set(self, key: str, text: str | None, response: str) -> None:
+        """Store a response in both cache tiers.
+
+        Args:
+            key: Exact-tier key from `exact_key`
+            text: Optional request text for the semantic tier
+            response: Response text to cache
+        """
+        expires = time.monotonic() + self.ttl
+        self._exact[key] = (expires, response)
+        if len(self._exact) > self.max_entries:
+            # Drop the oldest-expiring entries to get back under the cap
+            for stale_key, _ in sorted(
+                self._exact.items(), key=lambda item: item[1][0]
+            )[: len(self._exact) - self.max_entries]:
+                del self._exact[stale_key]
+
+        if text is not None:
+            vector = self._embed(text)
+            if vector is not None:
+                self._semantic.append((vector, expires, response))
+                if len(self._semantic) > self.max_entries:
+                    self._semantic = self._semantic[-self.max_entries :]
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._exact.clear()
+        self._semantic.clear()
+
+
+__all__ = ["SemanticCache"]
@@ -6,6 +6,11 @@ with Google's Generative AI service. It handles chat sessions, content generatio
 and message management while maintaining a consistent AI personality.
 """
 
+import asyncio
+import contextlib
+import datetime
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, override
 
 import google.generativeai as genai
@@ -13,10 +18,39 @@ import structlog
 from google.generativeai.types import ContentDict
 
 from flare_ai_defai.ai.base import BaseAIProvider, ModelResponse
+from flare_ai_defai.ai.cache import SemanticCache
 from flare_ai_defai.ai.rag import RAGProcessor
 
 logger = structlog.get_logger(__name__)
 
+# Lifetime of the server-side cached prompt prefix (system instruction +
+# seeded history); refreshed implicitly when a provider is recreated
+PREFIX_CACHE_TTL = datetime.timedelta(hours=1)
+
+
+# Tracks the key genai was last configured with so repeated provider
+# construction reuses the SDK's underlying channel instead of tearing it
+# down and re-opening connections
+_configured_api_key: str | None = None
+
+
+def _configure_genai(api_key: str) -> None:
+    """Configure the Gemini SDK once per process (per API key).
+
+    `genai.configure` resets the SDK's client and its pooled transport;
+    calling it on every provider instantiation forces new connection setup
+    (TLS handshake, slow start) for each one. Skipping redundant calls
+    keeps a single shared channel alive across provider instances.
+
+    Args:
+        api_key (str): Google API key for authentication
+    """
+    global _configured_api_key  # noqa: PLW0603
+    if api_key == _configured_api_key:
+        return
+    genai.configure(api_key=api_key)
+    _configured_api_key = api_key
+
 
 SYSTEM_INSTRUCTION = """
 You are Artemis, an AI assistant specialized in helping users navigate
@@ -76,17 +110,90 @@ class GeminiProvider(BaseAIProvider):
                 - system_instruction: Custom system prompt for the AI personality
                 - knowledge_base_path: Optional path to knowledge base for RAG
         """
-        genai.configure(api_key=api_key)
+        _configure_genai(api_key)
         self.chat: genai.ChatSession | None = None
-        self.model = genai.GenerativeModel(
-            model_name=model,
-            system_instruction=kwargs.get("system_instruction", SYSTEM_INSTRUCTION),
-        )
+        self.model_name = model
+        self.system_instruction = kwargs.get("system_instruction", SYSTEM_INSTRUCTION)
         self.chat_history: list[ContentDict] = [
             ContentDict(parts=["Hi, I'm Artemis"], role="model")
         ]
         self.logger = logger.bind(service="gemini")
+        self.cached_content: Any | None = None
+        self.model = self._build_model()
+        # Sliding window keeping prefill linear in the window size rather
+        # than in total conversation length; compaction kicks in at 2x
+        self._history_window = 20
         self.rag_processor = RAGProcessor(kwargs.get("knowledge_base_path"))
+        self.cache = SemanticCache(embed_fn=self.embed_query)
+        # Speculative retrieval task pre-warming the vector store for the
+        # likely next turn (keyed off the previous response's tail)
+        self._prefetch_task: asyncio.Task | None = None
+
+    def _build_model(self) -> genai.GenerativeModel:
+        """Build the Gemini model, preferring a server-side cached prefix.
+
+        The system instruction (and any seeded chat history) is stable across
+        turns, so caching it server-side via `genai.caching.CachedContent`
+        avoids re-sending and re-prefilling those tokens on every request.
+        Prefix caching has model and minimum-token requirements, so any
+        failure falls back to a plain model with an inline instruction.
+
+        Returns:
+            genai.GenerativeModel: Model backed by cached content when
+                available, otherwise a plain configured model
+        """
+        try:
+            self.cached_content = genai.caching.CachedContent.create(
+                model=self.model_name,
+                system_instruction=self.system_instruction,
+                contents=self.chat_history,
+                ttl=PREFIX_CACHE_TTL,
+            )
+            return genai.GenerativeModel.from_cached_content(self.cached_content)
+        except Exception as e:
+            self.logger.warning("prefix_cache_unavailable", error=str(e))
+            self.cached_content = None
+            return genai.GenerativeModel(
+                model_name=self.model_name,
+                system_instruction=self.system_instruction,
+            )
+
+    def embed_query(self, text: str) -> Any | None:
+        """Embed text via the RAG vector store once it has been built.
+
+        The RAG system is constructed lazily on first retrieval; a cache
+        lookup must never force that construction, so this returns None
+        (a semantic-cache miss) until the system exists.
+
+        Args:
+            text (str): Text to embed
+
+        Returns:
+            Embedding vector for the semantic cache, or None while the
+            RAG system is not built
+
+        Raises:
+            AttributeError: If the vector store has no embed function
+        """
+        # cached_property materializes into the instance dict; absent
+        # means the RAG system has not been constructed yet
+        rag_system = self.rag_processor.__dict__.get("rag_system")
+        if rag_system is None:
+            return None
+        embed = getattr(rag_system.vector_store, "embed", None)
+        if embed is None:
+            msg = "vector store does not expose an embed function"
+            raise AttributeError(msg)
+        return embed(text)
+
+    @staticmethod
+    def _resp_meta(response: Any) -> dict[str, Any]:
+        """Build the standard response metadata dict once, shared by all
+        generation paths."""
+        return {
+            "candidate_count": len(response.candidates),
+            "prompt_feedback": response.prompt_feedback,
+        }
 
     @override
     def reset(self) -> None:
@@ -130,6 +237,22 @@ class GeminiProvider(BaseAIProvider):
         if response_schema:
             generation_config["response_schema"] = response_schema
 
+        # Check exact and semantic cache tiers before hitting Gemini.
+        # Schema-constrained calls only use the exact tier since a
+        # paraphrase hit could return differently-structured output.
+        cache_key = SemanticCache.exact_key(
+            f"generate|{prompt}|{response_mime_type}|{response_schema!r}"
+        )
+        semantic_text = prompt if not (response_mime_type or response_schema) else None
+        cached = self.cache.get(cache_key, text=semantic_text)
+        if cached is not None:
+            self.logger.debug("generate_cache_hit", prompt=prompt)
+            return ModelResponse(
+                text=cached,
+                raw_response=None,
+                metadata={"cache_hit": True},
+            )
+
         # Create a new chat for this generation
         chat = self.model.start_chat(history=[])
         response = chat.send_message(
@@ -141,16 +264,79 @@ class GeminiProvider(BaseAIProvider):
             ),
         )
 
+        self.cache.set(cache_key, semantic_text, response.text)
         self.logger.debug("generate", prompt=prompt, response_text=response.text)
         return ModelResponse(
             text=response.text,
             raw_response=response,
-            metadata={
-                "candidate_count": len(response.candidates),
-                "prompt_feedback": response.prompt_feedback,
-            },
+            metadata=self._resp_meta(response),
         )
 
+    def generate_stream(self, prompt: str) -> Iterator[str]:
+        """
+        Generate content as a stream of text chunks.
+
+        Streaming returns the first tokens as soon as prefill completes
+        instead of blocking on the full completion, cutting time-to-first-
+        token for callers that can render incrementally. The joined result
+        is cached on completion so repeat prompts skip the request.
+
+        Args:
+            prompt (str): Input prompt for content generation
+
+        Yields:
+            str: Text chunks as they arrive from the model
+        """
+        cache_key = SemanticCache.exact_key(f"generate|{prompt}|None|None")
+        cached = self.cache.get(cache_key, text=prompt)
+        if cached is not None:
+            self.logger.debug("generate_stream_cache_hit", prompt=prompt)
+            yield cached
+            return
+
+        chat = self.model.start_chat(history=[])
+        response = chat.send_message(prompt, stream=True)
+        chunks: list[str] = []
+        for chunk in response:
+            chunks.append(chunk.text)
+            yield chunk.text
+        self.cache.set(cache_key, prompt, "".join(chunks))
+
+    def generate_batch(
+        self,
+        prompts: list[str],
+        response_mime_type: str | None = None,
+        response_schema: Any | None = None,
+    ) -> list[ModelResponse]:
+        """
+        Generate content for several independent prompts at once.
+
+        Prompts are issued concurrently so a batch completes in roughly the
+        time of the slowest single request instead of their sum, and cached
+        responses short-circuit without a request at all.
+
+        Args:
+            prompts (list[str]): Input prompts for content generation
+            response_mime_type (str | None): Expected MIME type for responses
+            response_schema (Any | None): Schema defining response structure
+
+        Returns:
+            list[ModelResponse]: One response per prompt, in input order
+        """
+        if not prompts:
+            return []
+        if len(prompts) == 1:
+            return [self.generate(prompts[0], response_mime_type, response_schema)]
+        with ThreadPoolExecutor(max_workers=min(8, len(prompts))) as executor:
+            return list(
+                executor.map(
+                    lambda prompt: self.generate(
+                        prompt, response_mime_type, response_schema
+                    ),
+                    prompts,
+                )
+            )
+
     @override
     def send_message(
         self,
@@ -173,18 +359,77 @@ class GeminiProvider(BaseAIProvider):
                     - prompt_feedback: Feedback on the input message
         """
         if not self.chat:
-            self.chat = self.model.start_chat(history=self.chat_history)
+            # The seed history already lives server-side when the cached
+            # prefix is active; resending it would duplicate those turns
+            history = [] if self.cached_content else self.chat_history
+            self.chat = self.model.start_chat(history=history)
+
+        # Exact-match cache keyed on the conversation state plus the message;
+        # the reply to the same message differs once history has advanced.
+        cache_key = SemanticCache.exact_key(
+            f"send_message|{self.chat.history!r}|{msg}"
+        )
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            # The conversation must still advance on a hit: record both
+            # turns in the session history so the model keeps a record
+            # of its own (cached) reply
+            self.chat.history.append(ContentDict(parts=[msg], role="user"))
+            self.chat.history.append(ContentDict(parts=[cached], role="model"))
+            self._compact_history()
+            self.logger.debug("send_message_cache_hit", msg=msg)
+            return ModelResponse(
+                text=cached,
+                raw_response=None,
+                metadata={"cache_hit": True},
+            )
+
         response = self.chat.send_message(msg)
+        self.cache.set(cache_key, None, response.text)
+        self._compact_history()
         self.logger.debug("send_message", msg=msg, response_text=response.text)
         return ModelResponse(
             text=response.text,
             raw_response=response,
-            metadata={
-                "candidate_count": len(response.candidates),
-                "prompt_feedback": response.prompt_feedback,
-            },
+            metadata=self._resp_meta(response),
+        )
+
+    def _compact_history(self) -> None:
+        """Cap chat history at a sliding window of recent turns.
+
+        Without this, every turn re-sends (and the model re-prefills) the
+        entire conversation, so per-turn cost grows linearly without bound.
+        Once history exceeds twice the window, older turns are collapsed
+        into a single note and the chat restarts from the compacted tail.
+        """
+        if self.chat is None or len(self.chat.history) <= 2 * self._history_window:
+            return
+        recent = list(self.chat.history[-self._history_window :])
+        elided = len(self.chat.history) - len(recent)
+        note = ContentDict(
+            parts=[f"[{elided} earlier conversation turns elided for brevity]"],
+            role="model",
+        )
+        self.chat = self.model.start_chat(history=[note, *recent])
+        self.logger.debug(
+            "compacted_history", elided=elided, window=self._history_window
         )
 
+    def _schedule_prefetch(self, query_tail: str) -> None:
+        """Start a speculative retrieval for the likely next turn.
+
+        Args:
+            query_tail (str): Tail of the previous response to retrieve for
+        """
+        if not query_tail:
+            return
+        if self._prefetch_task is not None and not self._prefetch_task.done():
+            self._prefetch_task.cancel()
+        with contextlib.suppress(RuntimeError):  # No running loop in sync use
+            self._prefetch_task = asyncio.get_running_loop().create_task(
+                self.rag_processor.retrieve_relevant_docs(query=query_tail)
+            )
+
     @override
     async def send_message_with_image(
         self, msg: str, image: bytes, mime_type: str
@@ -200,11 +445,17 @@ class GeminiProvider(BaseAIProvider):
         Returns:
             ModelResponse containing the generated response
         """
+        # Kick off retrieval immediately so it overlaps with chat setup
+        retrieval_task = asyncio.create_task(
+            self.rag_processor.retrieve_relevant_docs(query=msg)
+        )
+
         if not self.chat:
-            self.chat = self.model.start_chat(history=self.chat_history)
+            history = [] if self.cached_content else self.chat_history
+            self.chat = self.model.start_chat(history=history)
 
         # Retrieve relevant documents using RAG
-        retrieved_docs = await self.rag_processor.retrieve_relevant_docs(query=msg)
+        retrieved_docs = await retrieval_task
 
         # Augment the prompt with retrieved context
         augmented_prompt = self.rag_processor.augment_prompt(
@@ -224,12 +475,15 @@ class GeminiProvider(BaseAIProvider):
             response_text=response.text,
         )
 
+        # Speculatively pre-warm retrieval for the likely next turn using
+        # the tail of this response; the result itself is discarded.
+        self._schedule_prefetch(response.text[-200:])
+
         return ModelResponse(
             text=response.text,
             raw_response=response,
             metadata={
-                "candidate_count": len(response.candidates),
-                "prompt_feedback": response.prompt_feedback,
+                **self._resp_meta(response),
                 "retrieved_docs": [
                     {"content": doc.content, "metadata": doc.metadata}
                     for doc in retrieved_docs.documents
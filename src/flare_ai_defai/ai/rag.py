@@ -5,21 +5,65 @@ This module implements document retrieval and augmentation capabilities
 for enhancing AI responses with relevant context from a knowledge base.
 """
 
+import asyncio
 import csv
+import functools
 import glob
+import hashlib
+import io
+import json
 import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 import structlog
 
-from flare_ai_rag import RAGSystem
+if TYPE_CHECKING:
+    from flare_ai_rag import RAGSystem
 
-logger = structlog.get_logger(__name__)
+try:  # Optional: enables vector-index snapshots alongside the parquet cache
+    import faiss
+except ImportError:  # pragma: no cover - faiss is an optional accelerator
+    faiss = None
+
+try:  # Optional: multithreaded C++ CSV parsing instead of pandas
+    import pyarrow.csv as pacsv
+except ImportError:  # pragma: no cover - pyarrow is an optional accelerator
+    pacsv = None
 
+logger = structlog.get_logger(__name__)
 
-@dataclass
+CACHE_DIR_NAME = ".cache"
+
+# File name of the cumulative vector index snapshot inside the cache dir
+SNAPSHOT_NAME = "index.faiss"
+
+# Embedding batch size for vector-store adds; sized for GPU occupancy while
+# still bounding peak memory during ingest
+_ADD_BATCH_SIZE = 256
+
+# Static pieces of the augmented prompt, hoisted so they are built once at
+# import instead of reassembled on every query
+_PROMPT_HEADER = (
+    "You are a helpful AI assistant with access to Flare Network documentation. "
+    "When answering questions, you should:"
+    "\n1. Use the provided context to inform your answers"
+    "\n2. ALWAYS cite your sources using [doc_name] format when referencing information"
+    "\n3. If you're not sure about something, say so rather than making assumptions"
+    "\n4. Keep responses clear and well-structured"
+    "\n\nHere is the relevant context for your response:\n"
+)
+_PROMPT_FOOTER = (
+    "\nBased on the above context, please provide a detailed answer to the following question.\n"
+    "Remember to cite specific documents using their [doc_name] format when referencing information.\n"
+)
+
+
+@dataclass(slots=True, frozen=True)
 class Document:
     """Represents a document in the knowledge base"""
 
@@ -28,7 +72,7 @@ class Document:
     source: str  # Source file name
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RetrievalResult:
     """Result from document retrieval"""
 
@@ -39,129 +83,487 @@ class RetrievalResult:
 class RAGProcessor:
     """Handles document retrieval and prompt augmentation"""
 
-    def __init__(self, knowledge_base_path: str | None = None):
+    def __init__(
+        self,
+        knowledge_base_path: str | None = None,
+        context_fn: Callable[[str], str] | None = None,
+    ):
         """Initialize the RAG processor
 
         Args:
             knowledge_base_path: Optional path to knowledge base documents
+            context_fn: Optional function mapping a chunk to a short
+                contextual summary, prepended to the chunk before embedding.
+                Context-enriched chunks retrieve better, so fewer documents
+                (and fewer prompt tokens) are needed per query.
         """
         self.logger = logger.bind(processor="rag")
+        # Serializes vector-store writes when files are ingested in parallel
+        self._vector_store_lock = threading.Lock()
+        self._context_fn = context_fn
+        self._embedder_accelerated = False
+
+        # RAG system construction (embedding model load, index open) is
+        # deferred until first retrieval via the cached property below
+        self._kb_path = knowledge_base_path if knowledge_base_path else "src/data"
+        self._kb_path_explicit = knowledge_base_path is not None
+
+    @functools.cached_property
+    def rag_system(self) -> "RAGSystem":
+        """The underlying RAG system, constructed on first access.
+
+        Loading embedding models and opening the vector index costs seconds
+        and hundreds of MB; generate-only workloads never pay it. The first
+        access builds the system (and ingests the knowledge base when a
+        path was given); later accesses are a plain attribute read.
+        """
+        from flare_ai_rag import RAGSystem
 
-        # Initialize RAG system
-        self.rag_system = RAGSystem(
-            knowledge_base_path if knowledge_base_path else "src/data"
-        )
+        system = RAGSystem(self._kb_path)
+        # Cache before ingest so _load_documents sees self.rag_system
+        # without re-entering this property
+        self.__dict__["rag_system"] = system
+        if self._kb_path_explicit:
+            self._load_documents(self._kb_path)
+        return system
+
+    @staticmethod
+    def _fingerprint(file_path: str) -> str:
+        """Compute a fingerprint for a CSV file from its path, mtime and size.
 
-        # Load documents if path provided
-        if knowledge_base_path:
-            self._load_documents(knowledge_base_path)
+        Args:
+            file_path: Path to the CSV file
+
+        Returns:
+            Hex digest identifying this exact version of the file
+        """
+        st = os.stat(file_path)
+        key = f"{file_path}:{st.st_mtime_ns}:{st.st_size}"
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def _load_cached_documents(
+        self, cache_base: str
+    ) -> tuple[list[str], list[dict[str, Any]]] | None:
+        """Load a previously cached parse result for a CSV file.
+
+        Args:
+            cache_base: Cache file path without extension
+
+        Returns:
+            Cached (texts, metadatas) or None when no usable cache exists
+        """
+        parquet_path = cache_base + ".parquet"
+        if not os.path.exists(parquet_path):
+            return None
+        try:
+            cached = pd.read_parquet(parquet_path)
+            texts = cached["content"].tolist()
+            metadatas = [json.loads(m) for m in cached["metadata"]]
+        except Exception as e:
+            self.logger.warning("document_cache_read_error", error=str(e))
+            return None
+        return texts, metadatas
+
+    def _restore_vector_snapshot(self, cache_dir: str) -> bool:
+        """Restore the cumulative vector index snapshot if one exists.
+
+        The snapshot holds the vectors of the entire knowledge base, so
+        callers must only restore it when no source file has changed
+        since it was written.
+
+        Args:
+            cache_dir: Directory holding parse/vector caches
+
+        Returns:
+            True if the snapshot was restored and ingest can be skipped
+        """
+        index_path = os.path.join(cache_dir, SNAPSHOT_NAME)
+        if faiss is None or not os.path.exists(index_path):
+            return False
+        try:
+            index = faiss.read_index(index_path)
+            with self._vector_store_lock:
+                self.rag_system.vector_store.index = index
+        except Exception as e:
+            self.logger.warning("vector_snapshot_read_error", error=str(e))
+            return False
+        return True
+
+    def _save_vector_snapshot(self, cache_dir: str) -> bool:
+        """Persist the cumulative vector index snapshot, best-effort.
+
+        Args:
+            cache_dir: Directory holding parse/vector caches
+
+        Returns:
+            True if the snapshot was written
+        """
+        if faiss is None:
+            return False
+        try:
+            with self._vector_store_lock:
+                index = getattr(self.rag_system.vector_store, "index", None)
+                if index is None:
+                    return False
+                faiss.write_index(index, os.path.join(cache_dir, SNAPSHOT_NAME))
+        except Exception as e:
+            self.logger.warning("vector_snapshot_write_error", error=str(e))
+            return False
+        return True
+
+    def _save_document_cache(
+        self,
+        cache_base: str,
+        texts: list[str],
+        metadatas: list[dict[str, Any]],
+    ) -> None:
+        """Persist a parse result to the cache.
+
+        Args:
+            cache_base: Cache file path without extension
+            texts: Document texts parsed from the CSV
+            metadatas: Metadata dicts parallel to texts
+        """
+        try:
+            pd.DataFrame(
+                {
+                    "content": texts,
+                    "metadata": [json.dumps(m, default=str) for m in metadatas],
+                }
+            ).to_parquet(cache_base + ".parquet")
+        except Exception as e:
+            self.logger.warning("document_cache_write_error", error=str(e))
 
     def _load_documents(self, path: str) -> None:
         """Load documents from CSV files in the specified directory
 
+        Parse results are cached under `<path>/.cache` keyed by a
+        fingerprint of each file's mtime and size, so unchanged files skip
+        CSV parsing on warm starts; when no file changed at all, the
+        cumulative vector snapshot is restored instead of re-embedding
+        anything.
+
         Args:
             path: Directory containing CSV files
         """
         csv_files = glob.glob(os.path.join(path, "*.csv"))
+        if not csv_files:
+            return
+        cache_dir = os.path.join(path, CACHE_DIR_NAME)
+        os.makedirs(cache_dir, exist_ok=True)
 
+        signatures: dict[str, list[int]] = {}
         for file_path in csv_files:
-            try:
-                # Read CSV file with meta_data as string and handle multi-line fields
-                df = pd.read_csv(
-                    file_path,
-                    dtype={"meta_data": str},
-                    quoting=csv.QUOTE_MINIMAL,
-                    quotechar='"',
-                    escapechar="\\",
-                    on_bad_lines="warn",
+            st = os.stat(file_path)
+            signatures[file_path] = [st.st_size, st.st_mtime_ns]
+
+        # The manifest records the exact file set and size/mtime the
+        # cumulative snapshot was written for; it can only stand in for
+        # ingest when nothing changed, since the in-memory index is
+        # rebuilt from scratch every process start
+        if signatures == self._load_manifest(
+            cache_dir
+        ) and self._restore_vector_snapshot(cache_dir):
+            self.logger.info(
+                "restored_vector_snapshot", file_count=len(csv_files)
+            )
+            return
+
+        if len(csv_files) == 1:
+            results = [self._process_csv_file(csv_files[0], cache_dir)]
+        else:
+            # Parse and embed files in parallel; pandas/pyarrow parsing
+            # releases the GIL in C code and embedding is I/O-bound. The
+            # vector-store add step is serialized through
+            # self._vector_store_lock.
+            max_workers = min(8, len(csv_files))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(
+                    executor.map(
+                        lambda file_path: self._process_csv_file(
+                            file_path, cache_dir
+                        ),
+                        csv_files,
+                    )
                 )
 
-                # Process each row
-                texts = []
-                metadatas = []
-
-                for _, row in df.iterrows():
-                    try:
-                        if pd.notna(
-                            row.get("content", None)
-                        ):  # Check if content exists and is not NA
-                            texts.append(
-                                str(row["content"])
-                            )  # Ensure content is string
-
-                            metadata = {
-                                "source_file": os.path.basename(file_path),
-                                "last_updated": row.get("last_updated", None),
-                                "file_name": row.get(
-                                    "file_name", None
-                                ),  # Include file_name in metadata
-                            }
-
-                            # Add any additional metadata
-                            if pd.notna(row.get("meta_data", None)):
-                                try:
-                                    # Store raw meta_data string, preserving newlines
-                                    metadata["meta_data"] = str(
-                                        row["meta_data"]
-                                    ).strip()
-                                except Exception as e:
-                                    self.logger.warning(
-                                        "meta_data_parse_error",
-                                        error=str(e),
-                                        file=os.path.basename(file_path),
-                                        row_number=_,
-                                    )
-
-                            metadatas.append(metadata)
-                    except Exception as e:
-                        self.logger.warning(
-                            "row_processing_error",
-                            error=str(e),
-                            file=os.path.basename(file_path),
-                            row_number=_,
-                        )
-                        continue
-
-                # Add documents to vector store
-                if texts:
-                    # Log before adding to verify data
-                    self.logger.info(
-                        "processing_documents",
-                        file=os.path.basename(file_path),
-                        count=len(texts),
-                        first_doc_preview=texts[0][:100] if texts else None,
-                    )
+        # Record the manifest only when the snapshot truly covers every
+        # file; anything less is cleared so a stale manifest can never
+        # validate a snapshot that is missing documents
+        if all(results) and self._save_vector_snapshot(cache_dir):
+            self._save_manifest(cache_dir, signatures)
+        else:
+            self._save_manifest(cache_dir, {})
+
+    def _load_manifest(self, cache_dir: str) -> dict[str, list[int]]:
+        """Load the ingest manifest mapping file path to (size, mtime_ns)."""
+        manifest_path = os.path.join(cache_dir, "manifest.json")
+        if not os.path.exists(manifest_path):
+            return {}
+        try:
+            with open(manifest_path, encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            self.logger.warning("manifest_read_error", error=str(e))
+            return {}
+
+    def _save_manifest(self, cache_dir: str, manifest: dict[str, list[int]]) -> None:
+        """Persist the ingest manifest, best-effort."""
+        manifest_path = os.path.join(cache_dir, "manifest.json")
+        try:
+            with open(manifest_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f)
+        except Exception as e:
+            self.logger.warning("manifest_write_error", error=str(e))
+
+    def _process_csv_file(self, file_path: str, cache_dir: str) -> bool:
+        """Parse, embed, and cache a single CSV file.
 
-                    # Add to vector store in smaller batches to prevent memory issues
-                    batch_size = 1000
-                    for i in range(0, len(texts), batch_size):
-                        batch_texts = texts[i : i + batch_size]
-                        batch_metadatas = metadatas[i : i + batch_size]
-                        self.rag_system.vector_store.add_texts(
-                            batch_texts, batch_metadatas
-                        )
-
-                        self.logger.info(
-                            "loaded_document_batch",
-                            file=os.path.basename(file_path),
-                            batch_start=i,
-                            batch_size=len(batch_texts),
-                        )
-
-                    self.logger.info(
-                        "loaded_documents",
-                        file=os.path.basename(file_path),
-                        total_count=len(texts),
-                    )
+        Args:
+            file_path: Path to the CSV file
+            cache_dir: Directory holding parse/vector caches
+
+        Returns:
+            True when the file's documents were ingested into the vector
+            store, so its signature may be recorded in the manifest
+        """
+        try:
+            cache_base = os.path.join(cache_dir, self._fingerprint(file_path))
+            cached = self._load_cached_documents(cache_base)
+            if cached is not None:
+                texts, metadatas = cached
+                self.logger.info(
+                    "loaded_documents_from_cache",
+                    file=os.path.basename(file_path),
+                    total_count=len(texts),
+                )
+                self._add_documents(file_path, texts, metadatas)
+                return True
+
+            # Read CSV file with meta_data as string and handle multi-line fields
+            df = self._read_csv(file_path)
+
+            # Process rows with vectorized column operations instead of
+            # a per-row iterrows() loop
+            texts, metadatas = self._extract_documents(df, file_path)
+
+            # Prepend contextual summaries before embedding, when configured
+            texts = self._enrich_texts(texts, cache_dir)
+
+            # Add documents to vector store and cache the parse result
+            if texts:
+                self._add_documents(file_path, texts, metadatas)
+                self._save_document_cache(cache_base, texts, metadatas)
+            return True
+
+        except Exception as e:
+            self.logger.error(
+                "document_load_error",
+                error=str(e),
+                error_type=type(e).__name__,
+                file=os.path.basename(file_path),
+            )
+        return False
+
+    def _read_csv(self, file_path: str) -> pd.DataFrame:
+        """Parse a CSV file, preferring pyarrow's multithreaded parser.
+
+        Falls back to pandas when pyarrow is unavailable or fails to
+        parse the file.
 
+        Args:
+            file_path: Path to the CSV file
+
+        Returns:
+            Parsed CSV contents as a DataFrame
+        """
+        if pacsv is not None:
+            try:
+                table = pacsv.read_csv(
+                    file_path,
+                    parse_options=pacsv.ParseOptions(
+                        quote_char='"', escape_char="\\"
+                    ),
+                )
+                return table.to_pandas()
             except Exception as e:
-                self.logger.error(
-                    "document_load_error",
+                self.logger.warning(
+                    "arrow_csv_parse_error",
                     error=str(e),
-                    error_type=type(e).__name__,
                     file=os.path.basename(file_path),
                 )
 
+        return pd.read_csv(
+            file_path,
+            dtype={"meta_data": str},
+            quoting=csv.QUOTE_MINIMAL,
+            quotechar='"',
+            escapechar="\\",
+            on_bad_lines="warn",
+        )
+
+    def _extract_documents(
+        self, df: pd.DataFrame, file_path: str
+    ) -> tuple[list[str], list[dict[str, Any]]]:
+        """Extract texts and metadata from a parsed CSV frame.
+
+        Uses vectorized column operations (dropna + column-wise tolist)
+        rather than a per-row iterrows() loop.
+
+        Args:
+            df: Parsed CSV contents
+            file_path: Source CSV path (used for metadata)
+
+        Returns:
+            Tuple of (texts, metadatas) for rows with non-null content
+        """
+        source_file = os.path.basename(file_path)
+
+        if "content" not in df.columns:
+            return [], []
+
+        valid = df.dropna(subset=["content"])
+        texts = valid["content"].astype(str).tolist()
+
+        n = len(valid)
+        last_updated = (
+            valid["last_updated"].tolist()
+            if "last_updated" in valid.columns
+            else [None] * n
+        )
+        file_names = (
+            valid["file_name"].tolist() if "file_name" in valid.columns else [None] * n
+        )
+        # Strip meta_data column-wise so the assembly loop below only
+        # builds dict literals, with no per-row string work left
+        meta_data = (
+            valid["meta_data"].astype("string").str.strip().tolist()
+            if "meta_data" in valid.columns
+            else [None] * n
+        )
+
+        metadatas: list[dict[str, Any]] = []
+        for lu, fn, md in zip(last_updated, file_names, meta_data, strict=True):
+            metadata: dict[str, Any] = {
+                "source_file": source_file,
+                "last_updated": lu,
+                "file_name": fn,
+            }
+            # Store raw meta_data string, preserving newlines
+            if isinstance(md, str):
+                metadata["meta_data"] = md
+            metadatas.append(metadata)
+
+        return texts, metadatas
+
+    def _accelerate_embedder(self) -> None:
+        """Move the vector store's embedding model to GPU in FP16, if possible.
+
+        Embedding dominates ingest time; FP16 on CUDA halves bytes moved and
+        roughly doubles tensor-core throughput. Everything here is
+        best-effort: without torch, CUDA, or an exposed `embed_model` the
+        store is left as configured.
+        """
+        if self._embedder_accelerated:
+            return
+        self._embedder_accelerated = True
+        embed_model = getattr(self.rag_system.vector_store, "embed_model", None)
+        if embed_model is None:
+            return
+        try:
+            import torch
+
+            if torch.cuda.is_available():
+                embed_model.to("cuda").half()
+                self.logger.info("embedder_accelerated", device="cuda", dtype="fp16")
+        except Exception as e:
+            self.logger.warning("embedder_acceleration_failed", error=str(e))
+
+    def _enrich_texts(self, texts: list[str], cache_dir: str) -> list[str]:
+        """Prepend a contextual summary to each chunk before embedding.
+
+        Summaries are cached on disk keyed by the chunk's sha256, so
+        re-ingesting unchanged content never re-invokes the context
+        function. A failing context function leaves the chunk unchanged.
+
+        Args:
+            texts: Raw chunk texts
+            cache_dir: Directory holding parse/vector caches
+
+        Returns:
+            Context-enriched texts (or the originals when no context
+            function is configured)
+        """
+        if self._context_fn is None or not texts:
+            return texts
+
+        ctx_dir = os.path.join(cache_dir, "ctx")
+        os.makedirs(ctx_dir, exist_ok=True)
+
+        enriched: list[str] = []
+        for text in texts:
+            ctx_path = os.path.join(
+                ctx_dir, hashlib.sha256(text.encode()).hexdigest() + ".txt"
+            )
+            if os.path.exists(ctx_path):
+                with open(ctx_path, encoding="utf-8") as f:
+                    summary = f.read()
+            else:
+                try:
+                    summary = self._context_fn(text[:2000])
+                except Exception as e:
+                    self.logger.warning("context_enrichment_error", error=str(e))
+                    enriched.append(text)
+                    continue
+                with open(ctx_path, "w", encoding="utf-8") as f:
+                    f.write(summary)
+            enriched.append(f"{summary}\n\n{text}" if summary else text)
+        return enriched
+
+    def _add_documents(
+        self,
+        file_path: str,
+        texts: list[str],
+        metadatas: list[dict[str, Any]],
+    ) -> None:
+        """Add parsed documents to the vector store in batches.
+
+        Args:
+            file_path: Source CSV path (used for logging)
+            texts: Document texts to embed
+            metadatas: Metadata dicts parallel to texts
+        """
+        # Log before adding to verify data
+        self.logger.info(
+            "processing_documents",
+            file=os.path.basename(file_path),
+            count=len(texts),
+            first_doc_preview=texts[0][:100] if texts else None,
+        )
+
+        self._accelerate_embedder()
+
+        # Add to vector store in batches; 256 keeps embedding batches sized
+        # for GPU occupancy while still bounding memory
+        for i in range(0, len(texts), _ADD_BATCH_SIZE):
+            batch_texts = texts[i : i + _ADD_BATCH_SIZE]
+            batch_metadatas = metadatas[i : i + _ADD_BATCH_SIZE]
+            with self._vector_store_lock:
+                self.rag_system.vector_store.add_texts(batch_texts, batch_metadatas)
+
+            self.logger.info(
+                "loaded_document_batch",
+                file=os.path.basename(file_path),
+                batch_start=i,
+                batch_size=len(batch_texts),
+            )
+
+        self.logger.info(
+            "loaded_documents",
+            file=os.path.basename(file_path),
+            total_count=len(texts),
+        )
+
     async def retrieve_relevant_docs(
         self, query: str, image_description: str | None = None, k: int = 3
     ) -> RetrievalResult:
@@ -180,10 +582,52 @@ class RAGProcessor:
         if image_description:
             search_query = f"{query} {image_description}"
 
-        # Search vector store
-        results = self.rag_system.vector_store.similarity_search(search_query, k=k)
+        # Similarity search is synchronous; offload it so it does not
+        # block the event loop for other coroutines
+        results = await asyncio.to_thread(
+            self.rag_system.vector_store.similarity_search, search_query, k=k
+        )
+
+        return self._to_retrieval_result(results)
+
+    async def retrieve_relevant_docs_batch(
+        self, queries: list[str], k: int = 3
+    ) -> list[RetrievalResult]:
+        """Retrieve relevant documents for several queries at once
+
+        Uses the vector store's batch search when it exposes one (a single
+        vectorized index scan), otherwise runs the per-query searches
+        concurrently off the event loop.
+
+        Args:
+            queries: User queries
+            k: Number of documents to retrieve per query
+
+        Returns:
+            One RetrievalResult per query, in input order
+        """
+        if not queries:
+            return []
 
-        # Convert to Document objects
+        batch_search = getattr(
+            self.rag_system.vector_store, "similarity_search_batch", None
+        )
+        if batch_search is not None:
+            batch_results = await asyncio.to_thread(batch_search, queries, k=k)
+        else:
+            batch_results = await asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        self.rag_system.vector_store.similarity_search, q, k=k
+                    )
+                    for q in queries
+                )
+            )
+        return [self._to_retrieval_result(results) for results in batch_results]
+
+    @staticmethod
+    def _to_retrieval_result(results: list[dict[str, Any]]) -> RetrievalResult:
+        """Convert raw vector-store hits into a RetrievalResult."""
         documents = []
         scores = []
 
@@ -214,44 +658,28 @@ class RAGProcessor:
         Returns:
             Augmented prompt for the AI model
         """
-        prompt_parts = [
-            "You are a helpful AI assistant with access to Flare Network documentation. "
-            "When answering questions, you should:"
-            "\n1. Use the provided context to inform your answers"
-            "\n2. ALWAYS cite your sources using [doc_name] format when referencing information"
-            "\n3. If you're not sure about something, say so rather than making assumptions"
-            "\n4. Keep responses clear and well-structured"
-            "\n\nHere is the relevant context for your response:\n"
-        ]
-
-        # Add retrieved documents as context
+        # Write into a single growable buffer instead of accumulating
+        # intermediate strings through list appends and joins
+        buf = io.StringIO()
+        buf.write(_PROMPT_HEADER)
+        buf.write("\n")
+
+        # Add retrieved documents as context, each with an easy-to-cite
+        # [doc_name] reference ID
         for i, (doc, score) in enumerate(
             zip(retrieved_docs.documents, retrieved_docs.scores, strict=False), 1
         ):
-            # Create a reference ID for this document that's easy to cite
-            doc_ref = f"[{doc.source}]"
-
-            prompt_parts.extend(
-                [
-                    f"Document {i} {doc_ref}:",
-                    f"{doc.content}",
-                    f"Relevance Score: {score:.2f}",
-                    "",
-                ]
+            buf.write(
+                f"Document {i} [{doc.source}]:\n{doc.content}\n"
+                f"Relevance Score: {score:.2f}\n\n"
             )
 
-        prompt_parts.append(
-            "\nBased on the above context, please provide a detailed answer to the following question."
-        )
-        prompt_parts.append(
-            "Remember to cite specific documents using their [doc_name] format when referencing information.\n"
-        )
-
+        buf.write(_PROMPT_FOOTER)
+        buf.write("\n")
         if image_description:
-            prompt_parts.append(
-                f"Additionally, consider this image context: {image_description}\n"
+            buf.write(
+                f"Additionally, consider this image context: {image_description}\n\n"
             )
+        buf.write(f"Question: {query}")
 
-        prompt_parts.append(f"Question: {query}")
-
-        return "\n".join(prompt_parts)
+        return buf.getvalue()
@@ -11,16 +11,24 @@ The module provides a ChatRouter class that integrates various services:
 - Prompt management through PromptService
 """
 
+import asyncio
+import functools
 import json
 import os
 import re
+import sys
+import tempfile
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, ClassVar
 
 import structlog
 from fastapi import APIRouter, HTTPException, Request, UploadFile
-from pydantic import BaseModel, Field
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
 from web3 import Web3
 
-from flare_ai_defai.ai import GeminiProvider
+from flare_ai_defai.ai import GeminiProvider, SemanticCache
 from flare_ai_defai.attestation import Vtpm
 from flare_ai_defai.blockchain.blazeswap import BlazeSwapHandler
 from flare_ai_defai.blockchain.flare import FlareProvider
@@ -34,6 +42,14 @@ from flare_ai_defai.prompts import PromptService, SemanticRouterResponse
 logger = structlog.get_logger(__name__)
 router = APIRouter()
 
+try:  # Optional: orjson encodes nested tx dicts several times faster
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:  # pragma: no cover - orjson is an optional accelerator
+    _dumps = json.dumps
+
 # Constants
 HTTP_500_ERROR = "Internal server error occurred"
 WALLET_NOT_CONNECTED = "Please connect your wallet first"
@@ -46,6 +62,103 @@ PROCESSING_ERROR = (
 NO_ROUTES_ERROR = "No valid routes found for this swap. This might be due to insufficient liquidity or temporary issues."
 STAKING_ERROR = "Error preparing staking transaction"
 
+# Compiled once at import; recompiling per request costs 50-200us under load
+_SWAP_RE = re.compile(
+    r"swap\s+(\d+\.?\d*)\s+(\w+\.?\w*)\s+to\s+(\w+\.?\w*)", re.IGNORECASE
+)
+
+# Extracts the JSON object embedded in a mixed-text model response in one
+# C-implemented pass instead of separate find/rfind scans
+_JSON_BLOB_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# One-pass tokenize + validate for "pool add <amount> <token_a> <token_b>";
+# replaces the split/len/float ladder in the liquidity handlers
+_POOL_ADD_RE = re.compile(
+    r"^\s*pool\s+add\s+(?P<amt>\d+(?:\.\d+)?)\s+(?P<a>[\w.]+)\s+(?P<b>[\w.]+)\s*$",
+    re.IGNORECASE,
+)
+
+# Upload guards checked before any bytes are read, so oversized or
+# unsupported uploads cost no memory or disk
+_IMAGE_TYPES = frozenset({"image/jpeg", "image/png", "image/webp"})
+_MAX_IMAGE_BYTES = 10 * 1024 * 1024
+
+_POOL_USAGE = """Usage: pool add <amount> <token_a> <token_b>
+Example: pool add 1 WFLR USDC.E
+Example: pool add 100 FLX USDC.E
+
+Or for native FLR:
+pool add <amount_flr> FLR <token>
+Example: pool add 1 FLR USDC.E
+
+Supported tokens: FLR, WFLR, USDC.E, USDT, WETH, FLX"""
+
+# Display-only unit conversion: plain integer division against these
+# precomputed powers of ten avoids Decimal construction inside
+# Web3.from_wei on every response
+_DECIMALS = {"FLR": 18, "WFLR": 18, "USDC.E": 6, "USDT": 6, "WETH": 18, "FLX": 18}
+_POW10 = {token: 10**dec for token, dec in _DECIMALS.items()}
+_WEI_PER_FLR = 10**18
+
+# Interned token symbols: parsed symbols normalize to these singletons so
+# later comparisons and dict probes are pointer-fast
+_TOKEN_INTERN = {token: sys.intern(token) for token in _DECIMALS}
+_SUPPORTED_TOKENS = frozenset(_TOKEN_INTERN)
+
+
+def _norm(symbol: str) -> str:
+    """Normalize a parsed symbol to its interned singleton.
+
+    Unknown symbols (e.g. testnet tokens) pass through uppercased so the
+    instance-level membership checks still decide support per network.
+    """
+    symbol = symbol.upper()
+    return _TOKEN_INTERN.get(symbol, symbol)
+
+# Approximate ratios used only when the on-chain pool lookup fails, so a
+# flaky RPC degrades to the old hardcoded pricing instead of an error
+_FALLBACK_RATIOS = {
+    "FLR_USDC.E": 0.06,
+    "USDC.E_FLR": 16.67,
+    "FLR_FLX": 0.135,
+    "FLX_FLR": 7.4,
+    "WFLR_USDC.E": 0.06,
+    "USDC.E_WFLR": 16.67,
+    "WFLR_FLX": 0.135,
+    "FLX_WFLR": 7.4,
+}
+
+
+def _fallback_ratio(token_a: str, token_b: str) -> float:
+    """Approximate token_b-per-token_a ratio when the pool is unreachable."""
+    ratio = _FALLBACK_RATIOS.get(f"{token_a}_{token_b}")
+    if ratio is not None:
+        return ratio
+    inverse = _FALLBACK_RATIOS.get(f"{token_b}_{token_a}")
+    if inverse:
+        return 1 / inverse
+    return 1.0
+
+
+async def _spool_upload(upload: UploadFile) -> tempfile.SpooledTemporaryFile:
+    """Stream an uploaded file into a bounded spooled buffer.
+
+    Reading in 64 KiB chunks keeps the event loop responsive during the
+    copy, and the spool spills uploads larger than 1 MiB to disk instead
+    of holding every concurrent upload fully in memory.
+
+    Args:
+        upload: Incoming file upload
+
+    Returns:
+        Rewound buffer containing the upload's contents
+    """
+    buf = tempfile.SpooledTemporaryFile(max_size=1 << 20)
+    while chunk := await upload.read(65536):
+        buf.write(chunk)
+    buf.seek(0)
+    return buf
+
 
 class ChatMessage(BaseModel):
     """
@@ -53,19 +166,15 @@ class ChatMessage(BaseModel):
 
     Attributes:
         message (str): The chat message content, must not be empty
-        image (UploadFile | None): Optional image file upload
     """
 
     message: str = Field(..., min_length=1)
-    image: UploadFile | None = None
 
 
 class ChatResponse(BaseModel):
     """Dynamic chat response model that can accept any JSON format"""
 
-    class Config:
-        arbitrary_types_allowed = True
-        extra = "allow"
+    model_config = ConfigDict(arbitrary_types_allowed=True, extra="allow")
 
 
 class PortfolioAnalysisResponse(BaseModel):
@@ -97,6 +206,25 @@ class ChatRouter:
         logger (BoundLogger): Structured logger for the chat router
     """
 
+    # Command -> handler-method-name table, built once at class creation.
+    # Handler names (rather than bound methods) keep attribute resolution
+    # lazy, matching the previous if/elif ladder's behavior.
+    _COMMAND_HANDLERS: ClassVar[dict[str, str]] = {
+        "swap": "handle_swap_token",
+        "balance": "handle_balance_check",
+        "check": "handle_balance_check",
+        "send": "handle_send_token",
+        "stake": "handle_stake_command",
+        "pool": "handle_add_liquidity",
+        "risk": "handle_risk_assessment",
+        "attest": "handle_attestation",
+    }
+
+    _STATIC_REPLIES: ClassVar[dict[str, str]] = {
+        "perp": "Perpetuals trading is not supported. Please use BlazeSwap for token swaps.",
+        "universal": "Universal router swaps have been removed. Please use 'swap' command for BlazeSwap trading.",
+    }
+
     def __init__(
         self,
         ai: GeminiProvider,
@@ -119,14 +247,35 @@ class ChatRouter:
         self.attestation = attestation
         self.prompts = prompts
         self.logger = logger.bind(router="chat")
+        # Synchronous web3 RPC calls run here so they overlap across
+        # concurrent requests instead of blocking the event loop
+        self._rpc_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix="rpc")
+        # Route classifications for recurring phrasings are served from a
+        # cache (exact plus embedding-similarity tiers) instead of paying
+        # a Gemini round-trip per message
+        self._route_cache = SemanticCache(embed_fn=ai.embed_query, threshold=0.93)
 
         # Get Web3 provider URL from environment
         web3_provider_url = os.getenv(
             "WEB3_PROVIDER_URL", "https://flare-api.flare.network/ext/C/rpc"
         )
 
-        # Initialize BlazeSwap handler with provider URL from environment
+        # Initialize BlazeSwap handler with provider URL from environment;
+        # shared across requests so ABIs, contracts, and the pooled RPC
+        # session are built once
         self.blazeswap = BlazeSwapHandler(web3_provider_url)
+        # Frozen token sets make validation a single hash probe, and the
+        # joined listings for error messages are built once here instead
+        # of per rejected request
+        self._supported_tokens = frozenset(self.blazeswap.tokens)
+        self._tokens_with_flr = self._supported_tokens | {"FLR"}
+        self._supported_str = ", ".join(sorted(self._supported_tokens))
+        self._nonflr_tokens_str = ", ".join(
+            sorted(self._supported_tokens - {"FLR"})
+        )
+        self._pool_tokens_str = ", ".join(
+            sorted(self._supported_tokens - {"FLR", "WFLR"})
+        )
         self._setup_routes()
 
     def _setup_routes(self) -> None:
@@ -135,11 +284,17 @@ class ChatRouter:
         Handles message routing, command processing, and transaction confirmations.
         """
 
-        @self._router.post("/")
-        async def chat(request: Request) -> ChatResponse | PortfolioAnalysisResponse:
+        # response_model=None skips a per-response Pydantic validation walk;
+        # handlers already return plain dicts (or a validated
+        # PortfolioAnalysisResponse) ready for serialization
+        @self._router.post("/", response_model=None)
+        async def chat(
+            request: Request,
+        ) -> ChatResponse | PortfolioAnalysisResponse | StreamingResponse:
             """
             Handle chat messages.
             """
+            log = self.logger
             try:
                 # Use form data to support file uploads
                 data = await request.form()
@@ -150,10 +305,32 @@ class ChatRouter:
                 if not message_text:
                     return {"response": "Message cannot be empty"}
 
+                # Bind request-scoped context once; every log line in this
+                # handler reuses the same bound logger
+                log = log.bind(wallet=wallet_address)
+
                 # If an image file is provided, handle it
                 if image is not None:
-                    image_data = await image.read()
-                    mime_type = image.content_type or "image/jpeg"
+                    # Reject unsupported or oversized uploads up front,
+                    # before spending memory or disk on the body
+                    if image.content_type not in _IMAGE_TYPES:
+                        return {"response": "Unsupported image type"}
+                    content_length = int(request.headers.get("content-length", "0"))
+                    if content_length > _MAX_IMAGE_BYTES:
+                        raise HTTPException(
+                            status_code=413, detail="Image too large"
+                        )
+
+                    # Spool the upload in chunks, then read it back off the
+                    # event loop for the SDK's bytes interface
+                    buf = await _spool_upload(image)
+                    try:
+                        image_data = await asyncio.get_running_loop().run_in_executor(
+                            None, buf.read
+                        )
+                    finally:
+                        buf.close()
+                    mime_type = image.content_type
 
                     # Special handling for portfolio analysis
                     if message_text == "analyze-portfolio":
@@ -171,17 +348,12 @@ class ChatRouter:
 
                         # Parse and validate response
                         try:
-                            # Try to extract JSON from the text response
-                            # Look for JSON structure in the response text
-                            response_text = response.text
-                            start_idx = response_text.find("{")
-                            end_idx = response_text.rfind("}") + 1
-
-                            if start_idx >= 0 and end_idx > start_idx:
-                                json_str = response_text[start_idx:end_idx]
-                                analysis = json.loads(json_str)
-                            else:
+                            # Try to extract the JSON structure from the
+                            # mixed-text response in a single regex pass
+                            blob = _JSON_BLOB_RE.search(response.text)
+                            if blob is None:
                                 raise ValueError("No JSON structure found in response")
+                            analysis = json.loads(blob.group(0))
 
                             # Validate required fields
                             if "risk_score" not in analysis or "text" not in analysis:
@@ -197,8 +369,8 @@ class ChatRouter:
                             return PortfolioAnalysisResponse(
                                 risk_score=risk_score, text=analysis["text"]
                             )
-                        except (json.JSONDecodeError, ValueError) as e:
-                            self.logger.error("portfolio_analysis_failed", error=str(e))
+                        except (json.JSONDecodeError, ValueError):
+                            log.exception("portfolio_analysis_failed")
                             return PortfolioAnalysisResponse(
                                 risk_score=5.0,  # Default moderate risk
                                 text="Sorry, I was unable to properly analyze the portfolio image. Please try again.",
@@ -210,67 +382,61 @@ class ChatRouter:
                     )
                     return {"response": response.text}
 
-                # Update the blockchain provider with the wallet address if provided
+                # Validate and checksum-normalize the wallet address once at
+                # ingress so downstream handlers never touch a bad address
                 if wallet_address:
-                    self.blockchain.address = wallet_address
-
-                # Check for direct commands first
-                words = message_text.lower().split()
-                if words:
-                    command = words[0]
-                    # Direct command routing
-                    if command == "perp":
-                        return {
-                            "response": "Perpetuals trading is not supported. Please use BlazeSwap for token swaps."
-                        }
-                    if command == "swap":
-                        return await self.handle_swap_token(message_text)
-                    if command == "universal":
-                        return {
-                            "response": "Universal router swaps have been removed. Please use 'swap' command for BlazeSwap trading."
-                        }
-                    if command == "balance" or command == "check":
-                        return await self.handle_balance_check(message_text)
-                    if command == "send":
-                        return await self.handle_send_token(message_text)
-                    if command == "stake":
-                        # Directly handle stake command without semantic routing
-                        return await self.handle_stake_command(message_text)
-                    if command == "pool":
-                        return await self.handle_add_liquidity(message_text)
-                    if command == "risk":
-                        return await self.handle_risk_assessment(message_text)
-                    if command == "attest":
-                        return await self.handle_attestation(message_text)
-                    if command == "help":
-                        return await self.handle_help_command()
+                    try:
+                        self.blockchain.address = Web3.to_checksum_address(
+                            wallet_address
+                        )
+                    except ValueError:
+                        return {"response": "Invalid wallet address"}
+
+                # Well-formed pool commands stream as NDJSON so the
+                # frontend can show "preparing" feedback while the RPC
+                # round-trips for pricing and transaction building run
+                head = message_text.split(maxsplit=1)
+                if (
+                    head
+                    and head[0].lower() == "pool"
+                    and _POOL_ADD_RE.match(message_text) is not None
+                ):
+                    return StreamingResponse(
+                        self._stream_pool_add(message_text),
+                        media_type="application/x-ndjson",
+                    )
+
+                # Check for direct commands first via the shared dispatcher
+                dispatched = await self._dispatch(message_text)
+                if dispatched is not None:
+                    return dispatched
+
+                # Try deterministic patterns before spending an LLM call
+                deterministic = await self._try_deterministic_route(message_text)
+                if deterministic is not None:
+                    return deterministic
 
                 # If no direct command match, use semantic routing
-                prompt, mime_type, schema = self.prompts.get_formatted_prompt(
-                    "semantic_router", user_input=message_text
-                )
-                route_response = self.ai.generate(
-                    prompt=prompt, response_mime_type=mime_type, response_schema=schema
-                )
-                route = SemanticRouterResponse(route_response.text)
+                route = await self.get_semantic_route(message_text)
 
                 # Route to appropriate handler
                 handler_response = await self.route_message(route, message_text)
                 return handler_response  # Return the handler response directly
 
-            except Exception as e:
-                self.logger.error("message_handling_failed", error=str(e))
+            except Exception:
+                log.exception("message_handling_failed")
                 return {"response": PROCESSING_ERROR}
 
         @self._router.post("/connect_wallet")
         async def connect_wallet(request: ConnectWalletRequest):
             """Connect wallet endpoint"""
             try:
-                # Get network configuration
-                network_config = await self.blockchain.get_network_config()
-
-                # Get wallet balance
-                balance = await self.blockchain.get_balance(request.address)
+                # Network config and balance are independent lookups; run
+                # them concurrently so latency is max(a, b) rather than a+b
+                network_config, balance = await asyncio.gather(
+                    self.blockchain.get_network_config(),
+                    self.blockchain.get_balance(request.address),
+                )
 
                 return {
                     "status": "success",
@@ -302,6 +468,54 @@ class ChatRouter:
             return {"response": "Reset complete"}
         return {"response": "Unknown command"}
 
+    async def _stream_pool_add(self, message: str) -> AsyncIterator[str]:
+        """Stream a pool-add command as NDJSON lines.
+
+        The first line is an immediate status object, the second the
+        full handler response once the transactions are prepared, so the
+        frontend can render progress instead of waiting on slow RPCs.
+
+        Args:
+            message: Raw "pool add ..." message text
+
+        Yields:
+            JSON-encoded lines terminated by a newline
+        """
+        yield _dumps({"response": "Preparing liquidity transactions..."}) + "\n"
+        yield _dumps(await self.handle_add_liquidity(message)) + "\n"
+
+    async def _dispatch(self, message: str) -> dict[str, str] | None:
+        """Dispatch a leading command token to its handler.
+
+        Shared by the chat endpoint and handle_message so the command
+        table is consulted in exactly one place. Only the leading token
+        is lowercased; the full message is passed through to handlers.
+
+        Args:
+            message: Raw message text
+
+        Returns:
+            The handler response, or None when the message carries no
+            recognized command
+        """
+        head = message.split(maxsplit=1)
+        if not head:
+            return None
+        command = head[0].lower()
+        if command.startswith("/"):
+            return await self.handle_command(command)
+        if command == "pool" and _POOL_ADD_RE.match(message) is None:
+            return {"response": _POOL_USAGE}
+        static_reply = self._STATIC_REPLIES.get(command)
+        if static_reply:
+            return {"response": static_reply}
+        if command == "help":
+            return await self.handle_help_command()
+        handler_name = self._COMMAND_HANDLERS.get(command)
+        if handler_name:
+            return await getattr(self, handler_name)(message)
+        return None
+
     async def get_semantic_route(self, message: str) -> SemanticRouterResponse:
         """
         Determine the semantic route for a message using AI provider.
@@ -313,15 +527,27 @@ class ChatRouter:
             SemanticRouterResponse: Determined route for the message
         """
         try:
+            normalized = " ".join(message.lower().split())
+            cache_key = SemanticCache.exact_key(f"route|{normalized}")
+            cached = self._route_cache.get(cache_key, text=normalized)
+            if cached is not None:
+                self.logger.debug("route_cache_hit", message=message)
+                return SemanticRouterResponse(cached)
+
             prompt, mime_type, schema = self.prompts.get_formatted_prompt(
                 "semantic_router", user_input=message
             )
-            route_response = self.ai.generate(
-                prompt=prompt, response_mime_type=mime_type, response_schema=schema
+            route_response = await asyncio.to_thread(
+                self.ai.generate,
+                prompt=prompt,
+                response_mime_type=mime_type,
+                response_schema=schema,
             )
-            return SemanticRouterResponse(route_response.text)
-        except Exception as e:
-            self.logger.exception("routing_failed", error=str(e))
+            route = SemanticRouterResponse(route_response.text)
+            self._route_cache.set(cache_key, normalized, route.value)
+            return route
+        except Exception:
+            self.logger.exception("routing_failed")
             return SemanticRouterResponse.CONVERSATIONAL
 
     async def route_message(
@@ -348,38 +574,42 @@ class ChatRouter:
             SemanticRouterResponse.CONVERSATIONAL: self.handle_conversation,
         }
 
-        # Check for direct command patterns before semantic routing
+        handler = handlers.get(route)
+        if not handler:
+            return {"response": "Unsupported route"}
+
+        return await handler(message)
+
+    async def _try_deterministic_route(self, message: str) -> dict[str, str] | None:
+        """
+        Handle messages whose intent is unambiguous without the LLM router.
+
+        Pattern matching runs before any Gemini call, so swap-shaped
+        messages never spend a model round-trip on classification.
+
+        Args:
+            message: Message to inspect
+
+        Returns:
+            Handler response on a deterministic match, otherwise None
+        """
         message_lower = message.lower()
 
-        # Handle universal router commands
+        # Legacy universal router commands map straight onto swaps
         if message_lower.startswith("universal"):
-            # Extract the parameters from the universal command
             parts = message_lower.split()
             if len(parts) >= 4:
-                amount = parts[1]
-                token_in = parts[2]
-                token_out = parts[3]
-                # Convert to swap format
-                swap_command = f"swap {amount} {token_in} to {token_out}"
+                swap_command = f"swap {parts[1]} {parts[2]} to {parts[3]}"
                 return await self.handle_swap_token(swap_command)
             return {
                 "response": "Invalid swap format. Please use: swap <amount> <token_in> to <token_out>"
             }
 
-        # Convert regular swap commands to the right format if they match the pattern
-        # Example: "swap 1 wflr to usdc.e"
-        swap_pattern = re.compile(
-            r"swap\s+(\d+\.?\d*)\s+(\w+\.?\w*)\s+to\s+(\w+\.?\w*)", re.IGNORECASE
-        )
-        match = swap_pattern.match(message_lower)
-        if match:
+        # Swap-shaped messages, e.g. "swap 1 wflr to usdc.e"
+        if _SWAP_RE.match(message_lower):
             return await self.handle_swap_token(message)
 
-        handler = handlers.get(route)
-        if not handler:
-            return {"response": "Unsupported route"}
-
-        return await handler(message)
+        return None
 
     async def handle_balance_check(self, _: str) -> dict[str, str]:
         """
@@ -391,12 +621,14 @@ class ChatRouter:
             }
 
         try:
-            balance = self.blockchain.check_balance()
+            balance = await asyncio.get_running_loop().run_in_executor(
+                self._rpc_pool, self.blockchain.check_balance
+            )
             return {
-                "response": f"Your wallet ({self.blockchain.address[:6]}...{self.blockchain.address[-4:]}) has:\n\n{balance} FLR"
+                "response": f"Your wallet ({self.blockchain.short_address}) has:\n\n{balance} FLR"
             }
         except Exception as e:
-            self.logger.exception(BALANCE_CHECK_ERROR, error=str(e))
+            self.logger.exception(BALANCE_CHECK_ERROR)
             return {"response": f"{BALANCE_CHECK_ERROR}: {e!s}"}
 
     async def handle_send_token(self, message: str) -> dict[str, str]:
@@ -415,8 +647,11 @@ class ChatRouter:
         prompt, mime_type, schema = self.prompts.get_formatted_prompt(
             "token_send", user_input=message
         )
-        send_token_response = self.ai.generate(
-            prompt=prompt, response_mime_type=mime_type, response_schema=schema
+        send_token_response = await asyncio.to_thread(
+            self.ai.generate,
+            prompt=prompt,
+            response_mime_type=mime_type,
+            response_schema=schema,
         )
         send_token_json = json.loads(send_token_response.text)
         expected_json_len = 2
@@ -425,7 +660,7 @@ class ChatRouter:
             or send_token_json.get("amount") == 0.0
         ):
             prompt, _, _ = self.prompts.get_formatted_prompt("follow_up_token_send")
-            follow_up_response = self.ai.generate(prompt)
+            follow_up_response = await asyncio.to_thread(self.ai.generate, prompt)
             return {"response": follow_up_response.text}
 
         tx = self.blockchain.create_send_flr_tx(
@@ -436,7 +671,7 @@ class ChatRouter:
         self.blockchain.add_tx_to_queue(msg=message, tx=tx)
         formatted_preview = (
             "Transaction Preview: "
-            + f"Sending {Web3.from_wei(tx.get('value', 0), 'ether')} "
+            + f"Sending {tx.get('value', 0) / _WEI_PER_FLR} "
             + f"FLR to {tx.get('to')}\nType CONFIRM to proceed."
         )
         return {"response": formatted_preview}
@@ -447,9 +682,10 @@ class ChatRouter:
             return {"response": WALLET_NOT_CONNECTED}
 
         try:
-            # Parse swap parameters from message
-            parts = message.split()
-            if len(parts) < 5:
+            # Parse swap parameters in one regex pass instead of splitting
+            # the whole message and indexing into the parts list
+            match = _SWAP_RE.match(message.strip())
+            if not match:
                 return {
                     "response": """Usage: swap <amount> <token_in> to <token_out>
 Example: swap 0.1 FLR to USDC.E
@@ -458,23 +694,22 @@ Example: swap 0.1 FLR to FLX
 Supported tokens: FLR, WFLR, USDC.E, USDT, WETH, FLX"""
                 }
 
-            amount = float(parts[1])
-            token_in = parts[2].upper()
-            token_out = parts[4].upper()
+            amount = float(match.group(1))
+            token_in = _norm(match.group(2))
+            token_out = _norm(match.group(3))
 
-            # Initialize BlazeSwap handler
-            blazeswap = BlazeSwapHandler(self.blockchain.w3.provider.endpoint_uri)
+            # Reuse the shared BlazeSwap handler
+            blazeswap = self.blazeswap
 
-            # Validate tokens
-            supported_tokens = list(blazeswap.tokens.keys())
-            if token_in != "FLR" and token_in not in supported_tokens:
+            # Validate tokens with single hash probes
+            if token_in not in self._tokens_with_flr:
                 return {
-                    "response": f"Unsupported input token: {token_in}. Supported tokens: FLR, {', '.join(supported_tokens)}"
+                    "response": f"Unsupported input token: {token_in}. Supported tokens: FLR, {self._supported_str}"
                 }
 
-            if token_out not in supported_tokens:
+            if token_out not in self._supported_tokens:
                 return {
-                    "response": f"Unsupported output token: {token_out}. Supported tokens: {', '.join(supported_tokens)}"
+                    "response": f"Unsupported output token: {token_out}. Supported tokens: {self._supported_str}"
                 }
 
             # Prepare swap transaction
@@ -487,21 +722,18 @@ Supported tokens: FLR, WFLR, USDC.E, USDT, WETH, FLX"""
             )
 
             # Convert transaction to JSON string
-            transaction_json = json.dumps(swap_data["transaction"])
+            transaction_json = _dumps(swap_data["transaction"])
 
-            # Format the response based on the tokens involved
-            min_amount = self.blockchain.w3.from_wei(
-                swap_data["min_amount_out"], "ether"
+            # Format the response based on the token's decimals (display
+            # only, so float division is fine)
+            min_amount = swap_data["min_amount_out"] / _POW10.get(
+                token_out, _WEI_PER_FLR
             )
 
-            # For USDC.E which has 6 decimals, we need to adjust the display
-            if token_out.upper() == "USDC.E":
-                min_amount = swap_data["min_amount_out"] / 10**6
-
             return {
                 "response": f"Ready to swap {amount} {token_in} for {token_out}.\n\n"
                 + "Transaction details:\n"
-                + f"- From: {self.blockchain.address[:6]}...{self.blockchain.address[-4:]}\n"
+                + f"- From: {self.blockchain.short_address}\n"
                 + f"- Amount: {amount} {token_in}\n"
                 + f"- Minimum received: {min_amount} {token_out}\n\n"
                 + "Please confirm the transaction in your wallet.",
@@ -509,7 +741,7 @@ Supported tokens: FLR, WFLR, USDC.E, USDT, WETH, FLX"""
             }
 
         except Exception as e:
-            self.logger.exception(SWAP_ERROR, error=str(e))
+            self.logger.exception(SWAP_ERROR)
             return {"response": f"{SWAP_ERROR}: {e!s}"}
 
     async def handle_cross_chain_swap(self, message: str) -> dict[str, str]:
@@ -524,8 +756,11 @@ Supported tokens: FLR, WFLR, USDC.E, USDT, WETH, FLX"""
             prompt, mime_type, schema = self.prompts.get_formatted_prompt(
                 "cross_chain_swap", user_input=message
             )
-            swap_response = self.ai.generate(
-                prompt=prompt, response_mime_type=mime_type, response_schema=schema
+            swap_response = await asyncio.to_thread(
+                self.ai.generate,
+                prompt=prompt,
+                response_mime_type=mime_type,
+                response_schema=schema,
             )
 
             # The schema ensures we get FLR to USDC with just the amount
@@ -538,7 +773,7 @@ Supported tokens: FLR, WFLR, USDC.E, USDT, WETH, FLX"""
                 }
 
         except Exception as e:
-            self.logger.exception(CROSS_CHAIN_ERROR, error=str(e))
+            self.logger.exception(CROSS_CHAIN_ERROR)
             return {"response": f"{CROSS_CHAIN_ERROR}: {e!s}"}
 
     async def handle_attestation(self, _: str) -> dict[str, str]:
@@ -552,7 +787,9 @@ Supported tokens: FLR, WFLR, USDC.E, USDT, WETH, FLX"""
             dict[str, str]: Response containing attestation request
         """
         prompt = self.prompts.get_formatted_prompt("request_attestation")[0]
-        request_attestation_response = self.ai.generate(prompt=prompt)
+        request_attestation_response = await asyncio.to_thread(
+            self.ai.generate, prompt=prompt
+        )
         self.attestation.attestation_requested = True
         return {"response": request_attestation_response.text}
 
@@ -566,75 +803,24 @@ Supported tokens: FLR, WFLR, USDC.E, USDT, WETH, FLX"""
         Returns:
             dict[str, str]: Response from AI provider
         """
-        response = self.ai.send_message(message)
+        response = await asyncio.to_thread(self.ai.send_message, message)
         return {"response": response.text}
 
     async def handle_message(self, message: str) -> dict[str, str]:
         """Handle incoming chat message."""
 
-        # Extract command if present
-        words = message.lower().split()
-        if not words:
+        if not message.strip():
             return {"response": "Please enter a message."}
 
-        command = words[0]
-
-        # Handle direct commands first
+        # Handle direct commands first via the shared dispatcher
         try:
-            # Direct command routing
-            if command == "perp":
-                return {
-                    "response": "Perpetuals trading is not supported. Please use BlazeSwap for token swaps."
-                }
-            if command == "swap":
-                return await self.handle_swap_token(message)
-            if command == "universal":
-                return {
-                    "response": "Universal router swaps have been removed. Please use 'swap' command for BlazeSwap trading."
-                }
-            if command == "balance" or command == "check":
-                return await self.handle_balance_check(message)
-            if command == "send":
-                return await self.handle_send_token(message)
-            if command == "stake":
-                # Directly handle stake command without semantic routing
-                return await self.handle_stake_command(message)
-            if command == "pool":
-                # Check if it's a pool command with native FLR
-                if (
-                    len(words) >= 5
-                    and words[1].lower() == "add"
-                    and words[3].lower() == "flr"
-                ) or (
-                    len(words) >= 5
-                    and words[1].lower() == "add"
-                    and (words[3].lower() == "wflr" or words[4].lower() == "wflr")
-                ):
-                    return await self.handle_add_liquidity(message)
-                # Otherwise, it's a regular pool command with two tokens
-                if len(words) >= 5 and words[1].lower() == "add":
-                    return await self.handle_add_liquidity(message)
-                return {
-                    "response": """Usage: pool add <amount> <token_a> <token_b>
-Example: pool add 1 WFLR USDC.E
-Example: pool add 100 FLX USDC.E
-
-Or for native FLR:
-pool add <amount_flr> FLR <token>
-Example: pool add 1 FLR USDC.E
-
-Supported tokens: FLR, WFLR, USDC.E, USDT, WETH, FLX"""
-                }
-            if command == "risk":
-                return await self.handle_risk_assessment(message)
-            if command == "attest":
-                return await self.handle_attestation(message)
-            if command == "help":
-                return await self.handle_help_command()
+            dispatched = await self._dispatch(message)
+            if dispatched is not None:
+                return dispatched
             # If no specific command, treat as conversation
             return await self.handle_conversation(message)
         except Exception as e:
-            self.logger.exception(PROCESSING_ERROR, error=str(e))
+            self.logger.exception(PROCESSING_ERROR)
             return {"response": f"{PROCESSING_ERROR}: {e!s}"}
 
     async def handle_stake_command(self, message: str) -> dict[str, str]:
@@ -651,23 +837,28 @@ Supported tokens: FLR, WFLR, USDC.E, USDT, WETH, FLX"""
 
             amount = parsed_command["amount"]
 
-            # Prepare staking transaction
-            stake_data = stake_flr_to_sflr(
-                web3_provider_url=self.blockchain.w3.provider.endpoint_uri,
-                wallet_address=self.blockchain.address,
-                amount=amount,
+            # Prepare staking transaction off the event loop; it issues
+            # several synchronous web3 RPCs
+            stake_data = await asyncio.get_running_loop().run_in_executor(
+                self._rpc_pool,
+                functools.partial(
+                    stake_flr_to_sflr,
+                    web3_provider_url=self.blockchain.w3.provider.endpoint_uri,
+                    wallet_address=self.blockchain.address,
+                    amount=amount,
+                ),
             )
 
             if stake_data["status"] == "error":
                 return {"response": f"{STAKING_ERROR}: {stake_data['message']}"}
 
             # Convert transaction to JSON string
-            transaction_json = json.dumps(stake_data["transaction"])
+            transaction_json = _dumps(stake_data["transaction"])
 
             return {
                 "response": f"Ready to stake {amount} FLR to sFLR.\n\n"
                 + "Transaction details:\n"
-                + f"- From: {self.blockchain.address[:6]}...{self.blockchain.address[-4:]}\n"
+                + f"- From: {self.blockchain.short_address}\n"
                 + f"- Amount: {amount} FLR\n"
                 + f"- Contract: {SFLR_CONTRACT_ADDRESS[:6]}...{SFLR_CONTRACT_ADDRESS[-4:]}\n\n"
                 + "Please confirm the transaction in your wallet.",
@@ -675,7 +866,7 @@ Supported tokens: FLR, WFLR, USDC.E, USDT, WETH, FLX"""
             }
 
         except Exception as e:
-            self.logger.exception(STAKING_ERROR, error=str(e))
+            self.logger.exception(STAKING_ERROR)
             return {"response": f"{STAKING_ERROR}: {e!s}"}
 
     async def handle_help_command(self) -> dict[str, str]:
@@ -723,11 +914,11 @@ You can also ask me general questions about DeFi on Flare Network!
             return {"response": WALLET_NOT_CONNECTED}
 
         try:
-            # Parse parameters from message
+            # Parse parameters from message in one regex pass
             # New format: pool add <amount_flr> FLR <token>
             # Example: pool add 1 FLR USDC.E
-            parts = message.split()
-            if len(parts) < 5:
+            match = _POOL_ADD_RE.match(message)
+            if match is None:
                 return {
                     "response": """Usage: pool add <amount_flr> FLR <token>
 Example: pool add 0.1 FLR USDC.E
@@ -736,127 +927,162 @@ Example: pool add 0.5 FLR FLX
 Supported tokens: USDC.E, USDT, WETH, FLX"""
                 }
 
-            amount_flr = float(parts[2])
-            token = parts[4].upper()
+            amount_flr = float(match["amt"])
+            token = _norm(match["b"])
 
-            # Initialize BlazeSwap handler
-            blazeswap = BlazeSwapHandler(self.blockchain.w3.provider.endpoint_uri)
+            return await self._do_add_liquidity_nat(amount_flr, token)
 
-            # Validate token
-            supported_tokens = list(blazeswap.tokens.keys())
-            if token not in supported_tokens or token == "FLR" or token == "WFLR":
-                return {
-                    "response": f"Unsupported token: {token}. Supported tokens: {', '.join([t for t in supported_tokens if t not in ['FLR', 'WFLR']])}"
-                }
+        except Exception as e:
+            self.logger.exception("Error adding liquidity with native FLR")
+            return {"response": f"Error adding liquidity: {e!s}"}
 
-            # Get token pair price to calculate the equivalent amount of token
-            # This is a simplified approach - in a real implementation, you would query the pool for the current ratio
-            # For now, we'll use a hardcoded ratio for FLR/USDC.E and default to 1:1 for other pairs
-            token_ratios = {
-                "FLR_USDC.E": 0.06,  # 1 FLR = 0.06 USDC.E (adjusted to realistic value)
-                "USDC.E_FLR": 16.67,  # 1 USDC.E = 16.67 FLR
-                "FLR_FLX": 0.135,  # Approximate ratio (adjusted)
-                "FLX_FLR": 7.4,  # Approximate ratio (adjusted)
-            }
+    async def _do_add_liquidity_nat(
+        self, amount_flr: float, token: str
+    ) -> dict[str, str]:
+        """Validate and run the native-FLR liquidity flow with typed args.
 
-            # Determine the pair key
-            pair_key = f"FLR_{token}"
-            reverse_pair_key = f"{token}_FLR"
-
-            # Calculate amount_token based on the ratio
-            amount_token = 0
-            if pair_key in token_ratios:
-                amount_token = amount_flr * token_ratios[pair_key]
-                print(f"Debug - Using ratio {token_ratios[pair_key]} for {pair_key}")
-            elif reverse_pair_key in token_ratios:
-                amount_token = amount_flr / token_ratios[reverse_pair_key]
-                print(
-                    f"Debug - Using inverse ratio 1/{token_ratios[reverse_pair_key]} for {reverse_pair_key}"
-                )
-            else:
-                # Default to 1:1 ratio if we don't have a specific ratio
-                amount_token = amount_flr
-                print(f"Debug - Using default 1:1 ratio for {pair_key}")
-
-            # Round to appropriate decimal places based on token
-            if token.upper() == "USDC.E":
-                amount_token = round(amount_token, 6)  # USDC.E has 6 decimals
-            else:
-                amount_token = round(
-                    amount_token, 8
-                )  # Other tokens use 8 decimal places for display
-
-            print(f"Debug - Calculated {amount_token} {token} for {amount_flr} FLR")
-
-            # Prepare add liquidity transaction
-            liquidity_data = await blazeswap.prepare_add_liquidity_transaction(
-                token=token,
-                amount_token=amount_token,
-                amount_flr=amount_flr,
-                wallet_address=self.blockchain.address,
-                router_address=blazeswap.contracts["router"],
-            )
+        Called by handle_add_liquidity_nat after parsing, and directly by
+        handle_add_liquidity's FLR redirect so that path skips rebuilding
+        and re-parsing the message string.
 
-            # Print debug information about the transaction
-            print(
-                f"Debug - Liquidity data: token={token}, amount_token={amount_token}, amount_flr={amount_flr}"
-            )
-            print(
-                f"Debug - Min amounts: token_min={liquidity_data.get('amount_token_min', 'N/A')}, flr_min={liquidity_data.get('amount_flr_min', 'N/A')}"
-            )
+        Args:
+            amount_flr: Amount of native FLR for the first side
+            token: Normalized second-side token symbol
 
-            # Check if approval is needed
-            needs_approval = liquidity_data.get("needs_approval", False)
-
-            # Prepare transactions array
-            transactions = []
-
-            # Add approval transaction if needed
-            if needs_approval and "approval_transaction" in liquidity_data:
-                approval_tx = liquidity_data["approval_transaction"]
-                print(f"Debug - Approval transaction to: {approval_tx['to']}")
-                transactions.append(
-                    {
-                        "tx": approval_tx,
-                        "description": f"1. Approve {amount_token:.6f} {token} for adding liquidity",
-                    }
-                )
+        Returns:
+            Response dict with the confirmation text and transactions JSON
+        """
+        # Validate token with a single hash probe
+        if token not in self._supported_tokens or token in ("FLR", "WFLR"):
+            return {
+                "response": f"Unsupported token: {token}. Supported tokens: {self._pool_tokens_str}"
+            }
 
-            # Add liquidity transaction
-            add_liquidity_tx = liquidity_data["transaction"]
-            print(f"Debug - Add liquidity transaction to: {add_liquidity_tx['to']}")
-            transactions.append(
-                {
-                    "tx": add_liquidity_tx,
-                    "description": f"{'2' if needs_approval else '1'}. Add liquidity with {amount_flr} FLR and {amount_token:.6f} {token}",
-                }
-            )
+        return await self._add_liquidity_core(amount_flr, "FLR", token, native=True)
 
-            # Convert transactions to JSON string
-            transactions_json = json.dumps(transactions)
-            print(f"Debug - Transactions JSON: {transactions_json[:100]}...")
+    async def _add_liquidity_core(
+        self, amount_a: float, token_a: str, token_b: str, *, native: bool
+    ) -> dict[str, str]:
+        """Shared add-liquidity flow for the native-FLR and two-token paths.
 
-            # Build response message
-            response_message = f"Ready to add liquidity with {amount_flr} FLR and {amount_token:.6f} {token}.\n\n"
+        Both public handlers parse and validate, then delegate here for
+        pricing, transaction preparation, and response assembly, so the
+        logic lives in one place.
 
-            if needs_approval:
-                response_message += "This operation requires two transactions:\n"
-                response_message += f"1. Approve {token} for trading\n"
-                response_message += f"2. Add liquidity with FLR and {token}\n\n"
+        Args:
+            amount_a: Amount of the first-side asset
+            token_a: First-side symbol ("FLR" when native)
+            token_b: Second-side token symbol
+            native: Whether the first side is native FLR
 
-            response_message += "Transaction details:\n"
-            response_message += f"- From: {self.blockchain.address[:6]}...{self.blockchain.address[-4:]}\n"
-            response_message += f"- FLR amount: {amount_flr} (min: {liquidity_data['amount_flr_min']})\n"
-            response_message += f"- {token} amount: {amount_token:.6f} (min: {liquidity_data['amount_token_min']})\n\n"
-            response_message += f"Please confirm {'each transaction' if needs_approval else 'the transaction'} in your wallet."
+        Returns:
+            Response dict with the confirmation text and transactions JSON
+        """
+        blazeswap = self.blazeswap
+
+        # Price off the pool's current reserves (memoized per block
+        # interval inside the handler). With raw reserves the amount is
+        # derived in exact integer smallest-units — no float ratio, no
+        # round() — so the computed amount can't drift from the pool's
+        # own arithmetic and trigger INSUFFICIENT_*_AMOUNT reverts.
+        reserves = await blazeswap.get_pair_reserves(token_a, token_b)
+        if reserves is not None:
+            reserve_a, reserve_b = reserves
+            pow10_a = _POW10.get(token_a, _WEI_PER_FLR)
+            pow10_b = _POW10.get(token_b, _WEI_PER_FLR)
+            amount_a_units = int(amount_a * pow10_a)
+            amount_b_units = amount_a_units * reserve_b // reserve_a
+            amount_b = amount_b_units / pow10_b
+            self.logger.debug(
+                "using_pool_reserves",
+                reserve_a=reserve_a,
+                reserve_b=reserve_b,
+                pair=f"{token_a}_{token_b}",
+            )
+        else:
+            # Fall back to the approximate hardcoded ratios if the pool
+            # is unreachable
+            ratio = _fallback_ratio(token_a, token_b)
+            self.logger.debug(
+                "using_fallback_ratio", ratio=ratio, pair=f"{token_a}_{token_b}"
+            )
+            amount_b = round(amount_a * ratio, _DECIMALS.get(token_b, 8))
+
+        self.logger.debug(
+            "calculated_amount",
+            amount=amount_b,
+            token=token_b,
+            amount_in=amount_a,
+            token_in=token_a,
+        )
 
-            return {"response": response_message, "transactions": transactions_json}
+        # Prepare add liquidity transaction(s)
+        if native:
+            liquidity_data = await blazeswap.prepare_add_liquidity_nat_transaction(
+                token=token_b,
+                amount_token=amount_b,
+                amount_flr=amount_a,
+                wallet_address=self.blockchain.address,
+                router_address=blazeswap.contracts["router"],
+            )
+            needs_approval_a = False
+            needs_approval_b = liquidity_data.get("needs_approval", False)
+            amount_a_min = liquidity_data["amount_flr_min"]
+            amount_b_min = liquidity_data["amount_token_min"]
+        else:
+            liquidity_data = await blazeswap.prepare_add_liquidity_transaction(
+                token_a=token_a,
+                token_b=token_b,
+                amount_a=amount_a,
+                amount_b=amount_b,
+                wallet_address=self.blockchain.address,
+                router_address=blazeswap.contracts["router"],
+            )
+            needs_approval_a = liquidity_data.get("needs_approval_a", False)
+            needs_approval_b = liquidity_data.get("needs_approval_b", False)
+            amount_a_min = liquidity_data["amount_a_min"]
+            amount_b_min = liquidity_data["amount_b_min"]
+
+        self.logger.debug(
+            "liquidity_data",
+            token_a=token_a,
+            amount_a=amount_a,
+            token_b=token_b,
+            amount_b=amount_b,
+            amount_a_min=amount_a_min,
+            amount_b_min=amount_b_min,
+        )
 
-        except Exception as e:
-            self.logger.exception(
-                "Error adding liquidity with native FLR", error=str(e)
+        # Convert transactions array to JSON string
+        transactions_json = _dumps(liquidity_data["transactions"])
+
+        # Build the response with one join instead of repeated string
+        # concatenation
+        num_approvals = int(needs_approval_a) + int(needs_approval_b)
+        lines = [
+            f"Ready to add liquidity with {amount_a} {token_a} and {amount_b:.6f} {token_b}.",
+            "",
+        ]
+        if num_approvals > 0:
+            lines.append(
+                f"This operation requires {num_approvals + 1} transactions:"
             )
-            return {"response": f"Error adding liquidity: {e!s}"}
+            if needs_approval_a:
+                lines.append(f"- Approve {token_a} for trading")
+            if needs_approval_b:
+                lines.append(f"- Approve {token_b} for trading")
+            lines += [f"- Add liquidity with {token_a} and {token_b}", ""]
+        lines += [
+            "Transaction details:",
+            f"- From: {self.blockchain.short_address}",
+            f"- {token_a} amount: {amount_a} (min: {amount_a_min})",
+            f"- {token_b} amount: {amount_b:.6f} (min: {amount_b_min})",
+            "",
+            f"Please confirm {'each transaction' if num_approvals > 0 else 'the transaction'} in your wallet.",
+        ]
+        response_message = "\n".join(lines)
+
+        return {"response": response_message, "transactions": transactions_json}
 
     async def handle_add_liquidity(self, message: str) -> dict[str, str]:
         """Handle adding liquidity with two tokens."""
@@ -864,11 +1090,11 @@ Supported tokens: USDC.E, USDT, WETH, FLX"""
             return {"response": WALLET_NOT_CONNECTED}
 
         try:
-            # Parse parameters from message
+            # Parse parameters from message in one regex pass
             # New format: pool add <amount> <token_a> <token_b>
             # Example: pool add 1 WFLR USDC.E
-            parts = message.split()
-            if len(parts) < 5:
+            match = _POOL_ADD_RE.match(message)
+            if match is None:
                 return {
                     "response": """Usage: pool add <amount> <token_a> <token_b>
 Example: pool add 1 WFLR USDC.E
@@ -877,133 +1103,44 @@ Example: pool add 100 FLX USDC.E
 Supported tokens: WFLR, USDC.E, USDT, WETH, FLX"""
                 }
 
-            amount_a = float(parts[2])
-            token_a = parts[3].upper()
-            token_b = parts[4].upper()
+            amount_a = float(match["amt"])
+            token_a = _norm(match["a"])
+            token_b = _norm(match["b"])
 
-            # Initialize BlazeSwap handler
-            blazeswap = BlazeSwapHandler(self.blockchain.w3.provider.endpoint_uri)
+            # Reuse the shared BlazeSwap handler
+            blazeswap = self.blazeswap
 
-            # Validate tokens
-            supported_tokens = list(blazeswap.tokens.keys())
-
-            # Special case: if either token is FLR, redirect to handle_add_liquidity_nat
+            # Special case: if either token is FLR, take the native path
+            # directly with the already-parsed values — no message-string
+            # rebuild, no second parse pass
             if token_a == "FLR":
-                return await self.handle_add_liquidity_nat(
-                    f"pool add {amount_a} FLR {token_b}"
-                )
+                return await self._do_add_liquidity_nat(amount_a, token_b)
 
             if token_b == "FLR":
-                return await self.handle_add_liquidity_nat(
-                    f"pool add {amount_a} FLR {token_a}"
-                )
+                return await self._do_add_liquidity_nat(amount_a, token_a)
 
             # Make sure both tokens are supported and neither is FLR
-            if token_a not in supported_tokens or token_a == "FLR":
+            if token_a not in self._supported_tokens or token_a == "FLR":
                 return {
-                    "response": f"Unsupported token A: {token_a}. Supported tokens: {', '.join([t for t in supported_tokens if t != 'FLR'])}"
+                    "response": f"Unsupported token A: {token_a}. Supported tokens: {self._nonflr_tokens_str}"
                 }
 
-            if token_b not in supported_tokens or token_b == "FLR":
+            if token_b not in self._supported_tokens or token_b == "FLR":
                 return {
-                    "response": f"Unsupported token B: {token_b}. Supported tokens: {', '.join([t for t in supported_tokens if t != 'FLR'])}"
+                    "response": f"Unsupported token B: {token_b}. Supported tokens: {self._nonflr_tokens_str}"
                 }
 
             # Special case for WFLR - make sure we're using the correct token address
             if token_a == "WFLR":
-                print(f"Debug - Using WFLR as token A: {blazeswap.tokens['WFLR']}")
+                self.logger.debug("using_wflr", side="A", address=blazeswap.tokens["WFLR"])
 
             if token_b == "WFLR":
-                print(f"Debug - Using WFLR as token B: {blazeswap.tokens['WFLR']}")
-
-            # Get token pair price to calculate the equivalent amount of token B
-            # This is a simplified approach - in a real implementation, you would query the pool for the current ratio
-            # For now, we'll use a hardcoded ratio for WFLR/USDC.E and default to 1:1 for other pairs
-            token_ratios = {
-                "WFLR_USDC.E": 0.06,  # 1 WFLR = 0.06 USDC.E (adjusted to realistic value)
-                "USDC.E_WFLR": 16.67,  # 1 USDC.E = 16.67 WFLR
-                "WFLR_FLX": 0.135,  # Approximate ratio (adjusted)
-                "FLX_WFLR": 7.4,  # Approximate ratio (adjusted)
-            }
-
-            # Determine the pair key
-            pair_key = f"{token_a}_{token_b}"
-            reverse_pair_key = f"{token_b}_{token_a}"
-
-            # Calculate amount_b based on the ratio
-            amount_b = 0
-            if pair_key in token_ratios:
-                amount_b = amount_a * token_ratios[pair_key]
-                print(f"Debug - Using ratio {token_ratios[pair_key]} for {pair_key}")
-            elif reverse_pair_key in token_ratios:
-                amount_b = amount_a / token_ratios[reverse_pair_key]
-                print(
-                    f"Debug - Using inverse ratio 1/{token_ratios[reverse_pair_key]} for {reverse_pair_key}"
-                )
-            else:
-                # Default to 1:1 ratio if we don't have a specific ratio
-                amount_b = amount_a
-                print(f"Debug - Using default 1:1 ratio for {pair_key}")
-
-            # Round to appropriate decimal places based on token
-            if token_b.upper() == "USDC.E":
-                amount_b = round(amount_b, 6)  # USDC.E has 6 decimals
-            else:
-                amount_b = round(
-                    amount_b, 8
-                )  # Other tokens use 8 decimal places for display
-
-            print(f"Debug - Calculated {amount_b} {token_b} for {amount_a} {token_a}")
-
-            # Prepare add liquidity transaction
-            liquidity_data = await blazeswap.prepare_add_liquidity_transaction(
-                token_a=token_a,
-                token_b=token_b,
-                amount_a=amount_a,
-                amount_b=amount_b,
-                wallet_address=self.blockchain.address,
-                router_address=blazeswap.contracts["router"],
-            )
+                self.logger.debug("using_wflr", side="B", address=blazeswap.tokens["WFLR"])
 
-            # Print debug information about the transaction
-            print(
-                f"Debug - Liquidity data: token_a={token_a}, amount_a={amount_a}, token_b={token_b}, amount_b={amount_b}"
-            )
-            print(
-                f"Debug - Min amounts: token_a_min={liquidity_data.get('amount_a_min', 'N/A')}, token_b_min={liquidity_data.get('amount_b_min', 'N/A')}"
+            return await self._add_liquidity_core(
+                amount_a, token_a, token_b, native=False
             )
 
-            # Convert transactions array to JSON string
-            transactions_json = json.dumps(liquidity_data["transactions"])
-            print(f"Debug - Transactions JSON: {transactions_json[:100]}...")
-
-            # Build response message
-            response_message = f"Ready to add liquidity with {amount_a} {token_a} and {amount_b:.6f} {token_b}.\n\n"
-
-            num_approvals = 0
-            if liquidity_data.get("needs_approval_a", False):
-                num_approvals += 1
-            if liquidity_data.get("needs_approval_b", False):
-                num_approvals += 1
-
-            if num_approvals > 0:
-                response_message += (
-                    f"This operation requires {num_approvals + 1} transactions:\n"
-                )
-                if liquidity_data.get("needs_approval_a", False):
-                    response_message += f"- Approve {token_a} for trading\n"
-                if liquidity_data.get("needs_approval_b", False):
-                    response_message += f"- Approve {token_b} for trading\n"
-                response_message += f"- Add liquidity with {token_a} and {token_b}\n\n"
-
-            response_message += "Transaction details:\n"
-            response_message += f"- From: {self.blockchain.address[:6]}...{self.blockchain.address[-4:]}\n"
-            response_message += f"- {token_a} amount: {amount_a} (min: {liquidity_data['amount_a_min']})\n"
-            response_message += f"- {token_b} amount: {amount_b:.6f} (min: {liquidity_data['amount_b_min']})\n\n"
-            response_message += f"Please confirm {'each transaction' if num_approvals > 0 else 'the transaction'} in your wallet."
-
-            return {"response": response_message, "transactions": transactions_json}
-
         except Exception as e:
-            self.logger.exception("Error adding liquidity", error=str(e))
+            self.logger.exception("Error adding liquidity")
             return {"response": f"Error adding liquidity: {e!s}"}
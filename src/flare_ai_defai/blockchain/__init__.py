@@ -1,8 +1,14 @@
-from .blazeswap import BlazeSwapHandler
+from .blazeswap import (
+    SUPPORTED_TOKENS,
+    SUPPORTED_TOKENS_NO_FLR_CSV,
+    BlazeSwapHandler,
+)
 from .flare import FlareProvider
 from .sflr_staking import get_sflr_balance, parse_stake_command, stake_flr_to_sflr
 
 __all__ = [
+    "SUPPORTED_TOKENS",
+    "SUPPORTED_TOKENS_NO_FLR_CSV",
     "BlazeSwapHandler",
     "FlareProvider",
     "get_sflr_balance",
@@ -1,6 +1,41 @@
 """
 Contract ABI definitions for blockchain interactions.
+
+ABIs live as JSON resources next to this module and are parsed lazily on
+first use, so importing the package stays cheap and ABIs that are never
+used never occupy the interpreter heap.
 """
 
-from .blazeswap_router import BLAZESWAP_ROUTER_ABI
-from .sflr import SFLR_ABI
+import json
+from functools import cache
+from importlib import resources
+from typing import Any
+
+# Historical constant name -> JSON resource stem
+_ABI_RESOURCES = {
+    "SFLR_ABI": "sflr",
+    "BLAZESWAP_ROUTER_ABI": "blazeswap_router",
+}
+
+
+@cache
+def load_abi(name: str) -> list[dict[str, Any]]:
+    """Load and cache the named ABI JSON resource.
+
+    Args:
+        name: Resource stem, e.g. "sflr" for sflr.json
+
+    Returns:
+        The parsed ABI
+    """
+    path = resources.files(__package__).joinpath(f"{name}.json")
+    return json.loads(path.read_bytes())
+
+
+def __getattr__(attr: str) -> list[dict[str, Any]]:
+    # Keep the historical module-level constants (SFLR_ABI, ...) working
+    # without parsing any JSON until they are first touched
+    resource = _ABI_RESOURCES.get(attr)
+    if resource is None:
+        raise AttributeError(attr)
+    return load_abi(resource)
@@ -1,68 +0,0 @@
-"""
-BlazeSwap Router ABI Module
-
-This module provides the ABI for the BlazeSwap router contract on Flare Network.
-"""
-
-# BlazeSwap router contract ABI with focus on liquidity functions
-BLAZESWAP_ROUTER_ABI = [
-    {
-        "inputs": [
-            {"internalType": "address", "name": "token", "type": "address"},
-            {
-                "internalType": "uint256",
-                "name": "amountTokenDesired",
-                "type": "uint256",
-            },
-            {"internalType": "uint256", "name": "amountTokenMin", "type": "uint256"},
-            {"internalType": "uint256", "name": "amountNATMin", "type": "uint256"},
-            {"internalType": "uint256", "name": "feeBipsToken", "type": "uint256"},
-            {"internalType": "address", "name": "to", "type": "address"},
-            {"internalType": "uint256", "name": "deadline", "type": "uint256"},
-        ],
-        "name": "addLiquidityNAT",
-        "outputs": [
-            {"internalType": "uint256", "name": "amountToken", "type": "uint256"},
-            {"internalType": "uint256", "name": "amountNAT", "type": "uint256"},
-            {"internalType": "uint256", "name": "liquidity", "type": "uint256"},
-        ],
-        "stateMutability": "payable",
-        "type": "function",
-    },
-    {
-        "inputs": [
-            {"internalType": "address", "name": "tokenA", "type": "address"},
-            {"internalType": "address", "name": "tokenB", "type": "address"},
-            {"internalType": "uint256", "name": "amountADesired", "type": "uint256"},
-            {"internalType": "uint256", "name": "amountBDesired", "type": "uint256"},
-            {"internalType": "uint256", "name": "amountAMin", "type": "uint256"},
-            {"internalType": "uint256", "name": "amountBMin", "type": "uint256"},
-            {"internalType": "uint256", "name": "feeBipsA", "type": "uint256"},
-            {"internalType": "uint256", "name": "feeBipsB", "type": "uint256"},
-            {"internalType": "address", "name": "to", "type": "address"},
-            {"internalType": "uint256", "name": "deadline", "type": "uint256"},
-        ],
-        "name": "addLiquidity",
-        "outputs": [
-            {"internalType": "uint256", "name": "amountA", "type": "uint256"},
-            {"internalType": "uint256", "name": "amountB", "type": "uint256"},
-            {"internalType": "uint256", "name": "liquidity", "type": "uint256"},
-        ],
-        "stateMutability": "nonpayable",
-        "type": "function",
-    },
-    {
-        "inputs": [],
-        "name": "factory",
-        "outputs": [{"internalType": "address", "name": "", "type": "address"}],
-        "stateMutability": "view",
-        "type": "function",
-    },
-    {
-        "inputs": [],
-        "name": "wNat",
-        "outputs": [{"internalType": "address", "name": "", "type": "address"}],
-        "stateMutability": "view",
-        "type": "function",
-    },
-]
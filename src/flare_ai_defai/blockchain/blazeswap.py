@@ -1,303 +1,966 @@
+import asyncio
+import functools
 import time
+from decimal import Decimal
 from typing import Any
 
+import structlog
 from web3 import Web3
 
-
-class BlazeSwapHandler:
-    def __init__(self, web3_provider_url: str):
-        self.w3 = Web3(Web3.HTTPProvider(web3_provider_url))
-
-        # Check if we're on mainnet or testnet
-        chain_id = self.w3.eth.chain_id
-        if chain_id == 14:  # Flare mainnet
-            # Mainnet addresses
-            self.contracts = {
-                "router": "0xe3A1b355ca63abCBC9589334B5e609583C7BAa06",  # BlazeSwap Router on Flare
-                "factory": "0x440602f459D7Dd500a74528003e6A20A46d6e2A6",  # BlazeSwap Factory on Flare
-            }
-            self.tokens = {
-                "FLR": "native",
-                "WFLR": "0x1D80c49BbBCd1C0911346656B529DF9E5c2F783d",  # Wrapped FLR on mainnet
-                "USDC.E": "0xFbDa5F676cB37624f28265A144A48B0d6e87d3b6",  # USDC.e on Flare
-                "USDT": "0x0B38e83B86d491735fEaa0a791F65c2B99535396",  # USDT on Flare
-                "WETH": "0x1502FA4be69d526124D453619276FacCab275d3D",  # WETH on Flare
-                "FLX": "0x22757fb83836e3F9F0F353126cACD3B1Dc82a387",  # FlareFox token
-            }
-            # Token decimals
-            self.token_decimals = {
-                "FLR": 18,
-                "WFLR": 18,
-                "USDC.E": 6,
-                "USDT": 6,
-                "WETH": 18,
-                "FLX": 18,
-            }
-        else:
-            # Coston2 testnet addresses
-            self.contracts = {
-                "router": "0xe3A1b355ca63abCBC9589334B5e609583C7BAa06",  # BlazeSwap Router on Coston2
-                "factory": "0x440602f459D7Dd500a74528003e6A20A46d6e2A6",  # BlazeSwap Factory on Coston2
-            }
-            self.tokens = {
-                "C2FLR": "native",
-                "WC2FLR": "0xC67DCE33D7A8efA5FfEB961899C73fe01bCe9273",  # Wrapped C2FLR
-                "FLX": "0x22757fb83836e3F9F0F353126cACD3B1Dc82a387",  # FlareFox token
-            }
-            # Token decimals
-            self.token_decimals = {"C2FLR": 18, "WC2FLR": 18, "FLX": 18}
-
-        # Convert contract addresses to checksum addresses
-        self.contracts["router"] = self.w3.to_checksum_address(self.contracts["router"])
-        self.contracts["factory"] = self.w3.to_checksum_address(
-            self.contracts["factory"]
-        )
-
-        # Convert token addresses to checksum addresses (except "native")
-        for token, address in self.tokens.items():
-            if address != "native":
-                self.tokens[token] = self.w3.to_checksum_address(address)
-
-        print(f"Debug - Router address: {self.contracts['router']}")
-        print(f"Debug - Factory address: {self.contracts['factory']}")
-        print(f"Debug - Token addresses: {self.tokens}")
-
-        # ERC20 ABI (for approvals)
-        self.erc20_abi = [
-            {
-                "constant": True,
-                "inputs": [
-                    {"name": "owner", "type": "address"},
-                    {"name": "spender", "type": "address"},
-                ],
-                "name": "allowance",
-                "outputs": [{"name": "", "type": "uint256"}],
-                "payable": False,
-                "stateMutability": "view",
-                "type": "function",
-            },
-            {
-                "constant": False,
-                "inputs": [
-                    {"name": "spender", "type": "address"},
-                    {"name": "amount", "type": "uint256"},
-                ],
-                "name": "approve",
-                "outputs": [{"name": "", "type": "bool"}],
-                "payable": False,
-                "stateMutability": "nonpayable",
-                "type": "function",
-            },
-        ]
-
-        # BlazeSwap Router ABI
-        self.router_abi = [
+from .session import pooled_session
+from .tx_utils import hexify_tx as _hexify_tx
+
+logger = structlog.get_logger(__name__)
+
+# Pool ratios are memoized per this many blocks (~10 minutes on Flare's
+# ~2s blocks) so repeated pool commands cost one RPC per pair per interval
+RATIO_BLOCK_INTERVAL = 300
+
+# Canonical Multicall3 deployment (same address on Flare and Coston2)
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Fee readings stay valid well within one ~2s Flare block, so repeated
+# transaction builds inside this window skip the fee RPCs entirely
+FEE_CACHE_TTL = 1.5
+
+# Allowances only change when the user signs an approval, so a short
+# cache lets repeated add-liquidity preps skip the allowance reads
+ALLOWANCE_CACHE_TTL = 30.0
+
+# Router method, whether value carries the input amount, and gas limit
+# for each swap shape
+SWAP_METHODS = {
+    "nat_to_token": ("swapExactNATForTokens", True, 3_000_000),
+    "token_to_nat": ("swapExactTokensForNAT", False, 300_000),
+    "token_to_token": ("swapExactTokensForTokens", False, 300_000),
+}
+
+# WNat.deposit() has a fixed shape (~45k gas on Flare); a constant limit
+# with headroom saves an eth_estimateGas round-trip per wrap
+WFLR_DEPOSIT_GAS = 60000
+
+# How long a block-bucket observation may be reused for local quoting.
+# Buckets span RATIO_BLOCK_INTERVAL blocks (~10 minutes), so a 60s-old
+# observation almost always still names the current bucket; when it
+# doesn't, the cache misses and the on-chain quote is used instead
+BUCKET_GUESS_TTL = 60.0
+
+# Wei per native FLR; multiplying by this directly skips to_wei's
+# Decimal parsing and unit-string lookup on every conversion
+_ETHER = 10**18
+
+# Powers of ten indexed by decimals; a tuple index beats bignum
+# exponentiation on every ratio/scale computation
+_POW10 = tuple(10**i for i in range(31))
+
+
+@functools.lru_cache(maxsize=4096)
+def _checksum(address: str) -> str:
+    """Checksum an address, memoized (each call runs a keccak256)."""
+    return Web3.to_checksum_address(address)
+
+
+# Per-network contract and token tables, built once at import instead of
+# as dict literals per handler instance
+MAINNET_CONTRACTS = {
+    "router": "0xe3A1b355ca63abCBC9589334B5e609583C7BAa06",  # BlazeSwap Router on Flare
+    "factory": "0x440602f459D7Dd500a74528003e6A20A46d6e2A6",  # BlazeSwap Factory on Flare
+}
+MAINNET_TOKENS = {
+    "FLR": "native",
+    "WFLR": "0x1D80c49BbBCd1C0911346656B529DF9E5c2F783d",  # Wrapped FLR on mainnet
+    "USDC.E": "0xFbDa5F676cB37624f28265A144A48B0d6e87d3b6",  # USDC.e on Flare
+    "USDT": "0x0B38e83B86d491735fEaa0a791F65c2B99535396",  # USDT on Flare
+    "WETH": "0x1502FA4be69d526124D453619276FacCab275d3D",  # WETH on Flare
+    "FLX": "0x22757fb83836e3F9F0F353126cACD3B1Dc82a387",  # FlareFox token
+}
+MAINNET_TOKEN_DECIMALS = {
+    "FLR": 18,
+    "WFLR": 18,
+    "USDC.E": 6,
+    "USDT": 6,
+    "WETH": 18,
+    "FLX": 18,
+}
+
+COSTON2_CONTRACTS = {
+    "router": "0xe3A1b355ca63abCBC9589334B5e609583C7BAa06",  # BlazeSwap Router on Coston2
+    "factory": "0x440602f459D7Dd500a74528003e6A20A46d6e2A6",  # BlazeSwap Factory on Coston2
+}
+COSTON2_TOKENS = {
+    "C2FLR": "native",
+    "WC2FLR": "0xC67DCE33D7A8efA5FfEB961899C73fe01bCe9273",  # Wrapped C2FLR
+    "FLX": "0x22757fb83836e3F9F0F353126cACD3B1Dc82a387",  # FlareFox token
+}
+COSTON2_TOKEN_DECIMALS = {"C2FLR": 18, "WC2FLR": 18, "FLX": 18}
+
+# Mainnet symbol set, frozen for O(1) membership checks by callers
+SUPPORTED_TOKENS = frozenset(MAINNET_TOKENS)
+SUPPORTED_TOKENS_NO_FLR_CSV = ", ".join(sorted(SUPPORTED_TOKENS - {"FLR"}))
+
+# Contract ABIs, built once at import and shared by every handler
+# instance; the contract cache keys on ABI identity, so sharing these
+# objects also lets instances share compiled contract factories
+# ERC20 ABI (allowance/approve/balanceOf)
+_ERC20_ABI = [
+    {
+        "constant": True,
+        "inputs": [
+            {"name": "owner", "type": "address"},
+            {"name": "spender", "type": "address"},
+        ],
+        "name": "allowance",
+        "outputs": [{"name": "", "type": "uint256"}],
+        "payable": False,
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "constant": False,
+        "inputs": [
+            {"name": "spender", "type": "address"},
+            {"name": "amount", "type": "uint256"},
+        ],
+        "name": "approve",
+        "outputs": [{"name": "", "type": "bool"}],
+        "payable": False,
+        "stateMutability": "nonpayable",
+        "type": "function",
+    },
+    {
+        "constant": True,
+        "inputs": [{"name": "owner", "type": "address"}],
+        "name": "balanceOf",
+        "outputs": [{"name": "", "type": "uint256"}],
+        "payable": False,
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
+# Multicall3 ABI (batching view calls into one round-trip)
+_MULTICALL3_ABI = [
+    {
+        "inputs": [
             {
-                "inputs": [
-                    {"internalType": "address", "name": "_factory", "type": "address"},
-                    {"internalType": "address", "name": "_wNat", "type": "address"},
-                    {"internalType": "bool", "name": "_splitFee", "type": "bool"},
-                ],
-                "stateMutability": "nonpayable",
-                "type": "constructor",
-            },
-            {
-                "inputs": [
-                    {"internalType": "address", "name": "tokenA", "type": "address"},
-                    {"internalType": "address", "name": "tokenB", "type": "address"},
+                "components": [
                     {
-                        "internalType": "uint256",
-                        "name": "amountADesired",
-                        "type": "uint256",
+                        "internalType": "address",
+                        "name": "target",
+                        "type": "address",
                     },
                     {
-                        "internalType": "uint256",
-                        "name": "amountBDesired",
-                        "type": "uint256",
+                        "internalType": "bool",
+                        "name": "allowFailure",
+                        "type": "bool",
                     },
                     {
-                        "internalType": "uint256",
-                        "name": "amountAMin",
-                        "type": "uint256",
+                        "internalType": "bytes",
+                        "name": "callData",
+                        "type": "bytes",
                     },
-                    {
-                        "internalType": "uint256",
-                        "name": "amountBMin",
-                        "type": "uint256",
-                    },
-                    {"internalType": "uint256", "name": "feeBipsA", "type": "uint256"},
-                    {"internalType": "uint256", "name": "feeBipsB", "type": "uint256"},
-                    {"internalType": "address", "name": "to", "type": "address"},
-                    {"internalType": "uint256", "name": "deadline", "type": "uint256"},
-                ],
-                "name": "addLiquidity",
-                "outputs": [
-                    {"internalType": "uint256", "name": "amountA", "type": "uint256"},
-                    {"internalType": "uint256", "name": "amountB", "type": "uint256"},
-                    {"internalType": "uint256", "name": "liquidity", "type": "uint256"},
                 ],
-                "stateMutability": "nonpayable",
-                "type": "function",
-            },
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
             {
-                "inputs": [
-                    {"internalType": "address", "name": "token", "type": "address"},
-                    {
-                        "internalType": "uint256",
-                        "name": "amountTokenDesired",
-                        "type": "uint256",
-                    },
+                "components": [
                     {
-                        "internalType": "uint256",
-                        "name": "amountTokenMin",
-                        "type": "uint256",
+                        "internalType": "bool",
+                        "name": "success",
+                        "type": "bool",
                     },
                     {
-                        "internalType": "uint256",
-                        "name": "amountNATMin",
-                        "type": "uint256",
+                        "internalType": "bytes",
+                        "name": "returnData",
+                        "type": "bytes",
                     },
-                    {
-                        "internalType": "uint256",
-                        "name": "feeBipsToken",
-                        "type": "uint256",
-                    },
-                    {"internalType": "address", "name": "to", "type": "address"},
-                    {"internalType": "uint256", "name": "deadline", "type": "uint256"},
-                ],
-                "name": "addLiquidityNAT",
-                "outputs": [
-                    {
-                        "internalType": "uint256",
-                        "name": "amountToken",
-                        "type": "uint256",
-                    },
-                    {"internalType": "uint256", "name": "amountNAT", "type": "uint256"},
-                    {"internalType": "uint256", "name": "liquidity", "type": "uint256"},
                 ],
-                "stateMutability": "payable",
-                "type": "function",
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+]
+
+# BlazeSwap Router ABI
+_ROUTER_ABI = [
+    {
+        "inputs": [
+            {"internalType": "address", "name": "_factory", "type": "address"},
+            {"internalType": "address", "name": "_wNat", "type": "address"},
+            {"internalType": "bool", "name": "_splitFee", "type": "bool"},
+        ],
+        "stateMutability": "nonpayable",
+        "type": "constructor",
+    },
+    {
+        "inputs": [
+            {"internalType": "address", "name": "tokenA", "type": "address"},
+            {"internalType": "address", "name": "tokenB", "type": "address"},
+            {
+                "internalType": "uint256",
+                "name": "amountADesired",
+                "type": "uint256",
             },
             {
-                "inputs": [
-                    {"internalType": "uint256", "name": "amountIn", "type": "uint256"},
-                    {"internalType": "address[]", "name": "path", "type": "address[]"},
-                ],
-                "name": "getAmountsOut",
-                "outputs": [
-                    {
-                        "internalType": "uint256[]",
-                        "name": "amounts",
-                        "type": "uint256[]",
-                    }
-                ],
-                "stateMutability": "view",
-                "type": "function",
+                "internalType": "uint256",
+                "name": "amountBDesired",
+                "type": "uint256",
             },
             {
-                "inputs": [
-                    {
-                        "internalType": "uint256",
-                        "name": "amountOutMin",
-                        "type": "uint256",
-                    },
-                    {"internalType": "address[]", "name": "path", "type": "address[]"},
-                    {"internalType": "address", "name": "to", "type": "address"},
-                    {"internalType": "uint256", "name": "deadline", "type": "uint256"},
-                ],
-                "name": "swapExactNATForTokens",
-                "outputs": [
-                    {
-                        "internalType": "uint256[]",
-                        "name": "amountsSent",
-                        "type": "uint256[]",
-                    },
-                    {
-                        "internalType": "uint256[]",
-                        "name": "amountsRecv",
-                        "type": "uint256[]",
-                    },
-                ],
-                "stateMutability": "payable",
-                "type": "function",
+                "internalType": "uint256",
+                "name": "amountAMin",
+                "type": "uint256",
             },
             {
-                "inputs": [
-                    {
-                        "internalType": "uint256",
-                        "name": "amountOutMin",
-                        "type": "uint256",
-                    },
-                    {"internalType": "address[]", "name": "path", "type": "address[]"},
-                    {"internalType": "address", "name": "to", "type": "address"},
-                    {"internalType": "uint256", "name": "deadline", "type": "uint256"},
-                ],
-                "name": "swapExactTokensForTokens",
-                "outputs": [
-                    {
-                        "internalType": "uint256[]",
-                        "name": "amountsSent",
-                        "type": "uint256[]",
-                    },
-                    {
-                        "internalType": "uint256[]",
-                        "name": "amountsRecv",
-                        "type": "uint256[]",
-                    },
-                ],
-                "stateMutability": "nonpayable",
-                "type": "function",
+                "internalType": "uint256",
+                "name": "amountBMin",
+                "type": "uint256",
             },
+            {"internalType": "uint256", "name": "feeBipsA", "type": "uint256"},
+            {"internalType": "uint256", "name": "feeBipsB", "type": "uint256"},
+            {"internalType": "address", "name": "to", "type": "address"},
+            {"internalType": "uint256", "name": "deadline", "type": "uint256"},
+        ],
+        "name": "addLiquidity",
+        "outputs": [
+            {"internalType": "uint256", "name": "amountA", "type": "uint256"},
+            {"internalType": "uint256", "name": "amountB", "type": "uint256"},
+            {"internalType": "uint256", "name": "liquidity", "type": "uint256"},
+        ],
+        "stateMutability": "nonpayable",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {"internalType": "address", "name": "token", "type": "address"},
             {
-                "inputs": [
-                    {
-                        "internalType": "uint256",
-                        "name": "amountOutMin",
-                        "type": "uint256",
-                    },
-                    {"internalType": "address[]", "name": "path", "type": "address[]"},
-                    {"internalType": "address", "name": "to", "type": "address"},
-                    {"internalType": "uint256", "name": "deadline", "type": "uint256"},
-                ],
-                "name": "swapExactTokensForNAT",
-                "outputs": [
-                    {
-                        "internalType": "uint256[]",
-                        "name": "amountsSent",
-                        "type": "uint256[]",
-                    },
-                    {
-                        "internalType": "uint256[]",
-                        "name": "amountsRecv",
-                        "type": "uint256[]",
-                    },
-                ],
-                "stateMutability": "nonpayable",
-                "type": "function",
+                "internalType": "uint256",
+                "name": "amountTokenDesired",
+                "type": "uint256",
             },
-        ]
-
-        # Add WFLR ABI at the top with other ABIs
-        self.wflr_abi = [
             {
-                "constant": False,
-                "inputs": [],
-                "name": "deposit",
-                "outputs": [],
-                "payable": True,
-                "stateMutability": "payable",
-                "type": "function",
+                "internalType": "uint256",
+                "name": "amountTokenMin",
+                "type": "uint256",
+            },
+            {
+                "internalType": "uint256",
+                "name": "amountNATMin",
+                "type": "uint256",
+            },
+            {
+                "internalType": "uint256",
+                "name": "feeBipsToken",
+                "type": "uint256",
+            },
+            {"internalType": "address", "name": "to", "type": "address"},
+            {"internalType": "uint256", "name": "deadline", "type": "uint256"},
+        ],
+        "name": "addLiquidityNAT",
+        "outputs": [
+            {
+                "internalType": "uint256",
+                "name": "amountToken",
+                "type": "uint256",
+            },
+            {"internalType": "uint256", "name": "amountNAT", "type": "uint256"},
+            {"internalType": "uint256", "name": "liquidity", "type": "uint256"},
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {"internalType": "uint256", "name": "amountIn", "type": "uint256"},
+            {"internalType": "address[]", "name": "path", "type": "address[]"},
+        ],
+        "name": "getAmountsOut",
+        "outputs": [
+            {
+                "internalType": "uint256[]",
+                "name": "amounts",
+                "type": "uint256[]",
+            }
+        ],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {
+                "internalType": "uint256",
+                "name": "amountOutMin",
+                "type": "uint256",
+            },
+            {"internalType": "address[]", "name": "path", "type": "address[]"},
+            {"internalType": "address", "name": "to", "type": "address"},
+            {"internalType": "uint256", "name": "deadline", "type": "uint256"},
+        ],
+        "name": "swapExactNATForTokens",
+        "outputs": [
+            {
+                "internalType": "uint256[]",
+                "name": "amountsSent",
+                "type": "uint256[]",
+            },
+            {
+                "internalType": "uint256[]",
+                "name": "amountsRecv",
+                "type": "uint256[]",
+            },
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {
+                "internalType": "uint256",
+                "name": "amountOutMin",
+                "type": "uint256",
+            },
+            {"internalType": "address[]", "name": "path", "type": "address[]"},
+            {"internalType": "address", "name": "to", "type": "address"},
+            {"internalType": "uint256", "name": "deadline", "type": "uint256"},
+        ],
+        "name": "swapExactTokensForTokens",
+        "outputs": [
+            {
+                "internalType": "uint256[]",
+                "name": "amountsSent",
+                "type": "uint256[]",
             },
             {
-                "constant": False,
-                "inputs": [{"name": "wad", "type": "uint256"}],
-                "name": "withdraw",
-                "outputs": [],
-                "payable": False,
-                "stateMutability": "nonpayable",
-                "type": "function",
+                "internalType": "uint256[]",
+                "name": "amountsRecv",
+                "type": "uint256[]",
             },
+        ],
+        "stateMutability": "nonpayable",
+        "type": "function",
+    },
+    {
+        "inputs": [
+            {
+                "internalType": "uint256",
+                "name": "amountOutMin",
+                "type": "uint256",
+            },
+            {"internalType": "address[]", "name": "path", "type": "address[]"},
+            {"internalType": "address", "name": "to", "type": "address"},
+            {"internalType": "uint256", "name": "deadline", "type": "uint256"},
+        ],
+        "name": "swapExactTokensForNAT",
+        "outputs": [
+            {
+                "internalType": "uint256[]",
+                "name": "amountsSent",
+                "type": "uint256[]",
+            },
+            {
+                "internalType": "uint256[]",
+                "name": "amountsRecv",
+                "type": "uint256[]",
+            },
+        ],
+        "stateMutability": "nonpayable",
+        "type": "function",
+    },
+]
+
+# BlazeSwap Factory ABI
+_FACTORY_ABI = [
+    {
+        "inputs": [
+            {"internalType": "address", "name": "tokenA", "type": "address"},
+            {"internalType": "address", "name": "tokenB", "type": "address"},
+        ],
+        "name": "getPair",
+        "outputs": [
+            {"internalType": "address", "name": "pair", "type": "address"}
+        ],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
+# BlazeSwap Pair ABI
+_PAIR_ABI = [
+    {
+        "inputs": [],
+        "name": "getReserves",
+        "outputs": [
+            {"internalType": "uint112", "name": "reserve0", "type": "uint112"},
+            {"internalType": "uint112", "name": "reserve1", "type": "uint112"},
+            {
+                "internalType": "uint32",
+                "name": "blockTimestampLast",
+                "type": "uint32",
+            },
+        ],
+        "stateMutability": "view",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "token0",
+        "outputs": [
+            {"internalType": "address", "name": "", "type": "address"}
+        ],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
+# WFLR ABI (wrap/unwrap)
+_WFLR_ABI = [
+    {
+        "constant": False,
+        "inputs": [],
+        "name": "deposit",
+        "outputs": [],
+        "payable": True,
+        "stateMutability": "payable",
+        "type": "function",
+    },
+    {
+        "constant": False,
+        "inputs": [{"name": "wad", "type": "uint256"}],
+        "name": "withdraw",
+        "outputs": [],
+        "payable": False,
+        "stateMutability": "nonpayable",
+        "type": "function",
+    },
+]
+
+
+
+class BlazeSwapHandler:
+    def __init__(self, web3_provider_url: str):
+        # Shared keep-alive session so repeat RPCs reuse one TCP/TLS
+        # connection instead of handshaking per request
+        self.w3 = Web3(
+            Web3.HTTPProvider(web3_provider_url, session=pooled_session())
+        )
+
+        # Check if we're on mainnet or testnet; the instance copies the
+        # module-level tables since the addresses get checksummed below
+        chain_id = self.w3.eth.chain_id
+        # chain id never changes for a provider; reuse it for every
+        # build_transaction instead of re-querying per transaction
+        self._chain_id = chain_id
+        if chain_id == 14:  # Flare mainnet
+            self.contracts = dict(MAINNET_CONTRACTS)
+            self.tokens = dict(MAINNET_TOKENS)
+            self.token_decimals = MAINNET_TOKEN_DECIMALS
+        else:
+            self.contracts = dict(COSTON2_CONTRACTS)
+            self.tokens = dict(COSTON2_TOKENS)
+            self.token_decimals = COSTON2_TOKEN_DECIMALS
+
+        # Precomputed 10**decimals per symbol for unit conversions
+        self._decimal_pow = {
+            sym: _POW10[dec] for sym, dec in self.token_decimals.items()
+        }
+
+        # Convert contract addresses to checksum addresses
+        self.contracts["router"] = _checksum(self.contracts["router"])
+        self.contracts["factory"] = _checksum(self.contracts["factory"])
+
+        # Convert token addresses to checksum addresses (except "native")
+        for token, address in self.tokens.items():
+            if address != "native":
+                self.tokens[token] = _checksum(address)
+
+        # Membership set and the user-facing token list are immutable
+        # after init, so build them once instead of joining dict keys on
+        # every unsupported-token error path
+        self._supported = frozenset(self.tokens)
+        self._supported_str = ", ".join(self.tokens.keys())
+
+        # Invariant relied on below: every non-native entry in
+        # self.tokens is checksummed from here on, so lookups can be
+        # used directly without re-checksumming
+        for symbol, addr in self.tokens.items():
+            if addr != "native" and addr != _checksum(addr):
+                msg = f"token address for {symbol} is not checksummed: {addr}"
+                raise ValueError(msg)
+
+        logger.debug(
+            "blazeswap_initialized",
+            router=self.contracts["router"],
+            factory=self.contracts["factory"],
+            tokens=self.tokens,
+        )
+
+        # ABIs are module-level constants shared across instances; the
+        # instance attributes are kept for callers that reference them
+        self.erc20_abi = _ERC20_ABI
+        self.multicall3_abi = _MULTICALL3_ABI
+        self.router_abi = _ROUTER_ABI
+        self.factory_abi = _FACTORY_ABI
+        self.pair_abi = _PAIR_ABI
+        self.wflr_abi = _WFLR_ABI
+
+        # Pool-reserves cache keyed by (addr_a, addr_b, block bucket)
+        self._reserves_cache: dict[
+            tuple[str, str, int], tuple[int, int] | None
+        ] = {}
+
+        # Contract objects keyed by (address, abi identity); web3's
+        # contract factory re-validates the ABI schema on every call, so
+        # hot paths reuse these instead of rebuilding
+        self._contract_cache: dict[tuple[str, int], Any] = {}
+
+        # (timestamp, gas_price, max_priority_fee) refreshed together
+        self._fee_cache: tuple[float, int, int] = (0.0, 0, 0)
+
+        # Allowances keyed by (token, owner, spender) with their fetch
+        # timestamp; consulted before issuing allowance reads
+        self._allowance_cache: dict[tuple[str, str, str], tuple[int, float]] = {}
+
+        # Last observed (block bucket, timestamp) from a reserves fetch,
+        # letting swap quoting consult the reserves cache without an RPC
+        self._bucket_cache: tuple[int, float] = (-1, 0.0)
+
+        # Address-less ERC20 contract used purely for calldata encoding;
+        # building it once avoids an ABI walk per encode site
+        self._erc20_codec = self.w3.eth.contract(abi=self.erc20_abi)
+
+        # Warm the contract cache with the objects every hot path needs,
+        # so the first user request doesn't pay the ABI compilation cost
+        self._contract(self.contracts["router"], self.router_abi)
+        self._contract(self.contracts["factory"], self.factory_abi)
+        self._contract(_checksum(MULTICALL3_ADDRESS), self.multicall3_abi)
+        for address in self.tokens.values():
+            if address != "native":
+                self._contract(address, self.erc20_abi)
+        if "WFLR" in self.tokens:
+            wflr = self._contract(self.tokens["WFLR"], self.wflr_abi)
+            # deposit() takes no arguments, so its calldata is constant;
+            # encode it once and skip ABI serialization on every wrap
+            self._wflr_deposit_calldata = wflr.encode_abi("deposit", args=[])
+
+    def _contract(self, address: str, abi: list[dict[str, Any]]) -> Any:
+        """Return a cached Contract object for (address, ABI).
+
+        Args:
+            address: Checksummed contract address
+            abi: ABI list (identity-keyed, so use the instance ABIs)
+
+        Returns:
+            The cached web3 Contract
+        """
+        key = (address, id(abi))
+        contract = self._contract_cache.get(key)
+        if contract is None:
+            contract = self.w3.eth.contract(address=address, abi=abi)
+            self._contract_cache[key] = contract
+        return contract
+
+    async def get_pair_reserves(
+        self, token_a: str, token_b: str
+    ) -> tuple[int, int] | None:
+        """Get the pair's raw reserves, ordered as (reserve_a, reserve_b).
+
+        Reserves are integers in each token's smallest unit, so callers
+        can derive amounts with exact integer arithmetic. The result is
+        memoized per (pair, block interval) so every `pool add` command
+        within the interval reuses one reserves fetch. FLR is priced via
+        its WFLR pool.
+
+        Args:
+            token_a: Input token symbol
+            token_b: Output token symbol
+
+        Returns:
+            (reserve_a, reserve_b), or None if no pool exists for the pair
+        """
+        token_a = token_a.upper()
+        token_b = token_b.upper()
+        addr_a = self.tokens.get("WFLR" if token_a == "FLR" else token_a)
+        addr_b = self.tokens.get("WFLR" if token_b == "FLR" else token_b)
+        if addr_a is None or addr_b is None or "native" in (addr_a, addr_b):
+            return None
+
+        # The RPC work runs in a worker thread so this coroutine doesn't
+        # block the event loop while web3 waits on the network
+        return await asyncio.to_thread(
+            self._get_pair_reserves_sync, addr_a, addr_b, token_a, token_b
+        )
+
+    def _get_pair_reserves_sync(
+        self, addr_a: str, addr_b: str, token_a: str, token_b: str
+    ) -> tuple[int, int] | None:
+        """Blocking reserves lookup behind get_pair_reserves."""
+        bucket = self.w3.eth.block_number // RATIO_BLOCK_INTERVAL
+        self._bucket_cache = (bucket, time.time())
+        key = (addr_a, addr_b, bucket)
+        if key in self._reserves_cache:
+            return self._reserves_cache[key]
+
+        reserves = None
+        try:
+            factory = self._contract(self.contracts["factory"], self.factory_abi)
+            pair_address = factory.functions.getPair(addr_a, addr_b).call()
+            if int(pair_address, 16) != 0:
+                pair = self._contract(
+                    _checksum(pair_address), self.pair_abi
+                )
+                reserve0, reserve1, _ = pair.functions.getReserves().call()
+                token0 = pair.functions.token0().call()
+                if token0.lower() == addr_a.lower():
+                    reserves = (reserve0, reserve1)
+                else:
+                    reserves = (reserve1, reserve0)
+                if reserves[0] == 0:
+                    reserves = None
+        except Exception:
+            logger.exception("pool_reserves_fetch_failed", pair=f"{token_a}/{token_b}")
+            return None
+
+        self._reserves_cache[key] = reserves
+        return reserves
+
+    async def get_pair_ratio(self, token_a: str, token_b: str) -> float | None:
+        """Get the current token_b-per-token_a ratio from the pool reserves.
+
+        Args:
+            token_a: Input token symbol
+            token_b: Output token symbol
+
+        Returns:
+            The pool ratio, or None if no pool exists for the pair
+        """
+        token_a = token_a.upper()
+        token_b = token_b.upper()
+        reserves = await self.get_pair_reserves(token_a, token_b)
+        if reserves is None:
+            return None
+        reserve_a, reserve_b = reserves
+        dec_a = self.token_decimals.get(token_a, 18)
+        dec_b = self.token_decimals.get(token_b, 18)
+        return (reserve_b / _POW10[dec_b]) / (reserve_a / _POW10[dec_a])
+
+    async def batch_prepare_context(
+        self, token_a: str, token_b: str, wallet_address: str
+    ) -> dict[str, Any] | None:
+        """Fetch both tokens' allowances and balances in one multicall.
+
+        Bundles the four view calls into a single Multicall3 aggregate3
+        eth_call, collapsing four RPC round-trips into one on the
+        add-liquidity hot path.
+
+        Args:
+            token_a: First token symbol
+            token_b: Second token symbol
+            wallet_address: User's wallet address
+
+        Returns:
+            Dict with allowance_a/balance_a/allowance_b/balance_b in wei,
+            or None if the multicall fails
+        """
+        try:
+            wallet = _checksum(wallet_address)
+            router = self.contracts["router"]
+            addr_a = self.tokens[token_a.upper()]
+            addr_b = self.tokens[token_b.upper()]
+
+            erc20 = self._erc20_codec
+            allowance_data = self.w3.to_bytes(
+                hexstr=erc20.encode_abi("allowance", args=[wallet, router])
+            )
+            balance_data = self.w3.to_bytes(
+                hexstr=erc20.encode_abi("balanceOf", args=[wallet])
+            )
+            calls = [
+                (addr_a, True, allowance_data),
+                (addr_a, True, balance_data),
+                (addr_b, True, allowance_data),
+                (addr_b, True, balance_data),
+            ]
+
+            multicall = self._contract(
+                _checksum(MULTICALL3_ADDRESS), self.multicall3_abi
+            )
+            results = await asyncio.to_thread(
+                multicall.functions.aggregate3(calls).call
+            )
+            values = [
+                int.from_bytes(ret, "big") if ok and ret else 0
+                for ok, ret in results
+            ]
+        except Exception:
+            logger.exception("multicall_context_failed")
+            return None
+
+        return {
+            "allowance_a": values[0],
+            "balance_a": values[1],
+            "allowance_b": values[2],
+            "balance_b": values[3],
+        }
+
+    def _rpc_batch(self, calls: list[tuple[str, list[Any]]]) -> list[Any]:
+        """POST the given JSON-RPC calls as a single batch request.
+
+        Results are returned in call order. A per-call error raises so
+        callers can fall back to sequential web3 requests.
+
+        Args:
+            calls: (method, params) tuples to bundle into the batch
+
+        Returns:
+            The raw "result" value of each call, in call order
+        """
+        payload = [
+            {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+            for i, (method, params) in enumerate(calls)
         ]
+        response = pooled_session().post(
+            self.w3.provider.endpoint_uri, json=payload, timeout=10
+        )
+        response.raise_for_status()
+        by_id = {item["id"]: item for item in response.json()}
+        results = []
+        for request in payload:
+            item = by_id[request["id"]]
+            if "error" in item:
+                msg = f"RPC error for {request['method']}: {item['error']}"
+                raise ValueError(msg)
+            results.append(item["result"])
+        return results
+
+    def _get_fees(self) -> tuple[int, int]:
+        """Return (gas_price, max_priority_fee), cached for FEE_CACHE_TTL.
+
+        Both values refresh together via one batched RPC; sequential
+        web3 reads are the fallback when batching is unavailable.
+        """
+        ts, gas_price, priority = self._fee_cache
+        now = time.time()
+        if now - ts > FEE_CACHE_TTL:
+            try:
+                results = self._rpc_batch(
+                    [("eth_gasPrice", []), ("eth_maxPriorityFeePerGas", [])]
+                )
+                gas_price, priority = int(results[0], 16), int(results[1], 16)
+            except Exception:
+                gas_price = self.w3.eth.gas_price
+                priority = self.w3.eth.max_priority_fee
+            self._fee_cache = (now, gas_price, priority)
+        return gas_price, priority
+
+    def _cached_allowance(self, token: str, owner: str, spender: str) -> int | None:
+        """Return a recent cached allowance, or None if absent or stale."""
+        entry = self._allowance_cache.get((token, owner, spender))
+        if entry is not None and time.time() - entry[1] < ALLOWANCE_CACHE_TTL:
+            return entry[0]
+        return None
+
+    def _store_allowance(
+        self, token: str, owner: str, spender: str, value: int
+    ) -> None:
+        self._allowance_cache[(token, owner, spender)] = (value, time.time())
+
+    @staticmethod
+    def _amount_out(amount_in: int, reserve_in: int, reserve_out: int) -> int:
+        """Constant-product output for one hop (0.3% fee), pure Python."""
+        amount_with_fee = amount_in * 997
+        return (amount_with_fee * reserve_out) // (
+            reserve_in * 1000 + amount_with_fee
+        )
+
+    def _local_amounts_out(
+        self, amount_in_wei: int, path: list[str]
+    ) -> list[int] | None:
+        """Compute a getAmountsOut quote locally from cached reserves.
+
+        Uses only reserves already sitting in the block-bucket cache -
+        no RPC is ever spent here. Returns None when the current bucket
+        is unknown or any hop's reserves are missing, in which case the
+        caller quotes on-chain.
+        """
+        bucket, observed_at = self._bucket_cache
+        if bucket < 0 or time.time() - observed_at > BUCKET_GUESS_TTL:
+            return None
+        amounts = [amount_in_wei]
+        amount = amount_in_wei
+        for addr_in, addr_out in zip(path, path[1:], strict=False):
+            reserves = self._reserves_cache.get((addr_in, addr_out, bucket))
+            if reserves is None:
+                reversed_ = self._reserves_cache.get((addr_out, addr_in, bucket))
+                if reversed_ is None:
+                    return None
+                reserves = (reversed_[1], reversed_[0])
+            amount = self._amount_out(amount, reserves[0], reserves[1])
+            amounts.append(amount)
+        return amounts
+
+    def _build_swap_tx(
+        self,
+        router: Any,
+        method: str,
+        args: list[Any],
+        *,
+        wallet_address: str,
+        value: int,
+        gas: int,
+        ctx: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Assemble a swap transaction dict from directly encoded calldata.
+
+        encode_abi on the cached contract reuses its compiled selectors,
+        and building the dict by hand skips web3's ContractFunction
+        machinery (argument re-normalization, signature rebuild and
+        transaction validation) on every swap.
+        """
+        return {
+            "from": wallet_address,
+            "to": router.address,
+            "data": router.encode_abi(method, args=args),
+            "value": value,
+            "gas": gas,
+            "maxFeePerGas": ctx["gas_price"] * 2,
+            "maxPriorityFeePerGas": ctx["max_priority_fee"],
+            "nonce": ctx["nonce"],
+            "chainId": ctx["chain_id"],
+            "type": 2,
+        }
+
+    def _fetch_swap_context(
+        self,
+        wallet_address: str,
+        router: Any,
+        amount_in_wei: int,
+        path: list[str],
+        allowance_target: str | None,
+        router_address: str,
+    ) -> dict[str, Any]:
+        """Fetch everything a swap build needs in one RPC round-trip.
+
+        Bundles fee data, chain id, nonce, the getAmountsOut quote and
+        (for ERC20 inputs) the router allowance into a single JSON-RPC
+        batch POST. The two view calls are fused into one Multicall3
+        aggregate3 eth_call, since providers often optimize (or only
+        allow) a single eth_call where they rate-limit batches. Falls
+        back to sequential web3 calls if the endpoint rejects batches.
+
+        Args:
+            wallet_address: Sender address (checksummed)
+            router: Router contract object
+            amount_in_wei: Input amount in smallest units
+            path: Swap path token addresses
+            allowance_target: ERC20 input token address, or None when the
+                input is native and no allowance applies
+            router_address: Allowance spender address
+
+        Returns:
+            Dict with gas_price, max_priority_fee, chain_id, nonce,
+            amounts, and allowance when requested
+        """
+        # A quote computable from cached reserves costs zero RPC; only
+        # quote on-chain when the local computation can't be done
+        local_amounts = self._local_amounts_out(amount_in_wei, path)
+
+        agg_calls = []
+        if local_amounts is None:
+            quote_data = self.w3.to_bytes(
+                hexstr=router.encode_abi(
+                    "getAmountsOut", args=[amount_in_wei, path]
+                )
+            )
+            agg_calls.append((router.address, True, quote_data))
+        if allowance_target is not None:
+            allowance_data = self.w3.to_bytes(
+                hexstr=self._erc20_codec.encode_abi(
+                    "allowance", args=[wallet_address, router_address]
+                )
+            )
+            agg_calls.append((allowance_target, True, allowance_data))
+        calls = [
+            ("eth_gasPrice", []),
+            ("eth_maxPriorityFeePerGas", []),
+            ("eth_chainId", []),
+            ("eth_getTransactionCount", [wallet_address, "pending"]),
+        ]
+        if agg_calls:
+            multicall = self._contract(
+                _checksum(MULTICALL3_ADDRESS), self.multicall3_abi
+            )
+            calls.append(
+                (
+                    "eth_call",
+                    [
+                        {
+                            "to": multicall.address,
+                            "data": multicall.encode_abi(
+                                "aggregate3", args=[agg_calls]
+                            ),
+                        },
+                        "latest",
+                    ],
+                )
+            )
+        try:
+            results = self._rpc_batch(calls)
+            context: dict[str, Any] = {
+                "gas_price": int(results[0], 16),
+                "max_priority_fee": int(results[1], 16),
+                "chain_id": int(results[2], 16),
+                "nonce": int(results[3], 16),
+            }
+            # The batch carried fresh fee data; seed the TTL cache so a
+            # follow-up build within the window skips the fee RPCs
+            self._fee_cache = (
+                time.time(), context["gas_price"], context["max_priority_fee"]
+            )
+            if agg_calls:
+                agg_results = self.w3.codec.decode(
+                    ["(bool,bytes)[]"], self.w3.to_bytes(hexstr=results[4])
+                )[0]
+            idx = 0
+            if local_amounts is not None:
+                context["amounts"] = local_amounts
+            else:
+                quote_ok, quote_ret = agg_results[idx]
+                idx += 1
+                if not quote_ok:
+                    msg = "getAmountsOut reverted in multicall"
+                    raise ValueError(msg)
+                amounts = self.w3.codec.decode(["uint256[]"], quote_ret)[0]
+                context["amounts"] = list(amounts)
+            if allowance_target is not None:
+                ok, ret = agg_results[idx]
+                context["allowance"] = int.from_bytes(ret, "big") if ok and ret else 0
+        except Exception as e:
+            logger.warning("swap_context_batch_failed", error=str(e))
+            gas_price, priority_fee = self._get_fees()
+            context = {
+                "gas_price": gas_price,
+                "max_priority_fee": priority_fee,
+                "chain_id": self._chain_id,
+                "nonce": self.w3.eth.get_transaction_count(wallet_address),
+                "amounts": local_amounts
+                if local_amounts is not None
+                else router.functions.getAmountsOut(amount_in_wei, path).call(),
+            }
+            if allowance_target is not None:
+                token_contract = self._contract(allowance_target, self.erc20_abi)
+                context["allowance"] = token_contract.functions.allowance(
+                    wallet_address, router_address
+                ).call()
+        return context
 
     async def prepare_swap_transaction(
         self,
@@ -307,49 +970,67 @@ class BlazeSwapHandler:
         wallet_address: str,
         router_address: str,
     ) -> dict[str, Any]:
-        """Prepare a swap transaction"""
+        """Prepare a swap transaction.
 
-        try:
-            print(f"Debug - Preparing swap: {amount_in} {token_in} to {token_out}")
-            print(f"Debug - Available tokens: {list(self.tokens.keys())}")
-
-            # Special case: FLR to WFLR (wrap)
-            if token_in.upper() == "FLR" and token_out.upper() == "WFLR":
-                amount_in_wei = self.w3.to_wei(amount_in, "ether")
-                wflr_contract = self.w3.eth.contract(
-                    address=self.w3.to_checksum_address(self.tokens["WFLR"]),
-                    abi=self.wflr_abi,
-                )
+        The blocking web3 work runs in a worker thread so concurrent
+        preparations overlap their network latency instead of
+        serializing on the event loop.
+        """
+        return await asyncio.to_thread(
+            self._prepare_swap_transaction,
+            token_in,
+            token_out,
+            amount_in,
+            wallet_address,
+            router_address,
+        )
 
-                # Estimate gas for the deposit
-                estimated_gas = wflr_contract.functions.deposit().estimate_gas(
-                    {"from": wallet_address, "value": amount_in_wei}
-                )
+    def _prepare_swap_transaction(
+        self,
+        token_in: str,
+        token_out: str,
+        amount_in: float,
+        wallet_address: str,
+        router_address: str,
+    ) -> dict[str, Any]:
+        """Blocking swap preparation behind prepare_swap_transaction."""
+        try:
+            logger.debug(
+                "preparing_swap",
+                amount_in=amount_in,
+                token_in=token_in,
+                token_out=token_out,
+            )
 
-                # Add 20% buffer to estimated gas
-                gas_limit = int(estimated_gas * 1.2)
+            # Normalize the symbols once; every check below uses the
+            # uppercased forms
+            token_in_key = token_in.upper()
+            token_out_key = token_out.upper()
 
-                tx = wflr_contract.functions.deposit().build_transaction(
-                    {
-                        "from": wallet_address,
-                        "value": amount_in_wei,
-                        "gas": gas_limit,  # Use estimated gas with buffer
-                        "maxFeePerGas": self.w3.eth.gas_price
-                        * 2,  # Double the gas price for better chances
-                        "maxPriorityFeePerGas": self.w3.eth.max_priority_fee,
-                        "nonce": self.w3.eth.get_transaction_count(wallet_address),
-                        "chainId": self.w3.eth.chain_id,
-                        "type": 2,  # EIP-1559 transaction type
-                    }
-                )
+            # Special case: FLR to WFLR (wrap)
+            if token_in_key == "FLR" and token_out_key == "WFLR":
+                amount_in_wei = int(amount_in * _ETHER)
+
+                # deposit() is fixed-shape, so the calldata is precomputed
+                # and the gas limit is a known-safe constant - no
+                # estimate_gas round-trip, no ABI serialization
+                gas_price, priority_fee = self._get_fees()
+                tx = {
+                    "from": wallet_address,
+                    "to": self.tokens["WFLR"],
+                    "data": self._wflr_deposit_calldata,
+                    "value": amount_in_wei,
+                    "gas": WFLR_DEPOSIT_GAS,
+                    "maxFeePerGas": gas_price
+                    * 2,  # Double the gas price for better chances
+                    "maxPriorityFeePerGas": priority_fee,
+                    "nonce": self.w3.eth.get_transaction_count(wallet_address),
+                    "chainId": self._chain_id,
+                    "type": 2,  # EIP-1559 transaction type
+                }
 
                 # Convert values to hex strings for proper JSON serialization
-                tx["value"] = hex(tx["value"])
-                tx["gas"] = hex(tx["gas"])
-                tx["maxFeePerGas"] = hex(tx["maxFeePerGas"])
-                tx["maxPriorityFeePerGas"] = hex(tx["maxPriorityFeePerGas"])
-                tx["nonce"] = hex(tx["nonce"])
-                tx["chainId"] = hex(tx["chainId"])
+                _hexify_tx(tx)
 
                 return {
                     "transaction": tx,
@@ -361,165 +1042,87 @@ class BlazeSwapHandler:
                 }
 
             # Convert amount to Wei
-            amount_in_wei = self.w3.to_wei(amount_in, "ether")
-            print(f"Debug - Amount in wei: {amount_in_wei}")
+            amount_in_wei = int(amount_in * _ETHER)
 
-            router = self.w3.eth.contract(
-                address=self.w3.to_checksum_address(router_address), abi=self.router_abi
+            router = self._contract(
+                _checksum(router_address), self.router_abi
             )
 
             # Get token addresses and handle native token correctly
-            if token_in.upper() == "FLR":
+            if token_in_key == "FLR":
                 token_in_address = "native"
-                print("Debug - Using native token for input")
             else:
                 # Make sure the token is in the tokens dictionary
-                if token_in.upper() not in self.tokens:
+                if token_in_key not in self._supported:
                     raise ValueError(
-                        f"Unsupported input token: {token_in}. Supported tokens: {', '.join(self.tokens.keys())}"
+                        f"Unsupported input token: {token_in}. Supported tokens: {self._supported_str}"
                     )
-                token_in_address = self.tokens[token_in.upper()]
-                print(f"Debug - Using token address for input: {token_in_address}")
+                token_in_address = self.tokens[token_in_key]
 
             # Make sure the output token is in the tokens dictionary
-            if token_out.upper() not in self.tokens:
+            if token_out_key not in self._supported:
                 raise ValueError(
-                    f"Unsupported output token: {token_out}. Supported tokens: {', '.join(self.tokens.keys())}"
+                    f"Unsupported output token: {token_out}. Supported tokens: {self._supported_str}"
                 )
-            token_out_address = self.tokens[token_out.upper()]
-            print(f"Debug - Output token address: {token_out_address}")
+            token_out_address = self.tokens[token_out_key]
 
             # Set deadline 20 minutes from now
             deadline = int(time.time()) + 1200
 
-            # Prepare the path and transaction based on token types
-            if token_in.upper() == "FLR":
-                # For FLR to any token, we need to go through WFLR
-                path = [self.tokens["WFLR"], token_out_address]  # FLR -> WFLR -> token
-                print(f"Debug - Swap path for FLR: {path}")
-
-                try:
-                    # Get expected output amount
-                    amounts = router.functions.getAmountsOut(amount_in_wei, path).call()
-                    print(f"Debug - Expected amounts: {amounts}")
-                    min_amount_out = int(amounts[-1] * 0.95)  # 5% slippage
-                    print(f"Debug - Min amount out: {min_amount_out}")
-
-                    # For FLR to token swaps, use swapExactNATForTokens
-                    tx = router.functions.swapExactNATForTokens(
-                        min_amount_out,  # Minimum amount to receive
-                        path,
-                        wallet_address,
-                        deadline,
-                    ).build_transaction(
-                        {
-                            "from": wallet_address,
-                            "value": amount_in_wei,
-                            "gas": 3000000,
-                            "maxFeePerGas": self.w3.eth.gas_price * 2,
-                            "maxPriorityFeePerGas": self.w3.eth.max_priority_fee,
-                            "nonce": self.w3.eth.get_transaction_count(wallet_address),
-                            "chainId": self.w3.eth.chain_id,
-                            "type": 2,
-                        }
-                    )
-                    print("Debug - Built native token swap transaction")
-                except Exception as e:
-                    print(f"Error getting amounts out: {e!s}")
-                    raise Exception(
-                        f"Failed to get amounts out. The pool might not exist or have enough liquidity. Error: {e!s}"
-                    )
-            elif token_out.upper() == "FLR":
-                # For token to FLR swaps, use swapExactTokensForNAT
-                path = [token_in_address, self.tokens["WFLR"]]  # token -> WFLR -> FLR
-                print(f"Debug - Swap path for token to FLR: {path}")
-
-                try:
-                    # Get expected output amount
-                    amounts = router.functions.getAmountsOut(amount_in_wei, path).call()
-                    print(f"Debug - Expected amounts: {amounts}")
-                    min_amount_out = int(amounts[-1] * 0.95)  # 5% slippage
-                    print(f"Debug - Min amount out: {min_amount_out}")
-
-                    # For token to FLR swaps, use swapExactTokensForNAT
-                    tx = router.functions.swapExactTokensForNAT(
-                        min_amount_out, path, wallet_address, deadline
-                    ).build_transaction(
-                        {
-                            "from": wallet_address,
-                            "value": 0,
-                            "gas": 300000,
-                            "maxFeePerGas": self.w3.eth.gas_price * 2,
-                            "maxPriorityFeePerGas": self.w3.eth.max_priority_fee,
-                            "nonce": self.w3.eth.get_transaction_count(wallet_address),
-                            "chainId": self.w3.eth.chain_id,
-                            "type": 2,
-                        }
-                    )
-                    print("Debug - Built token to NAT swap transaction")
-                except Exception as e:
-                    print(f"Error getting amounts out: {e!s}")
-                    raise Exception(
-                        f"Failed to get amounts out. The pool might not exist or have enough liquidity. Error: {e!s}"
-                    )
+            # Resolve the swap shape once; path, router method, msg.value
+            # and gas limit all follow from it
+            if token_in_key == "FLR":
+                # FLR to any token goes through WFLR
+                kind = "nat_to_token"
+                path = [self.tokens["WFLR"], token_out_address]
+                allowance_target = None
+            elif token_out_key == "FLR":
+                kind = "token_to_nat"
+                path = [token_in_address, self.tokens["WFLR"]]
+                allowance_target = token_in_address
             else:
-                # For token to token swaps
+                kind = "token_to_token"
                 path = [token_in_address, token_out_address]
-                print(f"Debug - Swap path for token to token: {path}")
-
-                try:
-                    # Get expected output amount
-                    amounts = router.functions.getAmountsOut(amount_in_wei, path).call()
-                    print(f"Debug - Expected amounts: {amounts}")
-                    min_amount_out = int(amounts[-1] * 0.95)  # 5% slippage
-                    print(f"Debug - Min amount out: {min_amount_out}")
-
-                    # For token to token swaps, use swapExactTokensForTokens
-                    tx = router.functions.swapExactTokensForTokens(
-                        min_amount_out,  # Use only the minimum amount out parameter
-                        path,
-                        wallet_address,
-                        deadline,
-                    ).build_transaction(
-                        {
-                            "from": wallet_address,
-                            "value": 0,
-                            "gas": 300000,
-                            "maxFeePerGas": self.w3.eth.gas_price * 2,
-                            "maxPriorityFeePerGas": self.w3.eth.max_priority_fee,
-                            "nonce": self.w3.eth.get_transaction_count(wallet_address),
-                            "chainId": self.w3.eth.chain_id,
-                            "type": 2,
-                        }
-                    )
-                    print("Debug - Built token to token swap transaction")
-                except Exception as e:
-                    print(f"Error getting amounts out: {e!s}")
-                    raise Exception(
-                        f"Failed to get amounts out. The pool might not exist or have enough liquidity. Error: {e!s}"
-                    )
+                allowance_target = token_in_address
+            method, value_is_input, gas = SWAP_METHODS[kind]
+            logger.debug("swap_path", kind=kind, path=path)
+
+            try:
+                # Quote, fees, nonce, chain id and (for token input) the
+                # allowance in one batched RPC
+                ctx = self._fetch_swap_context(
+                    wallet_address, router, amount_in_wei, path,
+                    allowance_target, router_address,
+                )
+                amounts = ctx["amounts"]
+                min_amount_out = int(amounts[-1] * 0.95)  # 5% slippage
+                logger.debug(
+                    "swap_quote", amounts=amounts, min_amount_out=min_amount_out
+                )
 
-            # Convert values to hex strings for proper JSON serialization
-            tx["value"] = hex(tx["value"])
-            tx["gas"] = hex(tx["gas"])
-            tx["maxFeePerGas"] = hex(tx["maxFeePerGas"])
-            tx["maxPriorityFeePerGas"] = hex(tx["maxPriorityFeePerGas"])
-            tx["nonce"] = hex(tx["nonce"])
-            tx["chainId"] = hex(tx["chainId"])
-            tx["type"] = "0x2"
-
-            # Check if approval is needed for token_in
-            needs_approval = False
-            if token_in.upper() != "FLR":  # Native token doesn't need approval
-                token_contract = self.w3.eth.contract(
-                    address=self.w3.to_checksum_address(token_in_address),
-                    abi=self.erc20_abi,
+                tx = self._build_swap_tx(
+                    router,
+                    method,
+                    [min_amount_out, path, wallet_address, deadline],
+                    wallet_address=wallet_address,
+                    value=amount_in_wei if value_is_input else 0,
+                    gas=gas,
+                    ctx=ctx,
                 )
-                current_allowance = token_contract.functions.allowance(
-                    wallet_address, router_address
-                ).call()
-                if current_allowance < amount_in_wei:
-                    needs_approval = True
+            except Exception as e:
+                logger.exception("get_amounts_out_failed")
+                raise Exception(
+                    f"Failed to get amounts out. The pool might not exist or have enough liquidity. Error: {e!s}"
+                )
+
+            # Convert values to hex strings for proper JSON serialization
+            _hexify_tx(tx)
+
+            # Check if approval is needed for token_in (the allowance came
+            # back in the batched context; native token needs no approval)
+            needs_approval = (
+                token_in_key != "FLR" and ctx["allowance"] < amount_in_wei
+            )
 
             return {
                 "transaction": tx,
@@ -529,8 +1132,8 @@ class BlazeSwapHandler:
                 "min_amount_out": min_amount_out,
                 "needs_approval": needs_approval,
             }
-        except Exception as e:
-            print(f"Error building transaction: {e!s}")
+        except Exception:
+            logger.exception("swap_preparation_failed")
             raise
 
     async def prepare_add_liquidity_nat_transaction(
@@ -553,117 +1156,141 @@ class BlazeSwapHandler:
         """
         try:
             # 1. Input validation and address formatting
-            wallet_address = self.w3.to_checksum_address(wallet_address)
-            router_address = self.w3.to_checksum_address(router_address)
+            wallet_address = _checksum(wallet_address)
+            router_address = _checksum(router_address)
 
             # 2. Get token details
-            token_address = self.w3.to_checksum_address(self.tokens[token.upper()])
-            token_decimals = self.token_decimals.get(token.upper(), 18)
+            token_key = token.upper()
+            token_address = self.tokens[token_key]
+            pow_token = self._decimal_pow.get(token_key, _ETHER)
 
-            # 3. Convert amounts to contract units (wei/smallest unit)
-            # For FLR: 1 FLR = 10^18 wei
-            amount_flr_wei = self.w3.to_wei(amount_flr, "ether")
+            # 3. Convert amounts to contract units (wei/smallest unit).
+            # Going through Decimal(str(...)) keeps the full 18-decimal
+            # precision that a float multiply would round away
+            amount_flr_wei = int(Decimal(str(amount_flr)) * _ETHER)
 
-            # For tokens: Convert based on decimals
-            if token.upper() == "USDC.E":
-                # USDC.E uses 6 decimals
-                amount_token_wei = int(amount_token * (10**6))
-            else:
-                amount_token_wei = int(amount_token * (10**token_decimals))
+            # For tokens: Convert based on the per-token decimals table
+            # (USDC.E and USDT carry 6 there, everything else 18)
+            amount_token_wei = int(Decimal(str(amount_token)) * pow_token)
 
-            # 4. Calculate minimum amounts (using 0.5% slippage)
-            slippage = 0.005  # 0.5%
-            amount_token_min = int(amount_token_wei * (1 - slippage))
-            amount_flr_min = int(amount_flr_wei * (1 - slippage))
+            # 4. Calculate minimum amounts (0.5% slippage) with exact
+            # integer arithmetic
+            amount_token_min = amount_token_wei - amount_token_wei * 5 // 1000
+            amount_flr_min = amount_flr_wei - amount_flr_wei * 5 // 1000
 
             # 5. Set deadline (20 minutes from now)
             deadline = int(time.time()) + 1200
 
-            # 6. Check token approval
-            token_contract = self.w3.eth.contract(
-                address=token_address, abi=self.erc20_abi
-            )
-
-            current_allowance = token_contract.functions.allowance(
-                wallet_address, router_address
-            ).call()
-
-            needs_approval = current_allowance < amount_token_wei
+            # 6. Allowance, nonce and fee data are independent reads;
+            # fetch them concurrently so the prep cost is one RTT. A
+            # recent cached allowance that already covers the amount
+            # skips the read entirely
+            token_contract = self._contract(token_address, self.erc20_abi)
 
-            # 7. Prepare approval transaction if needed
-            approval_tx = None
-            if needs_approval:
-                approval_tx = token_contract.functions.approve(
-                    router_address, amount_token_wei
-                ).build_transaction(
-                    {
-                        "from": wallet_address,
-                        "gas": 100000,
-                        "maxFeePerGas": self.w3.eth.gas_price * 2,
-                        "maxPriorityFeePerGas": self.w3.eth.max_priority_fee,
-                        "nonce": self.w3.eth.get_transaction_count(wallet_address),
-                        "chainId": self.w3.eth.chain_id,
-                        "type": 2,
-                    }
+            cached = self._cached_allowance(
+                token_address, wallet_address, router_address
+            )
+            if cached is not None and cached >= amount_token_wei:
+                current_allowance = cached
+                nonce, fees = await asyncio.gather(
+                    asyncio.to_thread(
+                        self.w3.eth.get_transaction_count, wallet_address
+                    ),
+                    asyncio.to_thread(self._get_fees),
+                )
+            else:
+                current_allowance, nonce, fees = await asyncio.gather(
+                    asyncio.to_thread(
+                        token_contract.functions.allowance(
+                            wallet_address, router_address
+                        ).call
+                    ),
+                    asyncio.to_thread(
+                        self.w3.eth.get_transaction_count, wallet_address
+                    ),
+                    asyncio.to_thread(self._get_fees),
                 )
+                self._store_allowance(
+                    token_address, wallet_address, router_address, current_allowance
+                )
+            gas_price, priority_fee = fees
 
-            # 8. Prepare add liquidity transaction
-            router = self.w3.eth.contract(address=router_address, abi=self.router_abi)
-
-            add_liquidity_tx = router.functions.addLiquidityNAT(
-                token_address,  # token address
-                amount_token_wei,  # amount token desired
-                amount_token_min,  # amount token min
-                amount_flr_min,  # amount FLR min
-                0,  # fee bips token (0 for no fee)
-                wallet_address,  # to address
-                deadline,  # deadline
-            ).build_transaction(
-                {
-                    "from": wallet_address,
-                    "value": amount_flr_wei,  # Native FLR amount
-                    "gas": 300000,
-                    "maxFeePerGas": self.w3.eth.gas_price * 2,
-                    "maxPriorityFeePerGas": self.w3.eth.max_priority_fee,
-                    "nonce": self.w3.eth.get_transaction_count(wallet_address)
-                    + (1 if needs_approval else 0),
-                    "chainId": self.w3.eth.chain_id,
-                    "type": 2,
-                }
-            )
+            needs_approval = current_allowance < amount_token_wei
 
-            # Format transactions for return
-            formatted_txs = []
+            # 7-8. Assemble the approval and add-liquidity transactions
+            # from encoded calldata; every field is known here, so going
+            # through build_transaction would only add validation
+            # overhead. The shared fields are spelled out once
+            router = self._contract(router_address, self.router_abi)
+            common = {
+                "from": wallet_address,
+                "maxFeePerGas": gas_price * 2,
+                "maxPriorityFeePerGas": priority_fee,
+                "chainId": self._chain_id,
+                "type": 2,
+            }
 
+            txs: list[tuple[dict, str]] = []
             if needs_approval:
-                formatted_txs.append(
+                txs.append(
+                    (
+                        {
+                            **common,
+                            "to": token_address,
+                            "data": token_contract.encode_abi(
+                                "approve", args=[router_address, amount_token_wei]
+                            ),
+                            "value": 0,
+                            "gas": 100000,
+                            "nonce": nonce,
+                        },
+                        f"Approve {amount_token} {token}",
+                    )
+                )
+                nonce += 1
+            txs.append(
+                (
                     {
-                        "tx": self._format_tx_for_json(approval_tx),
-                        "description": f"Approve {amount_token} {token}",
-                    }
+                        **common,
+                        "to": router_address,
+                        "data": router.encode_abi(
+                            "addLiquidityNAT",
+                            args=[
+                                token_address,
+                                amount_token_wei,
+                                amount_token_min,
+                                amount_flr_min,
+                                0,  # fee bips token (0 for no fee)
+                                wallet_address,
+                                deadline,
+                            ],
+                        ),
+                        "value": amount_flr_wei,  # Native FLR amount
+                        "gas": 300000,
+                        "nonce": nonce,
+                    },
+                    f"Add liquidity: {amount_token} {token} + {amount_flr} FLR",
                 )
-
-            formatted_txs.append(
-                {
-                    "tx": self._format_tx_for_json(add_liquidity_tx),
-                    "description": f"Add liquidity: {amount_token} {token} + {amount_flr} FLR",
-                }
             )
 
+            formatted_txs = [
+                {"tx": self._format_tx_for_json(tx), "description": description}
+                for tx, description in txs
+            ]
+
             # Return transaction details
             return {
                 "transactions": formatted_txs,
                 "token": token,
                 "amount_token": amount_token,
                 "amount_flr": amount_flr,
-                "amount_token_min": amount_token_min
-                / (10 ** (6 if token.upper() == "USDC.E" else token_decimals)),
+                "amount_token_min": amount_token_min / pow_token,
                 "amount_flr_min": self.w3.from_wei(amount_flr_min, "ether"),
                 "needs_approval": needs_approval,
             }
 
-        except Exception as e:
-            print(f"Error preparing add liquidity NAT transaction: {e!s}")
+        except Exception:
+            logger.exception("add_liquidity_nat_preparation_failed")
             raise
 
     async def prepare_add_liquidity_transaction(
@@ -688,140 +1315,172 @@ class BlazeSwapHandler:
         """
         try:
             # 1. Input validation and address formatting
-            wallet_address = self.w3.to_checksum_address(wallet_address)
-            router_address = self.w3.to_checksum_address(router_address)
+            wallet_address = _checksum(wallet_address)
+            router_address = _checksum(router_address)
 
             # 2. Get token details
-            token_a_address = self.w3.to_checksum_address(self.tokens[token_a.upper()])
-            token_b_address = self.w3.to_checksum_address(self.tokens[token_b.upper()])
+            token_a_key = token_a.upper()
+            token_b_key = token_b.upper()
+            token_a_address = self.tokens[token_a_key]
+            token_b_address = self.tokens[token_b_key]
 
-            token_a_decimals = self.token_decimals.get(token_a.upper(), 18)
-            token_b_decimals = self.token_decimals.get(token_b.upper(), 18)
+            pow_a = self._decimal_pow.get(token_a_key, _ETHER)
+            pow_b = self._decimal_pow.get(token_b_key, _ETHER)
 
             # 3. Convert amounts to contract units (wei/smallest unit)
-            # Handle USDC.E special case (6 decimals)
-            if token_a.upper() == "USDC.E":
-                amount_a_wei = int(amount_a * (10**6))
-            else:
-                amount_a_wei = int(amount_a * (10**token_a_decimals))
-
-            if token_b.upper() == "USDC.E":
-                amount_b_wei = int(amount_b * (10**6))
-            else:
-                amount_b_wei = int(amount_b * (10**token_b_decimals))
+            # using the per-token decimals table (6 for USDC.E/USDT);
+            # Decimal(str(...)) avoids float rounding at 18 decimals
+            amount_a_wei = int(Decimal(str(amount_a)) * pow_a)
+            amount_b_wei = int(Decimal(str(amount_b)) * pow_b)
 
-            # 4. Calculate minimum amounts (using 0.5% slippage)
-            slippage = 0.005  # 0.5%
-            amount_a_min = int(amount_a_wei * (1 - slippage))
-            amount_b_min = int(amount_b_wei * (1 - slippage))
+            # 4. Calculate minimum amounts (0.5% slippage) with exact
+            # integer arithmetic
+            amount_a_min = amount_a_wei - amount_a_wei * 5 // 1000
+            amount_b_min = amount_b_wei - amount_b_wei * 5 // 1000
 
             # 5. Set deadline (20 minutes from now)
             deadline = int(time.time()) + 1200
 
             # 6. Check approvals
-            token_a_contract = self.w3.eth.contract(
-                address=token_a_address, abi=self.erc20_abi
-            )
+            token_a_contract = self._contract(token_a_address, self.erc20_abi)
 
-            token_b_contract = self.w3.eth.contract(
-                address=token_b_address, abi=self.erc20_abi
-            )
+            token_b_contract = self._contract(token_b_address, self.erc20_abi)
 
-            allowance_a = token_a_contract.functions.allowance(
-                wallet_address, router_address
-            ).call()
-
-            allowance_b = token_b_contract.functions.allowance(
-                wallet_address, router_address
-            ).call()
+            # One multicall round-trip for both allowances, gathered with
+            # the nonce and fee reads since all three are independent;
+            # falls back to sequential eth_calls if multicall fails.
+            # Recent cached allowances that already cover both amounts
+            # skip the multicall entirely
+            cached_a = self._cached_allowance(
+                token_a_address, wallet_address, router_address
+            )
+            cached_b = self._cached_allowance(
+                token_b_address, wallet_address, router_address
+            )
+            if (
+                cached_a is not None
+                and cached_a >= amount_a_wei
+                and cached_b is not None
+                and cached_b >= amount_b_wei
+            ):
+                allowance_a, allowance_b = cached_a, cached_b
+                nonce, fees = await asyncio.gather(
+                    asyncio.to_thread(
+                        self.w3.eth.get_transaction_count, wallet_address
+                    ),
+                    asyncio.to_thread(self._get_fees),
+                )
+            else:
+                ctx, nonce, fees = await asyncio.gather(
+                    self.batch_prepare_context(token_a, token_b, wallet_address),
+                    asyncio.to_thread(
+                        self.w3.eth.get_transaction_count, wallet_address
+                    ),
+                    asyncio.to_thread(self._get_fees),
+                )
+                if ctx is not None:
+                    allowance_a = ctx["allowance_a"]
+                    allowance_b = ctx["allowance_b"]
+                else:
+                    allowance_a, allowance_b = await asyncio.gather(
+                        asyncio.to_thread(
+                            token_a_contract.functions.allowance(
+                                wallet_address, router_address
+                            ).call
+                        ),
+                        asyncio.to_thread(
+                            token_b_contract.functions.allowance(
+                                wallet_address, router_address
+                            ).call
+                        ),
+                    )
+                self._store_allowance(
+                    token_a_address, wallet_address, router_address, allowance_a
+                )
+                self._store_allowance(
+                    token_b_address, wallet_address, router_address, allowance_b
+                )
+            gas_price, priority_fee = fees
 
             needs_approval_a = allowance_a < amount_a_wei
             needs_approval_b = allowance_b < amount_b_wei
 
-            # 7. Prepare approval transactions if needed
-            formatted_txs = []
-            nonce = self.w3.eth.get_transaction_count(wallet_address)
+            # 7-8. Assemble the approval and add-liquidity transactions
+            # from encoded calldata with a shared field dict; all fields
+            # are known, so build_transaction would add nothing but
+            # validation overhead
+            router = self._contract(router_address, self.router_abi)
+            common = {
+                "from": wallet_address,
+                "maxFeePerGas": gas_price * 2,  # Base * 2 to get 50 max fee
+                # Reduced to get 2.50 max priority
+                "maxPriorityFeePerGas": int(priority_fee * 0.1),
+                "chainId": self._chain_id,
+                "type": 2,
+            }
+
+            def approval_tx(contract: Any, amount_wei: int, nonce_: int) -> dict:
+                return {
+                    **common,
+                    "to": contract.address,
+                    "data": contract.encode_abi(
+                        "approve", args=[router_address, amount_wei]
+                    ),
+                    "value": 0,
+                    "gas": 50000,  # Reduced gas for approval
+                    "nonce": nonce_,
+                }
 
+            txs: list[tuple[dict, str]] = []
             if needs_approval_a:
-                approval_a_tx = token_a_contract.functions.approve(
-                    router_address, amount_a_wei
-                ).build_transaction(
-                    {
-                        "from": wallet_address,
-                        "gas": 50000,  # Reduced gas for approval
-                        "maxFeePerGas": self.w3.eth.gas_price * 2,
-                        "maxPriorityFeePerGas": int(self.w3.eth.max_priority_fee * 0.1),
-                        "nonce": nonce,
-                        "chainId": self.w3.eth.chain_id,
-                        "type": 2,
-                    }
-                )
-                formatted_txs.append(
-                    {
-                        "tx": self._format_tx_for_json(approval_a_tx),
-                        "description": f"Approve {amount_a} {token_a}",
-                    }
+                txs.append(
+                    (
+                        approval_tx(token_a_contract, amount_a_wei, nonce),
+                        f"Approve {amount_a} {token_a}",
+                    )
                 )
                 nonce += 1
-
             if needs_approval_b:
-                approval_b_tx = token_b_contract.functions.approve(
-                    router_address, amount_b_wei
-                ).build_transaction(
-                    {
-                        "from": wallet_address,
-                        "gas": 50000,  # Reduced gas for approval
-                        "maxFeePerGas": self.w3.eth.gas_price * 2,
-                        "maxPriorityFeePerGas": int(self.w3.eth.max_priority_fee * 0.1),
-                        "nonce": nonce,
-                        "chainId": self.w3.eth.chain_id,
-                        "type": 2,
-                    }
+                txs.append(
+                    (
+                        approval_tx(token_b_contract, amount_b_wei, nonce),
+                        f"Approve {amount_b} {token_b}",
+                    )
                 )
-                formatted_txs.append(
+                nonce += 1
+            txs.append(
+                (
                     {
-                        "tx": self._format_tx_for_json(approval_b_tx),
-                        "description": f"Approve {amount_b} {token_b}",
-                    }
+                        **common,
+                        "to": router_address,
+                        "data": router.encode_abi(
+                            "addLiquidity",
+                            args=[
+                                token_a_address,  # tokenA (FLX)
+                                token_b_address,  # tokenB (USDC.E)
+                                amount_a_wei,  # amountADesired
+                                amount_b_wei,  # amountBDesired
+                                # amountAMin (0.2% slippage for FLX)
+                                amount_a_wei * 998 // 1000,
+                                0,  # amountBMin (0 for USDC.E as per successful tx)
+                                300,  # feeBipsA (300 for FLX)
+                                0,  # feeBipsB (0 for USDC.E)
+                                wallet_address,  # to
+                                int(time.time() + 86400),  # deadline (24 hours)
+                            ],
+                        ),
+                        "value": 0,
+                        "gas": 2891350,  # Exact gas limit from successful transaction
+                        "nonce": nonce,
+                    },
+                    f"Add liquidity: {amount_a} {token_a} + {amount_b} {token_b}",
                 )
-                nonce += 1
-
-            # 8. Prepare add liquidity transaction
-            router = self.w3.eth.contract(address=router_address, abi=self.router_abi)
-
-            add_liquidity_tx = router.functions.addLiquidity(
-                token_a_address,  # tokenA (FLX)
-                token_b_address,  # tokenB (USDC.E)
-                amount_a_wei,  # amountADesired
-                amount_b_wei,  # amountBDesired
-                int(amount_a_wei * 0.998),  # amountAMin (0.2% slippage for FLX)
-                0,  # amountBMin (0 for USDC.E as per successful tx)
-                300,  # feeBipsA (300 for FLX)
-                0,  # feeBipsB (0 for USDC.E)
-                wallet_address,  # to
-                int(time.time() + 86400),  # deadline (24 hours as per successful tx)
-            ).build_transaction(
-                {
-                    "from": wallet_address,
-                    "value": 0,
-                    "gas": 2891350,  # Exact gas limit from successful transaction
-                    "maxFeePerGas": self.w3.eth.gas_price
-                    * 2,  # Base * 2 to get 50 max fee
-                    "maxPriorityFeePerGas": int(
-                        self.w3.eth.max_priority_fee * 0.1
-                    ),  # Reduced to get 2.50 max priority
-                    "nonce": nonce,
-                    "chainId": self.w3.eth.chain_id,
-                    "type": 2,
-                }
             )
 
-            formatted_txs.append(
-                {
-                    "tx": self._format_tx_for_json(add_liquidity_tx),
-                    "description": f"Add liquidity: {amount_a} {token_a} + {amount_b} {token_b}",
-                }
-            )
+            formatted_txs = [
+                {"tx": self._format_tx_for_json(tx), "description": description}
+                for tx, description in txs
+            ]
 
             # Return transaction details
             return {
@@ -830,29 +1489,16 @@ class BlazeSwapHandler:
                 "token_b": token_b,
                 "amount_a": amount_a,
                 "amount_b": amount_b,
-                "amount_a_min": amount_a_min
-                / (10 ** (6 if token_a.upper() == "USDC.E" else token_a_decimals)),
-                "amount_b_min": amount_b_min
-                / (10 ** (6 if token_b.upper() == "USDC.E" else token_b_decimals)),
+                "amount_a_min": amount_a_min / pow_a,
+                "amount_b_min": amount_b_min / pow_b,
                 "needs_approval_a": needs_approval_a,
                 "needs_approval_b": needs_approval_b,
             }
 
-        except Exception as e:
-            print(f"Error preparing add liquidity transaction: {e!s}")
+        except Exception:
+            logger.exception("add_liquidity_preparation_failed")
             raise
 
     def _format_tx_for_json(self, tx: dict) -> dict:
         """Helper method to format transaction for JSON serialization"""
-        return {
-            "from": tx["from"],
-            "to": tx["to"],
-            "value": hex(tx["value"]),
-            "data": tx["data"],
-            "gas": hex(tx["gas"]),
-            "maxFeePerGas": hex(tx["maxFeePerGas"]),
-            "maxPriorityFeePerGas": hex(tx["maxPriorityFeePerGas"]),
-            "nonce": hex(tx["nonce"]),
-            "chainId": hex(tx["chainId"]),
-            "type": "0x2",
-        }
+        return _hexify_tx(dict(tx))
@@ -5,7 +5,9 @@ This module provides a FlareProvider class for interacting with the Flare Networ
 It handles account management, transaction queuing, and blockchain interactions.
 """
 
-from dataclasses import dataclass
+import asyncio
+import time
+from dataclasses import asdict, dataclass
 
 import structlog
 from eth_account import Account
@@ -14,6 +16,7 @@ from web3 import Web3
 from web3.types import TxParams
 
 from .network_config import NETWORK_CONFIGS
+from .session import pooled_session
 
 
 @dataclass
@@ -32,6 +35,14 @@ class TxQueueElement:
 
 logger = structlog.get_logger(__name__)
 
+# Balances fetched for wallet connection are cached briefly; long enough to
+# absorb client retries, short enough to stay fresh across blocks
+BALANCE_CACHE_TTL = 2.0
+
+# Fee suggestions are refreshed at most this often (~3 Flare blocks);
+# within the window transaction builds skip the fee RPC entirely
+FEE_CACHE_TTL = 6.0
+
 
 class FlareProvider:
     """
@@ -50,16 +61,44 @@ class FlareProvider:
         Args:
             web3_provider_url: URL of the Web3 provider
         """
-        self.w3 = Web3(Web3.HTTPProvider(web3_provider_url))
+        self.w3 = Web3(
+            Web3.HTTPProvider(web3_provider_url, session=pooled_session())
+        )
         self.network = "flare" if "flare-api" in web3_provider_url else "coston2"
-        self.address: str | None = None
-
-        # Load network configuration
-        self.chain_id = NETWORK_CONFIGS[self.network]["chain_id"]
-        self.native_symbol = NETWORK_CONFIGS[self.network]["native_symbol"]
-        self.block_explorer = NETWORK_CONFIGS[self.network]["explorer_url"]
+        self._address: str | None = None
+        self._short_address: str | None = None
+        self._balance_cache: dict[str, tuple[float, float]] = {}
+
+        # (timestamp, max_fee, max_priority_fee) from the last
+        # eth_feeHistory read
+        self._fee_cache: tuple[float, int, int] = (0.0, 0, 0)
+
+        # Load network configuration; the dict view is materialized once
+        # for the wallet-connect response
+        config = NETWORK_CONFIGS[self.network]
+        self.chain_id = config.chain_id
+        self.native_symbol = config.native_symbol
+        self.block_explorer = config.explorer_url
+        self._network_config_dict = asdict(config)
         self.logger = logger.bind(router="flare_provider")
 
+    @property
+    def address(self) -> str | None:
+        """The connected wallet address."""
+        return self._address
+
+    @address.setter
+    def address(self, value: str | None) -> None:
+        # Compute the abbreviated display form once on assignment rather
+        # than re-slicing in every handler that renders the address
+        self._address = value
+        self._short_address = f"{value[:6]}...{value[-4:]}" if value else None
+
+    @property
+    def short_address(self) -> str | None:
+        """Abbreviated address for display, e.g. '0x1234...abcd'."""
+        return self._short_address
+
     def reset(self) -> None:
         """
         Reset the provider state.
@@ -82,15 +121,20 @@ class FlareProvider:
         )
         return self.address
 
-    def sign_and_send_transaction(self, tx: TxParams) -> str:
+    def send_transaction(self, tx: TxParams) -> str:
         """
-        Sign and send a transaction to the network.
+        Sign and submit a transaction without waiting for its receipt.
+
+        Returning right after eth_sendRawTransaction lets callers that
+        only need the hash continue instead of idling for a ~2s Flare
+        block, and lets independent transactions be submitted
+        back-to-back with their receipts awaited together.
 
         Args:
             tx (TxParams): Transaction parameters to be sent
 
         Returns:
-            str: Transaction hash of the sent transaction
+            str: Transaction hash of the submitted transaction
 
         Raises:
             ValueError: If account is not initialized
@@ -102,10 +146,39 @@ class FlareProvider:
             tx, private_key=self.private_key
         )
         tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
-        self.w3.eth.wait_for_transaction_receipt(tx_hash)
-        self.logger.debug("sign_and_send_transaction", tx=tx)
+        self.logger.debug("send_transaction", tx=tx)
         return "0x" + tx_hash.hex()
 
+    async def await_receipt(self, tx_hash: str) -> dict:
+        """Wait for a transaction's receipt off the event loop.
+
+        Args:
+            tx_hash: Hash returned by send_transaction
+
+        Returns:
+            The transaction receipt
+        """
+        return await asyncio.to_thread(
+            self.w3.eth.wait_for_transaction_receipt, tx_hash
+        )
+
+    def sign_and_send_transaction(self, tx: TxParams) -> str:
+        """
+        Sign and send a transaction, blocking until it is mined.
+
+        Args:
+            tx (TxParams): Transaction parameters to be sent
+
+        Returns:
+            str: Transaction hash of the sent transaction
+
+        Raises:
+            ValueError: If account is not initialized
+        """
+        tx_hash = self.send_transaction(tx)
+        self.w3.eth.wait_for_transaction_receipt(tx_hash)
+        return tx_hash
+
     def check_balance(self) -> float:
         """
         Check the balance of the current account.
@@ -123,6 +196,30 @@ class FlareProvider:
         self.logger.debug("check_balance", balance_wei=balance_wei)
         return float(self.w3.from_wei(balance_wei, "ether"))
 
+    def _fee_suggestion(self) -> tuple[int, int]:
+        """Return (max_fee, max_priority_fee) from one eth_feeHistory call.
+
+        eth_feeHistory carries both the base fee and tip percentiles, so
+        one RPC replaces the separate eth_gasPrice and
+        eth_maxPriorityFeePerGas reads; the result is cached briefly.
+        """
+        ts, max_fee, priority_fee = self._fee_cache
+        now = time.monotonic()
+        if now - ts < FEE_CACHE_TTL:
+            return max_fee, priority_fee
+        history = self.w3.eth.fee_history(1, "latest", [50])
+        base_fee = history["baseFeePerGas"][-1]
+        rewards = history.get("reward")
+        if rewards and rewards[0]:
+            priority_fee = rewards[0][0]
+        else:
+            # Some providers return an empty reward list (e.g. for empty
+            # blocks); fall back to the dedicated RPC
+            priority_fee = self.w3.eth.max_priority_fee
+        max_fee = base_fee * 2 + priority_fee
+        self._fee_cache = (now, max_fee, priority_fee)
+        return max_fee, priority_fee
+
     def create_send_flr_tx(self, to_address: str, amount: float) -> TxParams:
         """
         Create a transaction to send FLR tokens.
@@ -140,22 +237,25 @@ class FlareProvider:
         if not self.address:
             msg = "Account does not exist"
             raise ValueError(msg)
+        max_fee, priority_fee = self._fee_suggestion()
         tx: TxParams = {
             "from": self.address,
             "nonce": self.w3.eth.get_transaction_count(self.address),
             "to": self.w3.to_checksum_address(to_address),
             "value": self.w3.to_wei(amount, unit="ether"),
             "gas": 21000,
-            "maxFeePerGas": self.w3.eth.gas_price,
-            "maxPriorityFeePerGas": self.w3.eth.max_priority_fee,
-            "chainId": self.w3.eth.chain_id,
+            "maxFeePerGas": max_fee,
+            "maxPriorityFeePerGas": priority_fee,
+            # chain_id comes from the network config cached at init; no
+            # need for an eth_chainId round-trip per transaction
+            "chainId": self.chain_id,
             "type": 2,
         }
         return tx
 
     async def get_network_config(self) -> dict:
         """Get network configuration for wallet"""
-        return NETWORK_CONFIGS[self.network]
+        return self._network_config_dict
 
     async def get_balance(self, wallet_address: str) -> float:
         """Get the native token balance for a wallet address.
@@ -166,13 +266,18 @@ class FlareProvider:
         Returns:
             The balance in native token units (e.g., FLR)
         """
+        now = time.monotonic()
+        cached = self._balance_cache.get(wallet_address)
+        if cached is not None and cached[1] > now:
+            return cached[0]
         try:
             balance_wei = self.w3.eth.get_balance(wallet_address)
-            balance_eth = self.w3.from_wei(balance_wei, "ether")
-            return float(balance_eth)
+            balance_eth = float(self.w3.from_wei(balance_wei, "ether"))
         except Exception as e:
             self.logger.exception("Error getting balance", error=str(e))
             return 0.0
+        self._balance_cache[wallet_address] = (balance_eth, now + BALANCE_CACHE_TTL)
+        return balance_eth
 
     def set_address(self, address: str) -> None:
         """Set the connected wallet address.
@@ -1,18 +1,34 @@
-from typing import Any
+from dataclasses import dataclass
 
-NETWORK_CONFIGS: dict[str, dict[str, Any]] = {
-    "flare": {
-        "name": "Flare",
-        "chain_id": 14,
-        "rpc_url": "https://flare-api.flare.network/ext/C/rpc",
-        "explorer_url": "https://flare-explorer.flare.network",
-        "native_symbol": "FLR",
-    },
-    "arbitrum": {
-        "name": "Arbitrum One",
-        "chain_id": 42161,
-        "rpc_url": "https://arb1.arbitrum.io/rpc",
-        "explorer_url": "https://arbiscan.io",
-        "native_symbol": "ETH",
-    },
+
+@dataclass(frozen=True, slots=True)
+class NetworkConfig:
+    """Static per-network settings.
+
+    Frozen with slots so config reads are plain attribute loads and the
+    module-level table cannot be mutated by callers.
+    """
+
+    name: str
+    chain_id: int
+    rpc_url: str
+    explorer_url: str
+    native_symbol: str
+
+
+NETWORK_CONFIGS: dict[str, NetworkConfig] = {
+    "flare": NetworkConfig(
+        name="Flare",
+        chain_id=14,
+        rpc_url="https://flare-api.flare.network/ext/C/rpc",
+        explorer_url="https://flare-explorer.flare.network",
+        native_symbol="FLR",
+    ),
+    "arbitrum": NetworkConfig(
+        name="Arbitrum One",
+        chain_id=42161,
+        rpc_url="https://arb1.arbitrum.io/rpc",
+        explorer_url="https://arbiscan.io",
+        native_symbol="ETH",
+    ),
 }
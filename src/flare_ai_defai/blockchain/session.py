@@ -0,0 +1,32 @@
+"""
+Shared HTTP Session Module
+
+Provides a process-wide pooled requests.Session for the Web3 HTTP providers,
+so every RPC-issuing component reuses the same keep-alive connections
+instead of paying TCP/TLS setup per provider (or per call).
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+
+_session: requests.Session | None = None
+
+
+def pooled_session() -> requests.Session:
+    """Return the process-wide keep-alive session for RPC providers.
+
+    The session mounts adapters with generous connection pools; all Web3
+    HTTPProvider instances in the process share it, so repeat RPCs to the
+    same endpoint reuse one TCP/TLS connection.
+
+    Returns:
+        The shared pooled session
+    """
+    global _session  # noqa: PLW0603
+    if _session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _session = session
+    return _session
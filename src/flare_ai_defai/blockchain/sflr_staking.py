@@ -4,19 +4,50 @@ sFLR Staking Module
 This module provides functions to stake FLR tokens to sFLR on Flare Network.
 """
 
+import functools
 import logging
-from typing import Any
+import re
+from typing import Any, Final
 
 from web3 import Web3
+from web3.contract import Contract
 
-from flare_ai_defai.blockchain.abis.sflr import SFLR_ABI
+from flare_ai_defai.blockchain.abis import load_abi
+from flare_ai_defai.blockchain.session import pooled_session
+from flare_ai_defai.blockchain.tx_utils import hexify_tx
 
 # Configure logging
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
-# sFLR contract address on Flare Network
-SFLR_CONTRACT_ADDRESS = "0x12e605bc104e93B45e1aD99F9e555f659051c2BB"
+# sFLR contract address on Flare Network, checksummed once at import so
+# no per-call Keccak pass is needed
+SFLR_CONTRACT_ADDRESS: Final = Web3.to_checksum_address(
+    "0x12e605bc104e93B45e1aD99F9e555f659051c2BB"
+)
+
+@functools.lru_cache(maxsize=8)
+def _get_w3(url: str) -> Web3:
+    """Return a cached Web3 instance for the provider URL.
+
+    The shared keep-alive session means repeat calls reuse the same
+    TCP/TLS connection instead of handshaking per request.
+    """
+    return Web3(Web3.HTTPProvider(url, session=pooled_session()))
+
+
+@functools.lru_cache(maxsize=8)
+def _get_sflr_contract(url: str) -> Contract:
+    """Return the cached sFLR contract bound to the provider URL."""
+    return _get_w3(url).eth.contract(
+        address=SFLR_CONTRACT_ADDRESS,
+        abi=load_abi("sflr"),
+    )
+
+
+# Matches "stake <amount> flr" (or "flare") anywhere in the command;
+# compiled once so parsing a message is a single scan
+_STAKE_RE = re.compile(r"\bstake\s+([0-9]*\.?[0-9]+)\s+(?:flr|flare)\b", re.IGNORECASE)
 
 
 def stake_flr_to_sflr(
@@ -38,42 +69,46 @@ def stake_flr_to_sflr(
         Dict containing transaction details
     """
     try:
-        # Initialize Web3
-        w3 = Web3(Web3.HTTPProvider(web3_provider_url))
+        # Web3 instance and contract are cached per provider URL
+        w3 = _get_w3(web3_provider_url)
+        contract = _get_sflr_contract(web3_provider_url)
 
         # Convert wallet address to checksum address
         wallet_address = w3.to_checksum_address(wallet_address)
-        contract_address = w3.to_checksum_address(SFLR_CONTRACT_ADDRESS)
-
-        # Initialize the contract
-        contract = w3.eth.contract(address=contract_address, abi=SFLR_ABI)
 
         # Convert amount to Wei
         amount_wei = w3.to_wei(amount, "ether")
 
-        # Get the nonce
+        # Read the chain state once up front; one eth_feeHistory call
+        # yields both the base fee and the tip, replacing the separate
+        # eth_gasPrice and eth_maxPriorityFeePerGas round-trips
         nonce = w3.eth.get_transaction_count(wallet_address)
+        history = w3.eth.fee_history(1, "latest", [50])
+        base_fee = history["baseFeePerGas"][-1]
+        rewards = history.get("reward")
+        if rewards and rewards[0]:
+            priority_fee = rewards[0][0]
+        else:
+            # Some providers return an empty reward list (e.g. for empty
+            # blocks); fall back to the dedicated RPC
+            priority_fee = w3.eth.max_priority_fee
+        chain_id = w3.eth.chain_id
 
         # Build the transaction using contract function
         transaction = contract.functions.submit().build_transaction({
             "from": wallet_address,
             "value": amount_wei,  # Amount of FLR to stake
             "gas": 300000,  # Higher gas limit for safety
-            "maxFeePerGas": w3.eth.gas_price * 2,  # Double gas price for better chances
-            "maxPriorityFeePerGas": w3.eth.max_priority_fee,
+            # Double base fee plus tip for better chances
+            "maxFeePerGas": base_fee * 2 + priority_fee,
+            "maxPriorityFeePerGas": priority_fee,
             "nonce": nonce,
-            "chainId": w3.eth.chain_id,
+            "chainId": chain_id,
             "type": 2,  # EIP-1559 transaction type
         })
 
         # Convert numeric values to hex strings for JSON serialization
-        transaction["value"] = hex(transaction["value"])
-        transaction["gas"] = hex(transaction["gas"])
-        transaction["maxFeePerGas"] = hex(transaction["maxFeePerGas"])
-        transaction["maxPriorityFeePerGas"] = hex(transaction["maxPriorityFeePerGas"])
-        transaction["nonce"] = hex(transaction["nonce"])
-        transaction["chainId"] = hex(transaction["chainId"])
-        transaction["type"] = "0x2"
+        hexify_tx(transaction)
 
         return {
             "status": "success",
@@ -99,17 +134,13 @@ async def get_sflr_balance(
         Dict containing balance details
     """
     try:
-        # Initialize Web3
-        w3 = Web3(Web3.HTTPProvider(web3_provider_url))
+        # Web3 instance and contract are cached per provider URL
+        w3 = _get_w3(web3_provider_url)
+        sflr_contract = _get_sflr_contract(web3_provider_url)
 
         # Convert wallet address to checksum address
         wallet_address = w3.to_checksum_address(wallet_address)
 
-        # Initialize sFLR contract
-        sflr_contract = w3.eth.contract(
-            address=w3.to_checksum_address(SFLR_CONTRACT_ADDRESS), abi=SFLR_ABI
-        )
-
         # Get sFLR balance
         balance_wei = sflr_contract.functions.balanceOf(wallet_address).call()
         balance = w3.from_wei(balance_wei, "ether")
@@ -135,33 +166,20 @@ async def parse_stake_command(command: str) -> dict[str, Any]:
         Dict containing parsed staking parameters
     """
     try:
-        # Split the command into words
-        words = command.lower().split()
-
         # Look for patterns like "stake 1 flr" or "stake 2.5 flr to sflr"
-        amount = None
-        for i, word in enumerate(words):
-            if word == "stake" and i + 2 < len(words):
-                try:
-                    amount = float(words[i + 1])
-                    # Verify the token is FLR
-                    if words[i + 2].lower() in ["flr", "flare"]:
-                        return {
-                            "status": "success",
-                            "amount": amount,
-                            "token": "FLR",
-                            "action": "stake",
-                        }
-                except ValueError:
-                    continue
-
-        if amount is None:
+        match = _STAKE_RE.search(command)
+        if match:
             return {
-                "status": "error",
-                "message": "Could not parse staking amount from command",
+                "status": "success",
+                "amount": float(match.group(1)),
+                "token": "FLR",
+                "action": "stake",
             }
 
-        return {"status": "error", "message": "Invalid staking command format"}
+        return {
+            "status": "error",
+            "message": "Could not parse staking amount from command",
+        }
     except Exception as e:
         logger.error(f"Error parsing stake command: {e!s}")
         return {"status": "error", "message": f"Failed to parse stake command: {e!s}"}
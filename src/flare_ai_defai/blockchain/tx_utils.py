@@ -0,0 +1,18 @@
+"""Shared transaction serialization helpers.
+
+Built transactions are handed to wallet clients as JSON, which expects
+the EVM integer fields as hex strings. The conversion lives here so the
+swap and staking modules share one implementation.
+"""
+
+from typing import Any
+
+# Integer transaction fields converted to hex strings for JSON clients
+HEX_TX_FIELDS = ("value", "gas", "maxFeePerGas", "maxPriorityFeePerGas", "nonce", "chainId")
+
+
+def hexify_tx(tx: dict[str, Any]) -> dict[str, Any]:
+    """Convert a built transaction's integer fields to hex in place."""
+    tx.update({key: hex(tx[key]) for key in HEX_TX_FIELDS if key in tx})
+    tx["type"] = "0x2"
+    return tx
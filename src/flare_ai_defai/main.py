@@ -16,6 +16,11 @@ import structlog
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+try:  # Optional: orjson serializes responses several times faster
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:  # pragma: no cover - orjson is an optional accelerator
+    from fastapi.responses import JSONResponse as DefaultResponse
+
 from flare_ai_defai import (
     ChatRouter,
     FlareProvider,
@@ -58,6 +63,7 @@ def create_app() -> FastAPI:
         title="Flare AI DeFi",
         description="AI-powered DeFi agent on Flare Network",
         version="0.1.0",
+        default_response_class=DefaultResponse,
     )
 
     # Configure CORS middleware with settings from configuration
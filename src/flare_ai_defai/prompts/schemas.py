@@ -18,6 +18,36 @@ from typing import TypedDict
 
 from pydantic import BaseModel
 
+# A parsed template is a flat list of literal strings and
+# (placeholder_name, original_text) pairs; rendering is then a join
+# instead of a full regex scan of the template per format() call
+_TemplateParts = list[str | tuple[str, str]]
+
+
+def _parse_template(template: str) -> _TemplateParts:
+    """Split a string.Template body into literals and placeholders.
+
+    Mirrors Template.safe_substitute semantics: ``$$`` collapses to a
+    literal ``$`` and malformed or unknown placeholders keep their
+    original text.
+    """
+    parts: _TemplateParts = []
+    pos = 0
+    for match in Template.pattern.finditer(template):
+        if match.start() > pos:
+            parts.append(template[pos : match.start()])
+        named = match.group("named") or match.group("braced")
+        if named is not None:
+            parts.append((named, match.group()))
+        elif match.group("escaped") is not None:
+            parts.append("$")
+        else:
+            parts.append(match.group())
+        pos = match.end()
+    if pos < len(template):
+        parts.append(template[pos:])
+    return parts
+
 
 class SemanticRouterResponse(str, Enum):
     """
@@ -135,6 +165,13 @@ class Prompt:
     category: str | None = None
     version: str = "1.0"
 
+    def __post_init__(self) -> None:
+        # Parse the template once at construction; the large semantic
+        # router prompt is rendered on every user message and the scan
+        # inside Template.safe_substitute is pure overhead after the
+        # first pass
+        self._parts = _parse_template(self.template)
+
     def format(self, **kwargs: str | PromptInputs) -> str:
         """
         Format the prompt template with provided input values.
@@ -167,14 +204,21 @@ class Prompt:
         if not self.required_inputs:
             return self.template
 
-        try:
-            return Template(self.template).safe_substitute(**kwargs)
-        except KeyError as e:
-            missing_keys = set(self.required_inputs) - set(kwargs.keys())
-            if missing_keys:
-                msg = f"Missing required inputs: {missing_keys}"
-                raise ValueError(msg) from e
-            raise
+        missing_keys = set(self.required_inputs) - set(kwargs.keys())
+        if missing_keys:
+            msg = f"Missing required inputs: {', '.join(sorted(missing_keys))}"
+            raise ValueError(msg)
+
+        # Render from the pre-parsed parts; placeholders without a value
+        # keep their original text, matching safe_substitute
+        pieces: list[str] = []
+        for part in self._parts:
+            if part.__class__ is str:
+                pieces.append(part)  # type: ignore[arg-type]
+            else:
+                name, original = part  # type: ignore[misc]
+                pieces.append(str(kwargs[name]) if name in kwargs else original)
+        return "".join(pieces)
 
 
 class PortfolioAnalysisResponse(BaseModel):
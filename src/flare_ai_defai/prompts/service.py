@@ -16,6 +16,7 @@ Example:
     ```
 """
 
+import functools
 from typing import Any
 
 import structlog
@@ -62,6 +63,10 @@ class PromptService:
         """
         self.library = PromptLibrary()
         self.logger = logger.bind(service="prompt")
+        # Per-instance memoized lookup: prompt objects are immutable after
+        # library construction, so repeated name lookups on the hot request
+        # path skip the library's membership check and logging machinery
+        self._get_prompt = functools.lru_cache(maxsize=64)(self.library.get_prompt)
 
     def get_formatted_prompt(
         self, prompt_name: str, **kwargs: Any
@@ -106,7 +111,7 @@ class PromptService:
             - Exceptions during prompt formatting with prompt name and error details
         """
         try:
-            prompt = self.library.get_prompt(prompt_name)
+            prompt = self._get_prompt(prompt_name)
             formatted = prompt.format(**kwargs)
         except Exception as e:
             self.logger.exception(
@@ -1,4 +1,6 @@
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from typing import Any, Protocol, TypedDict, runtime_checkable
 
@@ -6,9 +8,13 @@ import httpx
 import requests
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelResponse:
-    """Standardized response format for all AI models"""
+    """Standardized response format for all AI models.
+
+    Slotted: one of these is allocated per model call, and slots skip
+    the per-instance __dict__.
+    """
 
     text: str
     raw_response: Any  # Original provider response
@@ -73,6 +79,53 @@ class BaseAIProvider(ABC):
             ModelResponse containing the response text and metadata
         """
 
+    async def agenerate_content(
+        self,
+        prompt: str,
+        response_mime_type: str | None = None,
+        response_schema: Any | None = None,
+    ) -> ModelResponse:
+        """Async variant of generate_content.
+
+        Providers with a native async client override this; the default
+        runs the blocking implementation in a worker thread so bot event
+        loops are never stalled by a model round-trip.
+        """
+        return await asyncio.to_thread(
+            self.generate_content, prompt, response_mime_type, response_schema
+        )
+
+    async def asend_message(self, msg: str) -> ModelResponse:
+        """Async variant of send_message; see agenerate_content."""
+        return await asyncio.to_thread(self.send_message, msg)
+
+    async def generate_content_stream(self, prompt: str) -> AsyncIterator[str]:
+        """Stream stateless content generation as text fragments.
+
+        The default yields the complete response in one fragment;
+        providers with native streaming override this.
+        """
+        yield (await self.agenerate_content(prompt)).text
+
+    async def send_message_stream(self, msg: str) -> AsyncIterator[str]:
+        """Stream a chat reply as text fragments.
+
+        The default yields the complete reply in one fragment; providers
+        with native streaming override this to yield tokens as they
+        arrive.
+        """
+        yield (await self.asend_message(msg)).text
+
+    async def send_messages_batch(self, prompts: list[str]) -> list[ModelResponse]:
+        """Answer independent prompts concurrently.
+
+        The default fans out agenerate_content; providers that can
+        amortize work across a batch override this.
+        """
+        return list(
+            await asyncio.gather(*(self.agenerate_content(p) for p in prompts))
+        )
+
 
 class Message(TypedDict):
     role: str
@@ -0,0 +1,110 @@
+"""
+Semantic Response Cache
+
+In-memory embedding cache for AI provider responses. Paraphrased repeats
+of recent questions ("Flare price?" vs "what's FLR worth?") are answered
+from the cache by cosine similarity instead of paying a full model
+round-trip.
+"""
+
+import time
+
+import numpy as np
+
+# Cosine similarity at or above this counts as a semantic repeat
+DEFAULT_THRESHOLD = 0.92
+
+# Entries expire after an hour; bot topics drift and stale answers are
+# worse than a cache miss
+DEFAULT_TTL = 3600.0
+
+DEFAULT_CAPACITY = 1024
+
+
+class SemanticCache:
+    """Fixed-capacity embedding cache with TTL and LRU eviction.
+
+    Embeddings are L2-normalized on insert and min-max quantized to
+    uint8 rows of a preallocated matrix (4x smaller than float32, with
+    the per-row scale and offset kept aside), so a lookup is one
+    matrix-vector product over at most `capacity` rows.
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        ttl: float = DEFAULT_TTL,
+        threshold: float = DEFAULT_THRESHOLD,
+    ) -> None:
+        self.capacity = capacity
+        self.ttl = ttl
+        self.threshold = threshold
+        self._matrix: np.ndarray | None = None  # allocated on first store
+        self._responses: list[str | None] = [None] * capacity
+        # Per-row dequantization parameters: row ~= q * scale + offset,
+        # and inv_norm corrects the residual quantization error so the
+        # scores stay true cosines
+        self._scales = np.zeros(capacity, dtype=np.float32)
+        self._offsets = np.zeros(capacity, dtype=np.float32)
+        self._inv_norms = np.zeros(capacity, dtype=np.float32)
+        self._created = np.zeros(capacity)
+        self._last_used = np.zeros(capacity)
+        self._count = 0
+
+    @staticmethod
+    def _normalize(embedding: list[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector
+
+    def lookup(self, embedding: list[float]) -> str | None:
+        """Return the cached response most similar to `embedding`, if any
+        live entry clears the similarity threshold."""
+        if self._count == 0 or self._matrix is None:
+            return None
+        query = self._normalize(embedding)
+        now = time.monotonic()
+        count = self._count
+        # Dot products against dequantized rows without materializing
+        # them: (q*scale + offset) . query == (q . query)*scale +
+        # offset*sum(query)
+        scores = (
+            (self._matrix[:count].astype(np.float32) @ query) * self._scales[:count]
+            + self._offsets[:count] * float(query.sum())
+        ) * self._inv_norms[:count]
+        # Mask out expired entries rather than evicting eagerly; their
+        # slots are reused by the LRU eviction on store
+        scores[now - self._created[: self._count] > self.ttl] = -1.0
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+        self._last_used[best] = now
+        return self._responses[best]
+
+    def store(self, embedding: list[float], response: str) -> None:
+        """Insert a response, evicting the least recently used entry when
+        the cache is full."""
+        query = self._normalize(embedding)
+        if self._matrix is None:
+            self._matrix = np.zeros((self.capacity, query.shape[0]), dtype=np.uint8)
+        if self._count < self.capacity:
+            slot = self._count
+            self._count += 1
+        else:
+            slot = int(np.argmin(self._last_used))
+        offset = float(query.min())
+        scale = (float(query.max()) - offset) / 255.0 or 1.0
+        quantized = np.round((query - offset) / scale).astype(np.uint8)
+        norm = float(
+            np.linalg.norm(quantized.astype(np.float32) * scale + offset)
+        )
+        now = time.monotonic()
+        self._matrix[slot] = quantized
+        self._scales[slot] = scale
+        self._offsets[slot] = offset
+        self._inv_norms[slot] = 1.0 / norm if norm > 0 else 0.0
+        self._responses[slot] = response
+        self._created[slot] = now
+        self._last_used[slot] = now
@@ -6,16 +6,80 @@ with OpenAI's API service. It handles chat sessions, content generation,
 and message management while maintaining a consistent AI personality.
 """
 
+import hashlib
+import json
+import threading
+from collections import OrderedDict, deque
+import asyncio
+from collections.abc import AsyncIterator
 from typing import Any, override
 
 import structlog
 import openai
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from flare_ai_social.ai.base import BaseAIProvider, ModelResponse, Message
+from flare_ai_social.ai.cache import SemanticCache
+from flare_ai_social.ai.rate_limit import AsyncTokenBucket
+
+try:  # exact token counts when the tokenizer is installed
+    import tiktoken
+except ImportError:
+    tiktoken = None
 
 logger = structlog.get_logger(__name__)
 
+# Exact-repeat responses kept; retries and monitor loops make duplicate
+# calls common enough that a small LRU pays for itself
+EXACT_CACHE_CAPACITY = 512
+
+# History is bounded both by turn count and by a character budget
+# (~4 chars per token, so 8000 chars is roughly a 2k-token prompt);
+# without a cap, per-turn prompt cost grows with session length
+HISTORY_MAX_TURNS = 50
+MAX_PROMPT_CHARS = 8000
+
+# One client pair per API key, shared across provider instances so they
+# reuse a single connection pool instead of re-handshaking per provider
+_clients_lock = threading.Lock()
+_sync_clients: dict[str, OpenAI] = {}
+_async_clients: dict[str, AsyncOpenAI] = {}
+_buckets: dict[str, AsyncTokenBucket] = {}
+
+# Encoders are shared at module scope; construction costs ~100ms and the
+# same model is typically used by every provider instance
+_encoders: dict[str, Any] = {}
+
+# Shared response_format for JSON-mode requests; treated as immutable
+_JSON_FORMAT = {"type": "json_object"}
+
+
+def _encoder_for(model_name: str) -> Any | None:
+    """Return the shared tiktoken encoder for a model, or None when
+    tiktoken is not installed."""
+    if tiktoken is None:
+        return None
+    encoder = _encoders.get(model_name)
+    if encoder is None:
+        try:
+            encoder = tiktoken.encoding_for_model(model_name)
+        except KeyError:
+            encoder = tiktoken.get_encoding("cl100k_base")
+        _encoders[model_name] = encoder
+    return encoder
+
+
+def _shared_clients(api_key: str) -> tuple[OpenAI, AsyncOpenAI, AsyncTokenBucket]:
+    """Return the shared (sync client, async client, rate bucket) for an
+    API key; rate limits are per account, so the bucket is shared too."""
+    with _clients_lock:
+        client = _sync_clients.get(api_key)
+        if client is None:
+            client = _sync_clients[api_key] = OpenAI(api_key=api_key)
+            _async_clients[api_key] = AsyncOpenAI(api_key=api_key)
+            _buckets[api_key] = AsyncTokenBucket()
+        return client, _async_clients[api_key], _buckets[api_key]
+
 
 class OpenAIProvider(BaseAIProvider):
     """
@@ -44,18 +108,29 @@ class OpenAIProvider(BaseAIProvider):
             model_name (str): OpenAI model identifier to use (e.g., "gpt-4", "gpt-3.5-turbo")
             system_instruction (str | None): Custom system prompt for the AI personality
         """
-        self.client = OpenAI(api_key=api_key)
+        self.client, self.aclient, self._bucket = _shared_clients(api_key)
         self.model_name = model_name
+        self._enc = _encoder_for(model_name)
         self.system_instruction = system_instruction
-        self.chat_history: list[dict[str, str]] = []
+        self._system_msg = (
+            {"role": "system", "content": system_instruction}
+            if system_instruction
+            else None
+        )
+        # User/assistant turns only; the system message is prepended at
+        # request time so history trimming can never drop it
+        self.chat_history: deque[dict[str, str]] = deque(maxlen=HISTORY_MAX_TURNS)
+        self._semantic_cache = SemanticCache()
+        self._exact_cache: OrderedDict[str, str] = OrderedDict()
+        # In-flight async requests by exact key; duplicates arriving
+        # before the first response lands await the same future
+        self._inflight: dict[str, asyncio.Future] = {}
         
-        # Initialize with system message if provided
-        if system_instruction:
-            self.chat_history.append({"role": "system", "content": system_instruction})
-            
         self.logger = logger.bind(service="openai")
         self.logger.info(
-            "model setup", model_name="gemini-2.0-pro", system_instruction=system_instruction
+            "model setup",
+            model_name=model_name,
+            has_system_instruction=bool(system_instruction),
         )
 
     @override
@@ -65,10 +140,137 @@ class OpenAIProvider(BaseAIProvider):
 
         Clears chat history, maintaining only the system instruction if present.
         """
-        self.chat_history = []
-        if self.system_instruction:
-            self.chat_history.append({"role": "system", "content": self.system_instruction})
-        self.logger.debug("reset_openai", chat_history=self.chat_history)
+        self.chat_history.clear()
+        self.logger.debug("reset_openai", chat_history_len=len(self.chat_history))
+
+    EMBEDDING_MODEL = "text-embedding-3-small"
+
+    def _exact_key(
+        self, messages: list[dict[str, str]], response_format: Any = None
+    ) -> str:
+        """Deterministic digest of the full request; temperature is left
+        at the API default here, so identical requests repeat responses."""
+        payload = json.dumps(
+            {"model": self.model_name, "messages": messages, "rf": response_format},
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _exact_lookup(self, key: str) -> str | None:
+        cached = self._exact_cache.get(key)
+        if cached is not None:
+            self._exact_cache.move_to_end(key)
+        return cached
+
+    def _exact_store(self, key: str, response: str) -> None:
+        self._exact_cache[key] = response
+        if len(self._exact_cache) > EXACT_CACHE_CAPACITY:
+            self._exact_cache.popitem(last=False)
+
+    def _embed(self, text: str) -> list[float] | None:
+        """Embed text for the semantic cache; None disables caching for
+        this call (embedding failures must never fail the request)."""
+        try:
+            result = self.client.embeddings.create(
+                model=self.EMBEDDING_MODEL, input=text
+            )
+        except Exception:
+            self.logger.debug("embedding_failed")
+            return None
+        return result.data[0].embedding
+
+    async def _aembed(self, text: str) -> list[float] | None:
+        """Async variant of _embed."""
+        try:
+            result = await self.aclient.embeddings.create(
+                model=self.EMBEDDING_MODEL, input=text
+            )
+        except Exception:
+            self.logger.debug("embedding_failed")
+            return None
+        return result.data[0].embedding
+
+    def _cache_key_text(self, msg: str) -> str:
+        """Cache key for chat messages: the new turn plus recent context,
+        so semantically equal questions in different conversations only
+        collide when their context also matches."""
+        recent = [turn["content"] for turn in list(self.chat_history)[-2:]]
+        return "\n".join([*recent, msg])
+
+    @staticmethod
+    def _cached_response(text: str, kind: str = "semantic_hit") -> ModelResponse:
+        return ModelResponse(
+            text=text,
+            raw_response=None,
+            metadata={"cache": kind},
+        )
+
+    @staticmethod
+    def _model_response(response: Any) -> ModelResponse:
+        """Convert a chat completion into the shared ModelResponse shape."""
+        return ModelResponse(
+            text=response.choices[0].message.content or "",
+            raw_response=response,
+            metadata={
+                "model": response.model,
+                "usage": {
+                    "prompt_tokens": response.usage.prompt_tokens,
+                    "completion_tokens": response.usage.completion_tokens,
+                    "total_tokens": response.usage.total_tokens,
+                },
+                "finish_reason": response.choices[0].finish_reason,
+            },
+        )
+
+    @staticmethod
+    def _response_format(
+        response_mime_type: str | None, response_schema: Any | None
+    ) -> dict[str, str] | None:
+        if response_mime_type == "application/json" or response_schema is not None:
+            return _JSON_FORMAT
+        return None
+
+    # Generous completion allowance added to each request's estimate
+    MAX_COMPLETION_ESTIMATE = 512
+
+    def _estimate_tokens(self, messages: list[dict[str, str]]) -> int:
+        """Prompt token count plus completion room, for proactive
+        throttling.
+
+        Counted exactly with the shared tiktoken encoder when it is
+        installed (~4 overhead tokens per message plus 3 priming the
+        reply); otherwise estimated at ~4 chars/token.
+        """
+        if self._enc is not None:
+            prompt_tokens = (
+                sum(len(self._enc.encode(m["content"])) + 4 for m in messages) + 3
+            )
+        else:
+            prompt_tokens = sum(len(m["content"]) for m in messages) // 4
+        return prompt_tokens + self.MAX_COMPLETION_ESTIMATE
+
+    def _conversation(self, msg: str) -> list[dict[str, str]]:
+        """Full request message list for a new chat turn, built in one
+        list display so the list is allocated at its final size."""
+        user_msg = {"role": "user", "content": msg}
+        if self._system_msg:
+            return [self._system_msg, *self.chat_history, user_msg]
+        return [*self.chat_history, user_msg]
+
+    def _record_turn(self, msg: str, response_text: str) -> None:
+        """Append a completed turn and trim to the character budget,
+        dropping the oldest turns first."""
+        self.chat_history.append({"role": "user", "content": msg})
+        self.chat_history.append({"role": "assistant", "content": response_text})
+        total = sum(len(turn["content"]) for turn in self.chat_history)
+        while total > MAX_PROMPT_CHARS and len(self.chat_history) > 2:
+            total -= len(self.chat_history.popleft()["content"])
+
+    def _build_prompt_messages(self, prompt: str) -> list[dict[str, str]]:
+        user_msg = {"role": "user", "content": prompt}
+        if self._system_msg:
+            return [self._system_msg, user_msg]
+        return [user_msg]
 
     @override
     def generate_content(
@@ -91,38 +293,31 @@ class OpenAIProvider(BaseAIProvider):
                 - raw_response: Complete OpenAI response object
                 - metadata: Additional response information
         """
-        messages = []
-        if self.system_instruction:
-            messages.append({"role": "system", "content": self.system_instruction})
-        messages.append({"role": "user", "content": prompt})
-        
-        # Configure response format if needed
-        response_format = None
-        if response_mime_type == "application/json" or (response_schema is not None):
-            response_format = {"type": "json_object"}
-        
+        messages = self._build_prompt_messages(prompt)
+        response_format = self._response_format(response_mime_type, response_schema)
+
+        # Exact repeats skip even the embedding call
+        exact_key = self._exact_key(messages, response_format)
+        exact = self._exact_lookup(exact_key)
+        if exact is not None:
+            return self._cached_response(exact, "exact_hit")
+
+        embedding = self._embed(prompt)
+        if embedding is not None:
+            cached = self._semantic_cache.lookup(embedding)
+            if cached is not None:
+                return self._cached_response(cached)
+
         response = self.client.chat.completions.create(
             model=self.model_name,
             messages=messages,
             response_format=response_format,
         )
-        
-        # Extract the response text
-        response_text = response.choices[0].message.content or ""
-        
-        return ModelResponse(
-            text=response_text,
-            raw_response=response,
-            metadata={
-                "model": response.model,
-                "usage": {
-                    "prompt_tokens": response.usage.prompt_tokens,
-                    "completion_tokens": response.usage.completion_tokens,
-                    "total_tokens": response.usage.total_tokens,
-                },
-                "finish_reason": response.choices[0].finish_reason,
-            },
-        )
+        result = self._model_response(response)
+        self._exact_store(exact_key, result.text)
+        if embedding is not None:
+            self._semantic_cache.store(embedding, result.text)
+        return result
 
     @override
     def send_message(self, msg: str) -> ModelResponse:
@@ -140,33 +335,261 @@ class OpenAIProvider(BaseAIProvider):
                 - raw_response: Complete OpenAI response object
                 - metadata: Additional response information
         """
-        # Add user message to history
-        self.chat_history.append({"role": "user", "content": msg})
-        
-        # Send the complete conversation history
+        messages = self._conversation(msg)
+        exact_key = self._exact_key(messages)
+        exact = self._exact_lookup(exact_key)
+        if exact is not None:
+            self._record_turn(msg, exact)
+            return self._cached_response(exact, "exact_hit")
+
+        embedding = self._embed(self._cache_key_text(msg))
+        if embedding is not None:
+            cached = self._semantic_cache.lookup(embedding)
+            if cached is not None:
+                self._record_turn(msg, cached)
+                return self._cached_response(cached)
+
+        # Send the bounded conversation history
         response = self.client.chat.completions.create(
             model=self.model_name,
-            messages=self.chat_history,
+            messages=messages,
         )
         
-        # Extract the response text
-        response_text = response.choices[0].message.content or ""
-        
-        # Add assistant response to history
-        self.chat_history.append({"role": "assistant", "content": response_text})
+        result = self._model_response(response)
+        self._exact_store(exact_key, result.text)
+        if embedding is not None:
+            self._semantic_cache.store(embedding, result.text)
+        self._record_turn(msg, result.text)
         
-        self.logger.debug("send_message", msg=msg, response_text=response_text)
+        self.logger.debug(
+            "send_message", msg_len=len(msg), response_len=len(result.text)
+        )
         
-        return ModelResponse(
-            text=response_text,
-            raw_response=response,
-            metadata={
-                "model": response.model,
-                "usage": {
-                    "prompt_tokens": response.usage.prompt_tokens,
-                    "completion_tokens": response.usage.completion_tokens,
-                    "total_tokens": response.usage.total_tokens,
-                },
-                "finish_reason": response.choices[0].finish_reason,
-            },
+        return result
+
+    async def _coalesced_completion(
+        self,
+        exact_key: str,
+        messages: list[dict[str, str]],
+        response_format: dict[str, str] | None = None,
+    ) -> ModelResponse:
+        """Issue at most one completion per identical in-flight request.
+
+        The caches cannot catch a burst of identical prompts because
+        the first response has not landed yet; duplicates here await
+        the first call's future instead of issuing their own.
+        """
+        inflight = self._inflight.get(exact_key)
+        if inflight is not None:
+            return await inflight
+        future: asyncio.Future[ModelResponse] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._inflight[exact_key] = future
+        try:
+            await self._bucket.acquire(self._estimate_tokens(messages))
+            kwargs: dict[str, Any] = {"model": self.model_name, "messages": messages}
+            if response_format is not None:
+                kwargs["response_format"] = response_format
+            response = await self.aclient.chat.completions.create(**kwargs)
+            result = self._model_response(response)
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark retrieved so a lone caller doesn't trigger the
+            # "exception was never retrieved" warning
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._inflight[exact_key]
+
+    @override
+    async def agenerate_content(
+        self,
+        prompt: str,
+        response_mime_type: str | None = None,
+        response_schema: Any | None = None,
+    ) -> ModelResponse:
+        """Generate content via the async client without blocking the loop."""
+        messages = self._build_prompt_messages(prompt)
+        response_format = self._response_format(response_mime_type, response_schema)
+
+        exact_key = self._exact_key(messages, response_format)
+        exact = self._exact_lookup(exact_key)
+        if exact is not None:
+            return self._cached_response(exact, "exact_hit")
+
+        embedding = await self._aembed(prompt)
+        if embedding is not None:
+            cached = self._semantic_cache.lookup(embedding)
+            if cached is not None:
+                return self._cached_response(cached)
+
+        result = await self._coalesced_completion(exact_key, messages, response_format)
+        self._exact_store(exact_key, result.text)
+        if embedding is not None:
+            self._semantic_cache.store(embedding, result.text)
+        return result
+
+    @override
+    async def send_messages_batch(self, prompts: list[str]) -> list[ModelResponse]:
+        """Answer independent prompts with one embedding request and
+        concurrent completions.
+
+        The semantic-cache embeddings for the whole batch come from a
+        single embeddings.create call, and only cache misses fan out to
+        chat completions under asyncio.gather, so wall clock tracks the
+        slowest single request instead of the sum.
+        """
+        if not prompts:
+            return []
+        try:
+            result = await self.aclient.embeddings.create(
+                model=self.EMBEDDING_MODEL, input=prompts
+            )
+            embeddings: list[list[float] | None] = [
+                item.embedding for item in result.data
+            ]
+        except Exception:
+            self.logger.debug("embedding_failed")
+            embeddings = [None] * len(prompts)
+
+        responses: list[ModelResponse | None] = [None] * len(prompts)
+        misses = []
+        for i, embedding in enumerate(embeddings):
+            if embedding is not None:
+                cached = self._semantic_cache.lookup(embedding)
+                if cached is not None:
+                    responses[i] = self._cached_response(cached)
+                    continue
+            misses.append(i)
+
+        async def complete(i: int) -> ModelResponse:
+            messages = self._build_prompt_messages(prompts[i])
+            await self._bucket.acquire(self._estimate_tokens(messages))
+            response = await self.aclient.chat.completions.create(
+                model=self.model_name,
+                messages=messages,
+            )
+            model_response = self._model_response(response)
+            if embeddings[i] is not None:
+                self._semantic_cache.store(embeddings[i], model_response.text)
+            return model_response
+
+        for i, model_response in zip(
+            misses,
+            await asyncio.gather(*(complete(i) for i in misses)),
+            strict=True,
+        ):
+            responses[i] = model_response
+        return responses  # type: ignore[return-value]
+
+    @override
+    async def generate_content_stream(self, prompt: str) -> AsyncIterator[str]:
+        """Stream stateless content generation token-by-token.
+
+        Reads and records no conversation history: one provider
+        instance is shared by every Telegram chat and the Twitter bot,
+        so the chat-session deque must not mix independent users.
+        """
+        messages = self._build_prompt_messages(prompt)
+        exact_key = self._exact_key(messages)
+        exact = self._exact_lookup(exact_key)
+        if exact is not None:
+            yield exact
+            return
+
+        embedding = await self._aembed(prompt)
+        if embedding is not None:
+            cached = self._semantic_cache.lookup(embedding)
+            if cached is not None:
+                yield cached
+                return
+
+        await self._bucket.acquire(self._estimate_tokens(messages))
+        stream = await self.aclient.chat.completions.create(
+            model=self.model_name,
+            messages=messages,
+            stream=True,
+        )
+        parts: list[str] = []
+        async for chunk in stream:
+            token = chunk.choices[0].delta.content if chunk.choices else None
+            if token:
+                parts.append(token)
+                yield token
+        text = "".join(parts)
+        self._exact_store(exact_key, text)
+        if embedding is not None:
+            self._semantic_cache.store(embedding, text)
+
+    @override
+    async def send_message_stream(self, msg: str) -> AsyncIterator[str]:
+        """Stream a chat reply token-by-token.
+
+        Cache hits yield the full cached text at once; otherwise tokens
+        are yielded as they arrive and the completed reply is recorded
+        in the caches and chat history like asend_message.
+        """
+        messages = self._conversation(msg)
+        exact_key = self._exact_key(messages)
+        exact = self._exact_lookup(exact_key)
+        if exact is not None:
+            self._record_turn(msg, exact)
+            yield exact
+            return
+
+        embedding = await self._aembed(self._cache_key_text(msg))
+        if embedding is not None:
+            cached = self._semantic_cache.lookup(embedding)
+            if cached is not None:
+                self._record_turn(msg, cached)
+                yield cached
+                return
+
+        await self._bucket.acquire(self._estimate_tokens(messages))
+        stream = await self.aclient.chat.completions.create(
+            model=self.model_name,
+            messages=messages,
+            stream=True,
+        )
+        parts: list[str] = []
+        async for chunk in stream:
+            token = chunk.choices[0].delta.content if chunk.choices else None
+            if token:
+                parts.append(token)
+                yield token
+        text = "".join(parts)
+        self._exact_store(exact_key, text)
+        if embedding is not None:
+            self._semantic_cache.store(embedding, text)
+        self._record_turn(msg, text)
+
+    @override
+    async def asend_message(self, msg: str) -> ModelResponse:
+        """Send a chat message via the async client without blocking the loop."""
+        messages = self._conversation(msg)
+        exact_key = self._exact_key(messages)
+        exact = self._exact_lookup(exact_key)
+        if exact is not None:
+            self._record_turn(msg, exact)
+            return self._cached_response(exact, "exact_hit")
+
+        embedding = await self._aembed(self._cache_key_text(msg))
+        if embedding is not None:
+            cached = self._semantic_cache.lookup(embedding)
+            if cached is not None:
+                self._record_turn(msg, cached)
+                return self._cached_response(cached)
+
+        result = await self._coalesced_completion(exact_key, messages)
+        self._exact_store(exact_key, result.text)
+        if embedding is not None:
+            self._semantic_cache.store(embedding, result.text)
+        self._record_turn(msg, result.text)
+        self.logger.debug(
+            "send_message", msg_len=len(msg), response_len=len(result.text)
         )
+        return result
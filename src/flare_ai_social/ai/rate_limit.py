@@ -0,0 +1,51 @@
+"""
+Proactive Rate Limiting
+
+Token-bucket limiter applied before model calls so burst traffic queues
+locally instead of hitting the provider's 429 responses and paying the
+SDK's exponential backoff.
+"""
+
+import asyncio
+import time
+
+# Conservative defaults below typical gpt-4o account ceilings; bursts
+# above them wait locally instead of triggering 429 retries
+DEFAULT_RPM = 500
+DEFAULT_TPM = 200_000
+
+
+class AsyncTokenBucket:
+    """Combined request-and-token bucket with continuous refill.
+
+    Both budgets refill proportionally to elapsed time, so there is no
+    background replenishment task to manage; acquire() sleeps just long
+    enough for the tighter budget to recover.
+    """
+
+    def __init__(self, rpm: int = DEFAULT_RPM, tpm: int = DEFAULT_TPM) -> None:
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, est_tokens: int) -> None:
+        """Block until one request and `est_tokens` tokens are available."""
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._updated
+                self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+                self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+                self._updated = now
+                if self._requests >= 1 and self._tokens >= est_tokens:
+                    self._requests -= 1
+                    self._tokens -= est_tokens
+                    return
+                wait = max(
+                    (1 - self._requests) * 60 / self.rpm,
+                    (est_tokens - self._tokens) * 60 / self.tpm,
+                )
+            await asyncio.sleep(wait)
@@ -1,11 +1,11 @@
 import asyncio
 import contextlib
-import threading
 import os
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
-import google.generativeai as genai
 import structlog
 from anyio import Event
 from google.api_core.exceptions import InvalidArgument, NotFound
@@ -32,20 +32,28 @@ class BotManager:
         """Initialize the BotManager."""
         self.ai_provider: BaseAIProvider | None = None
         self.telegram_bot: TelegramBot | None = None
-        self.twitter_thread: threading.Thread | None = None
+        self.twitter_bot: TwitterBot | None = None
+        self._twitter_future: asyncio.Future | None = None
+        self._startup_tweet_task: asyncio.Task | None = None
         self.active_bots: list[str] = []
         self.running = False
         self._telegram_polling_task: asyncio.Task | None = None
 
+        # One pool for all blocking bot work; restarts reuse its threads
+        # instead of paying thread creation per restart, and a failure
+        # loop cannot grow the thread count without bound
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="botmgr")
+
+        # Set from done-callbacks when a bot's worker exits, so the
+        # monitor wakes immediately instead of polling
+        self._twitter_dead = asyncio.Event()
+        self._telegram_dead = asyncio.Event()
+
     def initialize_ai_provider(self) -> None:
         """Initialize the AI provider with either tuned model or default model."""
-        # NOTE(chris): We use the openrouter provider
-        genai.configure(api_key=settings.gemini_api_key)
-        tuned_model_id = settings.tuned_model_name
-
         try:
             if settings.openai_api_key:
-                logger.info("Using Gemini 2.0 Pro model")
+                logger.info("Using OpenAI gpt-4o model")
                 self.ai_provider = OpenAIProvider(
                     api_key=settings.openai_api_key,
                     model_name="gpt-4o",
@@ -65,7 +73,7 @@ class BotManager:
         """Initialize the default model."""
         # Choose which provider to use based on available API keys
         if settings.openai_api_key:
-            logger.info("Using model: Gemini-2.0-Pro")
+            logger.info("Using OpenAI gpt-4o model")
             self.ai_provider = OpenAIProvider(
                 api_key=settings.openai_api_key,
                 model_name="gpt-4o",
@@ -94,11 +102,27 @@ class BotManager:
 
     def _prompt_for_startup_tweet(self) -> str | None:
         """
-        Prompt the user for a topic to generate a startup tweet about.
-        
+        Determine the topic for the startup tweet.
+
+        The configured topic (settings.startup_tweet_topic /
+        STARTUP_TWEET_TOPIC) wins; the interactive prompt only runs on a
+        real TTY so headless deployments never block on stdin.
+
         Returns:
-            The user-provided topic or None if the user declines
+            The topic to tweet about, or None to skip the startup tweet
         """
+        topic = settings.startup_tweet_topic.strip()
+        if topic:
+            logger.info("Using configured startup tweet topic", topic=topic)
+            return topic
+
+        if not sys.stdin.isatty():
+            logger.warning(
+                "Startup tweet enabled but no topic configured and stdin "
+                "is not a TTY; skipping startup tweet"
+            )
+            return None
+
         print("\n=== Startup Tweet Generation ===")
         print("Would you like to post a tweet when starting the bot? (y/n)")
         response = input().strip().lower()
@@ -132,8 +156,8 @@ class BotManager:
         else:
             logger.warning("Failed to post startup tweet")
 
-    def start_twitter_bot(self) -> bool:
-        """Initialize and start the Twitter bot in a separate thread."""
+    async def start_twitter_bot(self) -> bool:
+        """Initialize and start the Twitter bot on an executor thread."""
         if not settings.enable_twitter:
             logger.info("Twitter bot disabled in settings")
             return False
@@ -171,36 +195,28 @@ class BotManager:
                 ai_provider=ai_provider,
                 config=config,
             )
+            self.twitter_bot = twitter_bot
             
-            # Ask user if they want to post a startup tweet
+            # Ask user if they want to post a startup tweet; the tweet is
+            # posted as a background task on this loop rather than a
+            # joined thread, so startup no longer stalls for the full
+            # generation round-trip
             if settings.tweet_generation_on_startup:
                 startup_tweet_topic = self._prompt_for_startup_tweet()
                 if startup_tweet_topic:
-                    # Create a new thread to run the async startup tweet function
-                    # This avoids the "asyncio.run() cannot be called from a running event loop" error
-                    def post_startup_tweet_thread():
-                        try:
-                            # Use a fresh event loop in this thread
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                            loop.run_until_complete(self._post_startup_tweet(twitter_bot, startup_tweet_topic))
-                            loop.close()
-                        except Exception as e:
-                            logger.exception(f"Error posting startup tweet: {str(e)}")
-                    
-                    # Run the async startup tweet posting in a separate thread
-                    startup_tweet_thread = threading.Thread(
-                        target=post_startup_tweet_thread,
-                        daemon=True,
-                        name="StartupTweetThread"
+                    self._startup_tweet_task = asyncio.create_task(
+                        self._post_startup_tweet(twitter_bot, startup_tweet_topic)
                     )
-                    startup_tweet_thread.start()
-                    startup_tweet_thread.join()  # Wait for the tweet to be posted before continuing
 
-            self.twitter_thread = threading.Thread(
-                target=twitter_bot.start, daemon=True, name="TwitterBotThread"
+            # twitter_bot.start blocks (it runs its own event loop), so it
+            # goes to the default executor instead of a hand-rolled thread
+            self._twitter_dead.clear()
+            self._twitter_future = asyncio.get_running_loop().run_in_executor(
+                self._executor, twitter_bot.start
+            )
+            self._twitter_future.add_done_callback(
+                lambda _f: self._twitter_dead.set()
             )
-            self.twitter_thread.start()
             logger.info("Twitter bot started in background thread")
             self.active_bots.append("Twitter")
 
@@ -235,9 +251,13 @@ class BotManager:
             )
 
             await self.telegram_bot.initialize()
+            self._telegram_dead.clear()
             self._telegram_polling_task = asyncio.create_task(
                 self.telegram_bot.start_polling()
             )
+            self._telegram_polling_task.add_done_callback(
+                lambda _t: self._telegram_dead.set()
+            )
             self.active_bots.append("Telegram")
 
         except Exception:
@@ -285,32 +305,63 @@ class BotManager:
                 logger.exception("Error restarting Telegram bot")
                 self.active_bots.remove("Telegram")
 
-    def _check_twitter_status(self) -> None:
+    async def _check_twitter_status(self) -> None:
         """Check and handle Twitter bot status."""
-        if self.twitter_thread and not self.twitter_thread.is_alive():
+        if self._twitter_future and self._twitter_future.done():
             logger.error("Twitter bot thread terminated unexpectedly")
             self.active_bots.remove("Twitter")
-            if self.start_twitter_bot():
+            if await self.start_twitter_bot():
                 logger.info("Twitter bot restarted successfully")
 
     async def monitor_bots(self) -> None:
-        """Monitor active bots and handle unexpected terminations."""
+        """Monitor active bots and handle unexpected terminations.
+
+        Waits on per-bot events that are set from done-callbacks when a
+        bot's task or worker future finishes, so a dead bot is handled
+        as soon as it exits and the loop is otherwise idle instead of
+        waking on a fixed polling interval.
+        """
         self.running = True
 
         try:
             while self.running and self.active_bots:
-                if "Telegram" in self.active_bots and self.telegram_bot:
-                    await self._check_telegram_status()
-
-                if "Twitter" in self.active_bots:
-                    self._check_twitter_status()
+                waiters = [
+                    asyncio.create_task(event.wait())
+                    for bot, event in (
+                        ("Telegram", self._telegram_dead),
+                        ("Twitter", self._twitter_dead),
+                    )
+                    if bot in self.active_bots
+                ]
+                _done, pending = await asyncio.wait(
+                    waiters, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in pending:
+                    task.cancel()
+
+                restarts = []
+                if self._telegram_dead.is_set() and "Telegram" in self.active_bots:
+                    self._telegram_dead.clear()
+                    restarts.append(self._check_telegram_status())
+
+                if self._twitter_dead.is_set() and "Twitter" in self.active_bots:
+                    self._twitter_dead.clear()
+                    restarts.append(self._check_twitter_status())
+
+                if restarts:
+                    # Restart dead bots in parallel; a slow Telegram
+                    # shutdown must not delay the Twitter restart
+                    async with asyncio.TaskGroup() as tg:
+                        for restart in restarts:
+                            tg.create_task(restart)
+                    # Pace crash loops: a bot that dies again right away
+                    # is restarted at most once per second
+                    await asyncio.sleep(1)
 
                 if not self.active_bots:
                     logger.error("No active bots remaining")
                     break
 
-                await asyncio.sleep(5)
-
         except Exception:
             logger.exception("Error in bot monitoring loop")
         finally:
@@ -327,8 +378,13 @@ class BotManager:
             except Exception:
                 logger.exception("Error shutting down Telegram bot")
 
-        if "Twitter" in self.active_bots:
-            logger.info("Twitter bot daemon thread will terminate with main process")
+        if self.twitter_bot:
+            logger.info("Stopping Twitter bot")
+            self.twitter_bot.stop()
+
+        # Workers check the stop flag between polling cycles; don't
+        # block shutdown waiting out a sleep
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
         logger.info("All bots shutdown completed")
 
@@ -343,7 +399,7 @@ async def async_start() -> None:
             logger.error("Failed to initialize AI provider")
             return
 
-        bot_manager.start_twitter_bot()
+        await bot_manager.start_twitter_bot()
         await bot_manager.start_telegram_bot()
 
         if bot_manager.active_bots:
@@ -374,6 +430,14 @@ async def async_start() -> None:
 
 def start_bot_manager() -> None:
     """Initialize and start all components of the application."""
+    try:
+        # uvloop speeds up the purely network-bound event loop when it
+        # is installed; everything runs the same without it
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     try:
         asyncio.run(async_start())
     except KeyboardInterrupt:
@@ -41,6 +41,9 @@ class Settings(BaseSettings):
 
     # Tweet generation on startup
     tweet_generation_on_startup: bool = False
+    # Topic for the startup tweet; when set, the interactive prompt is
+    # skipped (required for headless deployments)
+    startup_tweet_topic: str = ""
 
     # RapidAPI configuration for X/Twitter search (required for the TwitterBot)
     rapidapi_key: str = ""
@@ -21,6 +21,10 @@ ERR_API_TOKEN_NOT_PROVIDED = "Telegram API token not provided."
 ERR_BOT_NOT_INITIALIZED = "Bot not initialized."
 ERR_UPDATER_NOT_INITIALIZED = "Updater was not initialized"
 
+# Minimum seconds between streaming edits of the in-progress reply;
+# keeps the edit rate well under Telegram's per-chat limits
+STREAM_EDIT_INTERVAL = 0.5
+
 
 class TelegramBot:
     def __init__(
@@ -402,12 +406,35 @@ class TelegramBot:
 
         try:
             await context.bot.send_chat_action(chat_id=chat_id, action="typing")
-            ai_response = self.ai_provider.generate_content(var_text)
-            response_text = ai_response.text
 
             chat_id_key = int(chat_id) if isinstance(chat_id, str) else chat_id
             self.last_processed_time[chat_id_key] = time.time()
-            await update.message.reply_text(response_text)
+
+            # Stream the reply into one message: post a placeholder as
+            # soon as generation starts, then edit it with the text so
+            # far on a throttle, so the user sees the first tokens in
+            # well under a second instead of waiting out the full
+            # generation
+            placeholder = await update.message.reply_text("\u2026")
+            response_text = ""
+            sent_text = "\u2026"
+            last_edit = time.monotonic()
+            async for token in self.ai_provider.generate_content_stream(var_text):
+                response_text += token
+                now = time.monotonic()
+                if (
+                    response_text.strip()
+                    and response_text != sent_text
+                    and now - last_edit >= STREAM_EDIT_INTERVAL
+                ):
+                    try:
+                        await placeholder.edit_text(response_text)
+                        sent_text = response_text
+                    except TelegramError:
+                        logger.debug("Skipped streaming edit", chat_id=chat_id)
+                    last_edit = now
+            if response_text.strip() and response_text != sent_text:
+                await placeholder.edit_text(response_text)
             logger.info(
                 "Sent AI response",
                 chat_id=chat_id,
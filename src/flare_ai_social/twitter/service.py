@@ -51,6 +51,7 @@ class TwitterBot:
         config: TwitterConfig,
     ) -> None:
         self.ai_provider = ai_provider
+        self.running = True
 
         # Twitter API credentials
         self.bearer_token = config.bearer_token
@@ -464,40 +465,73 @@ class TwitterBot:
 
         return new_mentions
 
-    async def handle_mention(self, tweet: dict[str, Any]) -> None:
-        """Handle a mention by generating AI response and replying to it"""
-        tweet_id = tweet.get("id_str", "")
+    @staticmethod
+    def _clean_mention_text(tweet: dict[str, Any]) -> str:
+        """Strip @mentions from a tweet's text before handing it to the AI"""
+        clean_text = tweet.get("full_text", "")
+        for mention in tweet.get("entities", {}).get("user_mentions", []):
+            mention_text = f"@{mention.get('screen_name', '')}"
+            clean_text = clean_text.replace(mention_text, "").strip()
+        return clean_text
+
+    async def _post_ai_reply(self, tweet: dict[str, Any], response_text: str) -> None:
+        """Post an AI-generated reply to a tweet, truncated to fit"""
+        max_chars = 280
+        if len(response_text) > max_chars:
+            response_text = response_text[: max_chars - 3] + "..."
+        await self.post_reply(response_text, tweet.get("id_str", ""))
+
+    async def _post_fallback_reply(self, tweet: dict[str, Any]) -> None:
+        """Post the canned fallback reply when AI generation fails"""
         username = "user"
         for mention in tweet.get("entities", {}).get("user_mentions", []):
             if mention.get("id_str") == tweet.get("user_id_str"):
                 username = mention.get("screen_name", "user")
                 break
+        await self.post_reply(f"@{username} {FALLBACK_REPLY}", tweet.get("id_str", ""))
 
-        text = tweet.get("full_text", "")
-
+    async def handle_mention(self, tweet: dict[str, Any]) -> None:
+        """Handle a mention by generating AI response and replying to it"""
         try:
-            clean_text = text
-            for mention in tweet.get("entities", {}).get("user_mentions", []):
-                mention_text = f"@{mention.get('screen_name', '')}"
-                clean_text = clean_text.replace(mention_text, "").strip()
-
-            ai_response = self.ai_provider.generate_content(clean_text)
-            response_text = ai_response.text
+            ai_response = await self.ai_provider.agenerate_content(
+                self._clean_mention_text(tweet)
+            )
+            await self._post_ai_reply(tweet, ai_response.text)
+        except Exception:
+            logger.exception("Error generating AI response")
+            await self._post_fallback_reply(tweet)
 
-            max_chars = 280
-            if len(response_text) > max_chars:
-                response_text = response_text[: max_chars - 3] + "..."
+    async def handle_mentions(self, tweets: list[dict[str, Any]]) -> None:
+        """Handle a batch of mentions from one polling cycle.
 
-            await self.post_reply(response_text, tweet_id)
+        Responses for the whole batch are generated through the
+        provider's send_messages_batch, so one polling cycle with
+        several mentions pays roughly one model round-trip instead of
+        one per mention; replies are still posted in order.
+        """
+        if len(tweets) == 1:
+            await self.handle_mention(tweets[0])
+            return
+        try:
+            responses = await self.ai_provider.send_messages_batch(
+                [self._clean_mention_text(tweet) for tweet in tweets]
+            )
         except Exception:
-            logger.exception("Error generating AI response")
-            fallback_reply = f"@{username} {FALLBACK_REPLY}"
-            await self.post_reply(fallback_reply, tweet_id)
+            logger.exception("Batch AI generation failed, handling mentions serially")
+            for tweet in tweets:
+                await self.handle_mention(tweet)
+            return
+        for tweet, ai_response in zip(tweets, responses, strict=True):
+            try:
+                await self._post_ai_reply(tweet, ai_response.text)
+            except Exception:
+                logger.exception("Error posting AI reply")
+                await self._post_fallback_reply(tweet)
 
     async def monitor_mentions(self) -> None:
         """Main method to monitor mentions for all accounts"""
         async with aiohttp.ClientSession() as session:
-            while True:
+            while self.running:
                 try:
                     for account in self.accounts_to_monitor:
                         logger.debug("Searching for mentions of %s", account)
@@ -510,8 +544,7 @@ class TwitterBot:
                                 len(new_mentions),
                                 account,
                             )
-                            for tweet in new_mentions:
-                                await self.handle_mention(tweet)
+                            await self.handle_mentions(new_mentions)
                         else:
                             logger.debug("No new mentions found for %s", account)
 
@@ -567,6 +600,10 @@ class TwitterBot:
             logger.exception(f"Error generating or posting startup tweet: {str(e)}")
             return None
 
+    def stop(self) -> None:
+        """Signal the monitoring loop to exit after the current cycle."""
+        self.running = False
+
     def start(self) -> None:
         """Start the monitoring process"""
         logger.info("Starting Twitter monitoring bot")